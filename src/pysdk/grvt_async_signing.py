@@ -0,0 +1,177 @@
+"""
+Signing from coroutines without stalling the event loop.
+
+Signing a message takes from tens of microseconds to several milliseconds
+depending on the signer backend. Done inline, it holds up every WebSocket reader
+and callback on the loop for that time. `AsyncSigner` can instead hand the
+secp256k1 work to a dedicated thread or to the shared signing process pool,
+bounds the number of signatures in flight, and records how long signing kept
+the loop busy.
+
+Offloading to a thread does not free the loop entirely: eth_account signs in
+pure Python and holds the GIL while it does. `AsyncSigningMetrics` therefore
+reports both the time signing code ran on the loop and the loop lag measured
+by a heartbeat while signatures are in flight.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Literal
+
+from eth_account.messages import SignableMessage
+
+from .grvt_eip712 import get_EIP712_digest
+from .grvt_signer import SignatureRSV
+from .grvt_signing_context import SigningContext
+from .grvt_signing_pool import get_sign_digest_fn, get_signing_executor
+
+SigningExecutorMode = Literal["inline", "thread", "process"]
+
+DEFAULT_MAX_IN_FLIGHT = 64
+
+# Interval of the heartbeat measuring loop lag while signatures are in flight
+LOOP_HEARTBEAT_SECS = 0.001
+
+
+@dataclass
+class AsyncSigningMetrics:
+    signed: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    # Time signing code ran on the event loop: the whole signature when inline,
+    # only digest computation and submission when offloaded. A signing thread
+    # contending for the GIL is not counted, see max_loop_lag_secs
+    loop_signing_secs: float = 0.0
+    max_loop_signing_secs: float = 0.0
+    # Worst delay of a heartbeat run on the loop from the first signature until
+    # none is in flight, whatever held the loop up
+    max_loop_lag_secs: float = 0.0
+    # Time spent waiting for a free in-flight slot
+    queue_wait_secs: float = 0.0
+    # Time from submission to the executor until the signature is available
+    executor_secs: float = 0.0
+
+    @property
+    def mean_loop_signing_secs(self) -> float:
+        return self.loop_signing_secs / self.signed if self.signed else 0.0
+
+    def record_loop_signing(self, secs: float) -> None:
+        self.loop_signing_secs += secs
+        self.max_loop_signing_secs = max(self.max_loop_signing_secs, secs)
+
+    def record_loop_lag(self, secs: float) -> None:
+        self.max_loop_lag_secs = max(self.max_loop_lag_secs, secs)
+
+
+class AsyncSigner:
+    """
+    Signs EIP-712 messages for coroutines with a `SigningContext`.
+
+    `executor` selects where signatures are computed:
+    - "inline": on the event loop, as plain `SigningContext.sign_message`.
+    - "thread": on a dedicated signing thread owned by this signer.
+    - "process": on the shared pool of `grvt_signing_pool`.
+    - any `concurrent.futures.Executor`.
+
+    At most `max_in_flight` signatures are submitted at once; further callers
+    wait for a slot, so order bursts queue instead of flooding the executor.
+    """
+
+    def __init__(
+        self,
+        signing_context: SigningContext,
+        executor: SigningExecutorMode | Executor = "inline",
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ):
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be positive, got {max_in_flight}")
+        self.signing_context = signing_context
+        self.max_in_flight = max_in_flight
+        self.metrics = AsyncSigningMetrics()
+        self._owned_executor: Executor | None = None
+        self._executor: Executor | None
+        if executor == "inline":
+            self._executor = None
+        elif executor == "thread":
+            self._owned_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="grvt-signing"
+            )
+            self._executor = self._owned_executor
+        elif executor == "process":
+            self._executor = get_signing_executor(
+                signing_context.private_key,
+                signer_backend=signing_context.signer_backend,
+            )
+        elif isinstance(executor, Executor):
+            self._executor = executor
+        else:
+            raise ValueError(f"Unknown signing executor {executor!r}")
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._heartbeat: asyncio.Task | None = None
+
+    def _get_sign_digest_fn(self):
+        context = self.signing_context
+        if isinstance(self._executor, ThreadPoolExecutor):
+            # Threads share the parsed key of the context
+            return context.signer.sign_digest
+        return get_sign_digest_fn(
+            self._executor, context.private_key, context.signer_backend
+        )
+
+    async def _run_heartbeat(self, start: float) -> None:
+        # The first beat is due as soon as the loop is free, the next ones after
+        # LOOP_HEARTBEAT_SECS, for as long as signatures are in flight
+        metrics = self.metrics
+        interval = 0.0
+        while True:
+            await asyncio.sleep(interval)
+            metrics.record_loop_lag(time.perf_counter() - start - interval)
+            if not metrics.in_flight:
+                return
+            interval = LOOP_HEARTBEAT_SECS
+            start = time.perf_counter()
+
+    def _start_heartbeat(self) -> None:
+        if self._heartbeat is None or self._heartbeat.done():
+            self._heartbeat = asyncio.ensure_future(
+                self._run_heartbeat(time.perf_counter())
+            )
+
+    async def sign(self, signable_message: SignableMessage) -> SignatureRSV:
+        metrics = self.metrics
+        self._start_heartbeat()
+        if self._executor is None:
+            start = time.perf_counter()
+            signature = self.signing_context.sign_message(signable_message)
+            metrics.record_loop_signing(time.perf_counter() - start)
+            metrics.signed += 1
+            return signature
+
+        wait_start = time.perf_counter()
+        async with self._semaphore:
+            start = time.perf_counter()
+            metrics.queue_wait_secs += start - wait_start
+            metrics.in_flight += 1
+            metrics.peak_in_flight = max(metrics.peak_in_flight, metrics.in_flight)
+            try:
+                future = asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    self._get_sign_digest_fn(),
+                    get_EIP712_digest(signable_message),
+                )
+                submitted = time.perf_counter()
+                metrics.record_loop_signing(submitted - start)
+                signature = await future
+                metrics.executor_secs += time.perf_counter() - submitted
+            finally:
+                metrics.in_flight -= 1
+        metrics.signed += 1
+        return signature
+
+    def close(self) -> None:
+        """Shut down the signing thread, if this signer owns one."""
+        if self._owned_executor is not None:
+            self._owned_executor.shutdown(wait=False)
+            self._owned_executor = None
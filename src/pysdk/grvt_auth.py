@@ -0,0 +1,255 @@
+"""
+Session cookie refresh shared by the raw and ccxt clients.
+
+Authenticated calls check the cookie before every request and log in again when
+it is about to expire. `AsyncSingleFlight` makes concurrent callers share one
+login instead of each sending its own, and `AsyncCookieRefresher` renews the
+cookie in the background well before that, so requests do not wait for a login.
+`SyncAuthManager` does the same for the sync clients, which may be shared by
+several threads.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
+
+# A cookie this close to expiring is refreshed before sending a request
+COOKIE_EXPIRY_MARGIN_SECS = 5
+# The background refresher renews the cookie this long before it expires
+DEFAULT_COOKIE_REFRESH_AHEAD_SECS = 60.0
+# Delay before the background refresher retries a failed login
+COOKIE_REFRESH_RETRY_SECS = 5.0
+
+
+def get_refresh_delay_secs(
+    expiry: float | None, refresh_ahead_secs: float, now: float | None = None
+) -> float:
+    """
+    Seconds until a cookie expiring at unix time `expiry` should be renewed.
+
+    That is `refresh_ahead_secs` before it expires, or half way through its
+    remaining lifetime if that is shorter; 0 if there is no usable cookie.
+    """
+    remaining = expiry - (now or time.time()) if expiry is not None else 0
+    if remaining <= COOKIE_EXPIRY_MARGIN_SECS:
+        return 0
+    return max(remaining - refresh_ahead_secs, remaining / 2)
+
+
+class RequestAuth(NamedTuple):
+    """
+    Cookies and headers sent with every request of a sync client.
+
+    Replaced as a whole on login, so a request never mixes a new cookie with an
+    old account id.
+    """
+
+    cookies: dict[str, str]
+    headers: dict[str, str]
+
+
+NO_REQUEST_AUTH = RequestAuth(cookies={}, headers={})
+
+
+class AsyncSingleFlight:
+    """
+    Runs at most one call at a time.
+
+    Callers arriving while it runs await its result instead of starting another.
+    The shared call is shielded, so one cancelled caller does not cancel it for
+    the others.
+    """
+
+    def __init__(self) -> None:
+        self._task: asyncio.Task | None = None
+
+    @property
+    def in_flight(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def run(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(call())
+        return await asyncio.shield(self._task)
+
+
+class AsyncCookieRefresher:
+    """
+    Background task renewing the cookie before it expires.
+
+    The cookie is renewed `refresh_ahead_secs` before it expires, or half way
+    through its remaining lifetime if that is shorter.
+
+    `refresh` must log in unconditionally; `get_expiry` returns the unix time at
+    which the current cookie expires, None if there is none. Call `ensure_started`
+    after a successful login, with the event loop running.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[], Awaitable[object]],
+        get_expiry: Callable[[], float | None],
+        refresh_ahead_secs: float = DEFAULT_COOKIE_REFRESH_AHEAD_SECS,
+        logger: logging.Logger | None = None,
+    ):
+        self.refresh_ahead_secs = refresh_ahead_secs
+        self._refresh = refresh
+        self._get_expiry = get_expiry
+        self._logger = logger or logging.getLogger(__name__)
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def ensure_started(self) -> None:
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def get_delay_secs(self, now: float | None = None) -> float:
+        """Seconds until the current cookie should be renewed; 0 if it is unusable."""
+        return get_refresh_delay_secs(self._get_expiry(), self.refresh_ahead_secs, now)
+
+    async def _run(self) -> None:
+        while True:
+            expiry = self._get_expiry()
+            delay_secs = self.get_delay_secs()
+            if delay_secs:
+                self._logger.debug(f"AsyncCookieRefresher refresh in {delay_secs:.1f}s")
+                await asyncio.sleep(delay_secs)
+                if self._get_expiry() != expiry:
+                    # Renewed meanwhile by a request
+                    continue
+            try:
+                await self._refresh()
+            except Exception as err:
+                self._logger.warning(f"AsyncCookieRefresher refresh failed: {err!r}")
+            if self._get_expiry() == expiry:
+                await asyncio.sleep(COOKIE_REFRESH_RETRY_SECS)
+
+
+class SyncCookieRefresher:
+    """
+    Daemon thread renewing the cookie of a sync client.
+
+    It follows the same schedule as `AsyncCookieRefresher`. `refresh` must log in
+    unconditionally.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[], object],
+        get_expiry: Callable[[], float | None],
+        refresh_ahead_secs: float = DEFAULT_COOKIE_REFRESH_AHEAD_SECS,
+        logger: logging.Logger | None = None,
+    ):
+        self.refresh_ahead_secs = refresh_ahead_secs
+        self._refresh = refresh
+        self._get_expiry = get_expiry
+        self._logger = logger or logging.getLogger(__name__)
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def ensure_started(self) -> None:
+        with self._lock:
+            if self.running:
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="grvt-cookie-refresher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopped.set()
+            thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def get_delay_secs(self, now: float | None = None) -> float:
+        """Seconds until the current cookie should be renewed; 0 if it is unusable."""
+        return get_refresh_delay_secs(self._get_expiry(), self.refresh_ahead_secs, now)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            expiry = self._get_expiry()
+            delay_secs = self.get_delay_secs()
+            if delay_secs:
+                self._logger.debug(f"SyncCookieRefresher refresh in {delay_secs:.1f}s")
+                if self._stopped.wait(delay_secs):
+                    return
+                if self._get_expiry() != expiry:
+                    # Renewed meanwhile by a request
+                    continue
+            try:
+                self._refresh()
+            except Exception as err:
+                self._logger.warning(f"SyncCookieRefresher refresh failed: {err!r}")
+            if self._get_expiry() == expiry:
+                self._stopped.wait(COOKIE_REFRESH_RETRY_SECS)
+
+
+class SyncAuthManager:
+    """
+    Serializes the logins of a sync client shared by several threads.
+
+    `should_refresh` tells whether the cookie is about to expire and `login`
+    replaces it. Threads finding the cookie expiring wait on a lock and check
+    again once they hold it, so only the first one logs in. After a successful
+    login a `SyncCookieRefresher` keeps the cookie fresh, unless
+    `refresh_ahead_secs` is None.
+    """
+
+    def __init__(
+        self,
+        should_refresh: Callable[[], bool],
+        login: Callable[[], object],
+        get_expiry: Callable[[], float | None],
+        refresh_ahead_secs: float | None = DEFAULT_COOKIE_REFRESH_AHEAD_SECS,
+        logger: logging.Logger | None = None,
+    ):
+        self._should_refresh = should_refresh
+        self._login = login
+        self._get_expiry = get_expiry
+        self._lock = threading.Lock()
+        self.refresher: SyncCookieRefresher | None = None
+        if refresh_ahead_secs is not None:
+            self.refresher = SyncCookieRefresher(
+                lambda: self.refresh(force=True), get_expiry, refresh_ahead_secs, logger
+            )
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Log in if the cookie is about to expire, or always if force is True.
+
+        Returns whether this call logged in.
+        """
+        if not force and not self._should_refresh():
+            return False
+        with self._lock:
+            # Another thread may have logged in while this one waited
+            if not force and not self._should_refresh():
+                return False
+            self._login()
+        if self.refresher and self._get_expiry() is not None:
+            self.refresher.ensure_started()
+        return True
+
+    def stop(self) -> None:
+        """Stop the background refresh."""
+        if self.refresher:
+            self.refresher.stop()
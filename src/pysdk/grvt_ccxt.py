@@ -5,12 +5,19 @@
 # ruff: noqa: W291
 # ruff: noqa: D400
 # ruff: noqa: E501
-import json
 import logging
+import time
+from collections.abc import Iterator
 from typing import Any, Literal
 
 import requests
 
+from .grvt_auth import (
+    DEFAULT_COOKIE_REFRESH_AHEAD_SECS,
+    NO_REQUEST_AUTH,
+    RequestAuth,
+    SyncAuthManager,
+)
 from .grvt_ccxt_base import GrvtCcxtBase
 from .grvt_ccxt_env import GrvtEnv, get_grvt_endpoint
 from .grvt_ccxt_types import (
@@ -22,12 +29,15 @@ from .grvt_ccxt_types import (
     Num,
 )
 from .grvt_ccxt_utils import (
-    EnumEncoder,
     GrvtOrder,
     get_cookie_with_expiration,
     get_grvt_order,
     get_order_payload,
 )
+from .grvt_history import DEFAULT_MAX_BUFFERED_ITEMS, iter_items
+from .grvt_json import json_dumps, json_loads
+from .grvt_transport import create_requests_session, get_requests_timeout
+from .grvt_warmup import SyncKeepAlive, warm_up_sync
 
 
 class GrvtCcxt(GrvtCcxtBase):
@@ -37,7 +47,12 @@ class GrvtCcxt(GrvtCcxtBase):
     Args:
         env: GrvtEnv (DEV, TESTNET, PROD)
         logger: logging.Logger
-        parameters: dict with trading_account_id, private_key, api_key etc
+        parameters: dict with trading_account_id, private_key, api_key etc<br>
+            Optional cookie_refresh_ahead_secs renews the session cookie on a background
+            thread this many seconds before it expires (default 60); None renews it only
+            when a request finds it expiring.
+
+    An instance, and its connection pool, can be shared by several threads.
 
     Examples:
         >>> from grvt_api import GrvtCcxt
@@ -56,30 +71,78 @@ class GrvtCcxt(GrvtCcxtBase):
         """Initialize the GrvtCcxt instance."""
         super().__init__(env, logger, parameters, order_book_ccxt_format)
         self._clsname: str = type(self).__name__
-        self._session: requests.Session = requests.Session()
-        self._session.headers.update({"Content-Type": "application/json"})
+        self._session: requests.Session = create_requests_session(self._transport)
+        self._timeout = get_requests_timeout(self._transport)
+        self._keep_alive: SyncKeepAlive | None = None
+        # Sent with each request instead of stored in the shared session
+        self._request_auth: RequestAuth = NO_REQUEST_AUTH
+        self._auth = SyncAuthManager(
+            self.should_refresh_cookie,
+            self._login,
+            self._get_cookie_expiry,
+            parameters.get("cookie_refresh_ahead_secs", DEFAULT_COOKIE_REFRESH_AHEAD_SECS),
+            self.logger,
+        )
         self.refresh_cookie()
         # Assign markets here
         self.markets: dict[str, dict] = self.load_markets()
 
-    def refresh_cookie(self) -> dict | None:
-        """Refresh the session cookie."""
-        if not self.should_refresh_cookie():
-            return self._cookie
-        path = get_grvt_endpoint(self.env, "AUTH")
-        self._cookie = get_cookie_with_expiration(path, self._api_key)
-        self._path_return_value_map[path] = self._cookie
-        if self._cookie:
-            self._session.cookies.update({"gravity": self._cookie["gravity"]})
-            if self._cookie["X-Grvt-Account-Id"]:
-                self._session.headers.update(
-                    {"X-Grvt-Account-Id": self._cookie["X-Grvt-Account-Id"]}
+    def close(self) -> None:
+        """Stop the background cookie refresh and keep-alive, and close the session."""
+        self._auth.stop()
+        if self._keep_alive:
+            self._keep_alive.stop()
+        self._session.close()
+
+    def warm_up_connections(self) -> int:
+        """
+        Open warm_up_connections_per_host pooled connections (see the transport
+        parameter) to each of the edge, trade-data and market-data hosts, so that
+        the first requests do not pay for DNS, TCP and TLS setup. Then keeps them
+        open with probes while idle, if keep_alive_probe_secs is set.<br>
+        Returns the number of successful probes.
+        """
+        urls = self._get_warm_up_urls()
+        per_host = self._transport.warm_up_connections_per_host
+        opened = warm_up_sync(self._session, urls, per_host, self._timeout, self.logger)
+        self._latency.mark_warm()
+        if self._transport.keep_alive_probe_secs is not None:
+            if self._keep_alive is None:
+                self._keep_alive = SyncKeepAlive(
+                    self._session,
+                    urls,
+                    per_host,
+                    self._transport.keep_alive_probe_secs,
+                    self._timeout,
+                    self._latency,
+                    self.logger,
                 )
-            self.logger.info(
-                f"refresh_cookie {self._cookie=} {self._session.cookies=} {self._session.headers=}"
-            )
+            self._keep_alive.ensure_started()
+        return opened
+
+    def refresh_cookie(self, force: bool = False) -> dict | None:
+        """
+        Refresh the session cookie if it is about to expire, or always if force is True.
+        Thread-safe: concurrent callers wait for one login.
+        """
+        self._auth.refresh(force)
         return self._cookie
 
+    def _login(self) -> None:
+        path = get_grvt_endpoint(self.env, "AUTH")
+        cookie = self._load_cached_cookie()
+        if not cookie:
+            cookie = get_cookie_with_expiration(path, self._api_key)
+            self._store_cached_cookie(cookie)
+        self._path_return_value_map[path] = cookie
+        if cookie:
+            headers = {}
+            if cookie["X-Grvt-Account-Id"]:
+                headers["X-Grvt-Account-Id"] = str(cookie["X-Grvt-Account-Id"])
+            self._request_auth = RequestAuth({"gravity": str(cookie["gravity"])}, headers)
+            self.logger.info(f"refresh_cookie {cookie=} {self._request_auth=}")
+        self._cookie = cookie
+
     # PRIVATE API CALLS
     def _auth_and_post(self, path: str, payload: dict) -> dict:
         FN = f"_auth_and_post {path=}"
@@ -90,23 +153,32 @@ class GrvtCcxt(GrvtCcxtBase):
             raise GrvtInvalidOrder(f"{FN} Invalid path {path=} {payload=}")
         # Always see if need to referesh cookie before sending a request
         self.refresh_cookie()
-        payload_json = json.dumps(payload, cls=EnumEncoder)
+        payload_json = json_dumps(payload)
         self.logger.info(f"{FN} {payload=}\n{payload_json=}")
-        return_value = self._session.post(path, data=payload_json, timeout=5)
-        return_text: str = ""
+        auth = self._request_auth
+        start = time.perf_counter()
+        return_value = self._session.post(
+            path,
+            data=payload_json,
+            cookies=auth.cookies,
+            headers=auth.headers,
+            timeout=self._timeout,
+        )
+        self._latency.record(time.perf_counter() - start)
+        # Parse the body bytes once, without decoding them to a str first
+        return_body: bytes = return_value.content
         try:
-            return_text = return_value.text
-            response = return_value.json()
+            response = json_loads(return_body)
         except Exception as err:
             self.logger.warning(f"{FN} Unable to parse {return_value=} as json. {err=}")
         if not return_value.ok:
             self.logger.warning(f"{FN} ERROR {payload_json=}\n{return_value=}\n{response=}")
-        else:
-            if len(return_text) > MAX_LEN_TO_LOG:
+        elif len(return_body) > MAX_LEN_TO_LOG:
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(f"{FN} OK {return_value=} {response=}")
-                self.logger.info(f"{FN} OK {return_value=} response=**TOO LONG**")
-            else:
-                self.logger.info(f"{FN} OK {return_value=} {response=}")
+            self.logger.info(f"{FN} OK {return_value=} response=**TOO LONG**")
+        else:
+            self.logger.info(f"{FN} OK {return_value=} {response=}")
         self._path_return_value_map[path] = response
         return response
 
@@ -122,6 +194,8 @@ class GrvtCcxt(GrvtCcxtBase):
             private_key=self._private_key,
             env=self.env,
             instruments=self.markets,
+            signing_context=self.get_signing_context(),
+            signature_cache=self._signature_cache,
         )
         path = get_grvt_endpoint(self.env, "CREATE_ORDER")
         self.logger.info(f"{FN} {path=} {order_payload=}")
@@ -129,6 +203,8 @@ class GrvtCcxt(GrvtCcxtBase):
         if response.get("result") is None:
             self.logger.error(f"{FN} Error: {response}")
             return {}
+        # Acknowledged: a retry of this order would need a new nonce anyway
+        self._evict_cached_signature(order_payload["order"])
         self.logger.info(
             f"{FN} Order created:"
             f"{response.get('result', {}).get('metadata', {}).get('client_order_id')}"
@@ -524,6 +600,81 @@ class GrvtCcxt(GrvtCcxtBase):
             response["result"] = trades
         return response
 
+    def iter_my_trades(
+        self,
+        symbol: str | None = None,
+        since: int | None = None,
+        limit: int | None = None,
+        params: dict = {},
+        stop_time: int | None = None,
+        max_buffered_items: int | None = DEFAULT_MAX_BUFFERED_ITEMS,
+    ) -> Iterator[dict]:
+        """
+        HISTORICAL data.<br>
+        Iterate over the trades of every page of fetch_my_trades(), newest first,
+        with the next page fetched while the current one is processed.<br>
+        See grvt_history for `stop_time` and `max_buffered_items`.<br>
+
+        Args:
+            symbol, since, limit, params: as for fetch_my_trades().<br>
+            stop_time: stop at the first trade older than this time in nanoseconds.<br>
+            max_buffered_items: fetch the next page ahead only when both pages fit in
+                this many trades.<br>
+        """
+        # Pages are filtered here: a page without trades of `symbol` is not the last one
+        trades = iter_items(
+            lambda cursor: self.fetch_my_trades(
+                None, since, limit, {**params, "cursor": cursor}
+            ),
+            stop_time,
+            ("event_time",),
+            max_buffered_items,
+        )
+        if not symbol:
+            return trades
+        return (t for t in trades if t.get("instrument") == symbol)
+
+    def iter_order_history(
+        self,
+        params: dict = {},
+        stop_time: int | None = None,
+        max_buffered_items: int | None = DEFAULT_MAX_BUFFERED_ITEMS,
+    ) -> Iterator[dict]:
+        """
+        HISTORICAL data.<br>
+        Iterate over the orders of every page of fetch_order_history(), newest first,
+        with the next page fetched while the current one is processed.<br>
+        See iter_my_trades() for `stop_time` and `max_buffered_items`.<br>
+        """
+        return iter_items(
+            lambda cursor: self.fetch_order_history({**params, "cursor": cursor}),
+            stop_time,
+            ("metadata", "create_time"),
+            max_buffered_items,
+        )
+
+    def iter_account_history(
+        self,
+        params: dict = {},
+        limit: int = 500,
+        stop_time: int | None = None,
+        max_buffered_items: int | None = DEFAULT_MAX_BUFFERED_ITEMS,
+    ) -> Iterator[dict]:
+        """
+        HISTORICAL data.<br>
+        Iterate over the snapshots of every page of fetch_account_history(), newest
+        first, with the next page fetched while the current one is processed.<br>
+        See iter_my_trades() for `stop_time` and `max_buffered_items`.<br>
+        """
+        return iter_items(
+            lambda cursor: self.fetch_account_history(
+                {**params, "cursor": cursor}, limit
+            ),
+            stop_time,
+            ("event_time",),
+            max_buffered_items,
+        )
+
     # **************** PUBLIC API CALLS
     def load_markets(self) -> dict[str, dict]:
         self.logger.info("load_markets START")
@@ -709,6 +860,30 @@ class GrvtCcxt(GrvtCcxtBase):
         response: dict = self._auth_and_post(path, payload=payload)
         return response
 
+    def iter_trades(
+        self,
+        symbol: str,
+        since: int | None = None,
+        limit: int = 1_000,
+        params: dict = {},
+        stop_time: int | None = None,
+        max_buffered_items: int | None = DEFAULT_MAX_BUFFERED_ITEMS,
+    ) -> Iterator[dict]:
+        """
+        HISTORICAL data.<br>
+        Iterate over the trades of every page of fetch_trades(), newest first,
+        with the next page fetched while the current one is processed.<br>
+        See iter_my_trades() for `stop_time` and `max_buffered_items`.<br>
+        """
+        return iter_items(
+            lambda cursor: self.fetch_trades(
+                symbol, since, limit, {**params, "cursor": cursor}
+            ),
+            stop_time,
+            ("event_time",),
+            max_buffered_items,
+        )
+
     def fetch_funding_rate_history(
         self,
         symbol: str,
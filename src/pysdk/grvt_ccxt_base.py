@@ -12,7 +12,8 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any, get_args
 
-from .grvt_ccxt_env import GrvtEnv
+from .grvt_auth import COOKIE_EXPIRY_MARGIN_SECS
+from .grvt_ccxt_env import CHAIN_IDS, GrvtEnv, get_grvt_endpoint_domains
 from .grvt_ccxt_types import (
     CandlestickInterval,
     CandlestickType,
@@ -23,6 +24,12 @@ from .grvt_ccxt_types import (
     ccxt_interval_to_grvt_candlestick_interval,
 )
 from .grvt_ccxt_utils import get_kuq_from_symbol, sign_derisk_mm_ratio_request
+from .grvt_cookie_cache import CookieCache
+from .grvt_signature_cache import DEFAULT_SIGNATURE_CACHE_SIZE, SignatureCache
+from .grvt_signer import SignerBackend
+from .grvt_signing_context import SigningContext
+from .grvt_transport import DEFAULT_TRANSPORT_CONFIG, TransportConfig
+from .grvt_warmup import LatencyRecorder
 
 # COOKIE_REFRESH_INTERVAL_SECS = 60 * 60  # 30 minutes
 
@@ -36,7 +43,15 @@ class GrvtCcxtBase:
         env: GrvtCcxtBase (DEV, TESTNET, PROD)
         logger (logging.Logger, optional). Defaults to None.
         parameters: (dict, optional). Dict with trading_account_id, private_key, api_key etc
-                defaults to empty.
+                defaults to empty. Optional signer_backend selects the secp256k1 backend
+                ("eth_account" or "secp256k1"), defaults to "eth_account".
+                Optional signature_cache_size bounds the signatures kept for order
+                retries, defaults to 1024; 0 disables the cache.
+                Optional cookie_cache_dir is a directory where session cookies are
+                shared by the processes using this API key (see
+                grvt_cookie_cache.DEFAULT_COOKIE_CACHE_DIR), defaults to None: no cache.
+                Optional transport is a grvt_transport.TransportConfig with the connection
+                pooling, keep-alive and timeouts of the Rest API session.
     """
 
     def __init__(
@@ -53,10 +68,28 @@ class GrvtCcxtBase:
         self._trading_account_id: str | None = parameters.get("trading_account_id")
         self._private_key: str = str(parameters.get("private_key", ""))
         self._api_key: str = str(parameters.get("api_key", ""))
+        self._signer_backend = SignerBackend(
+            parameters.get("signer_backend", SignerBackend.ETH_ACCOUNT)
+        )
         self._order_book_ccxt_format: bool = order_book_ccxt_format
+        self._transport: TransportConfig = parameters.get(
+            "transport", DEFAULT_TRANSPORT_CONFIG
+        )
+        self._latency = LatencyRecorder()
 
         self._path_return_value_map: dict = {}
         self._cookie: dict | None = None
+        cookie_cache_dir: str | None = parameters.get("cookie_cache_dir")
+        self._cookie_cache: CookieCache | None = (
+            CookieCache(cookie_cache_dir, self.logger) if cookie_cache_dir else None
+        )
+        self._signing_context: SigningContext | None = None
+        signature_cache_size: int = parameters.get(
+            "signature_cache_size", DEFAULT_SIGNATURE_CACHE_SIZE
+        )
+        self._signature_cache: SignatureCache | None = (
+            SignatureCache(signature_cache_size) if signature_cache_size else None
+        )
         self.markets: dict = {}
         self._clsname: str = type(self).__name__
         self.logger.info(f"GrvtCcxtBase: {self.env=}, {self._trading_account_id=}")
@@ -93,10 +126,56 @@ class GrvtCcxtBase:
         """Returns the trading account id."""
         return self._trading_account_id or ""
 
+    def get_signing_context(self) -> SigningContext:
+        """
+        Returns the signing context for the private key, parsing the key on first use.
+        """
+        if self._signing_context is None:
+            if not self._private_key:
+                raise GrvtInvalidOrder(f"{self._clsname}: this action requires a private_key")
+            self._signing_context = SigningContext.from_key(
+                self._private_key, CHAIN_IDS[self.env.value], self._signer_backend
+            )
+        return self._signing_context
+
+    def get_signature_cache(self) -> SignatureCache | None:
+        """Returns the cache of order signatures reused on retries, None if disabled."""
+        return self._signature_cache
+
+    def _evict_cached_signature(self, order: dict) -> None:
+        """
+        Drops the cached signature of an order acknowledged by the exchange.
+
+        `order` is a create_order payload or result.
+        """
+        if self._signature_cache is None:
+            return
+        signature = order.get("signature")
+        if isinstance(signature, dict) and "nonce" in signature and "expiration" in signature:
+            self._signature_cache.evict(signature["nonce"], signature["expiration"])
+
     def is_order_book_ccxt_format(self) -> bool:
         """Returns True if order book should be returned in CCXT format."""
         return self._order_book_ccxt_format
 
+    def _get_cookie_expiry(self) -> float | None:
+        return self._cookie.get("expires") if self._cookie else None
+
+    def _load_cached_cookie(self) -> dict | None:
+        """Returns a cookie cached by another client, if it outlives the current one."""
+        if not self._cookie_cache or not self._api_key:
+            return None
+        cookie = self._cookie_cache.load(
+            self.env.value, self._api_key, self._get_cookie_expiry()
+        )
+        if cookie:
+            self.logger.info(f"using cached cookie expiring at {cookie['expires']}")
+        return cookie
+
+    def _store_cached_cookie(self, cookie: dict | None) -> None:
+        if self._cookie_cache and cookie:
+            self._cookie_cache.store(self.env.value, self._api_key, cookie)
+
     def should_refresh_cookie(self) -> bool:
         """
         Retuns:
@@ -108,7 +187,10 @@ class GrvtCcxtBase:
         time_till_expiration = None
         if self._cookie and "expires" in self._cookie:
             time_till_expiration = self._cookie["expires"] - time.time()
-        is_cookie_fresh = time_till_expiration is not None and time_till_expiration > 5
+        is_cookie_fresh = (
+            time_till_expiration is not None
+            and time_till_expiration > COOKIE_EXPIRY_MARGIN_SECS
+        )
         if not is_cookie_fresh:
             self.logger.info(
                 f"cookie should be refreshed {self._cookie=} now={time.time()}"
@@ -116,6 +198,16 @@ class GrvtCcxtBase:
             )
         return not is_cookie_fresh
 
+    def get_latency_histograms(self) -> dict[str, dict]:
+        """
+        Returns histograms of Rest API request latencies before and after
+        warm_up_connections(), see grvt_warmup.LatencyHistogram.to_dict().
+        """
+        return self._latency.to_dict()
+
+    def _get_warm_up_urls(self) -> list[str]:
+        return list(get_grvt_endpoint_domains(self.env.value).values())
+
     def get_path_return_value_map(self) -> dict:
         """Returns the path return value map."""
         return self._path_return_value_map
@@ -523,7 +615,11 @@ class GrvtCcxtBase:
             "ratio": str(ratio),
         }
         signature: dict = sign_derisk_mm_ratio_request(
-            self.env, int(self.get_trading_account_id()), str(ratio), self._private_key
+            self.env,
+            int(self.get_trading_account_id()),
+            str(ratio),
+            self._private_key,
+            signing_context=self.get_signing_context(),
         )
         payload["signature"] = signature
         return payload
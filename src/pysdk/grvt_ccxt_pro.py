@@ -7,12 +7,17 @@
 # ruff: noqa: E501
 
 import asyncio
-import json
 import logging
-from typing import Literal
-
-import aiohttp
+import time
+from collections.abc import AsyncIterator
+from typing import Literal, TypeVar
 
+from .grvt_async_signing import DEFAULT_MAX_IN_FLIGHT, AsyncSigner, AsyncSigningMetrics
+from .grvt_auth import (
+    DEFAULT_COOKIE_REFRESH_AHEAD_SECS,
+    AsyncCookieRefresher,
+    AsyncSingleFlight,
+)
 from .grvt_ccxt_base import GrvtCcxtBase
 
 # import requests
@@ -27,13 +32,18 @@ from .grvt_ccxt_types import (
     Num,
 )
 from .grvt_ccxt_utils import (
-    EnumEncoder,
     GrvtOrder,
     get_cookie_with_expiration,
     get_cookie_with_expiration_async,
     get_grvt_order,
-    get_order_payload,
+    get_order_payload_async,
 )
+from .grvt_history import DEFAULT_MAX_BUFFERED_ITEMS, aiter_items
+from .grvt_json import json_dumps, json_loads
+from .grvt_transport import create_aiohttp_session
+from .grvt_warmup import AsyncKeepAlive, warm_up_async
+
+T = TypeVar("T", bound="GrvtCcxtPro")
 
 
 class GrvtCcxtPro(GrvtCcxtBase):
@@ -42,13 +52,26 @@ class GrvtCcxtPro(GrvtCcxtBase):
 
     Args:
         env: GrvtCcxtPro (DEV, TESTNET, PROD)
-        parameters: dict with trading_account_id, private_key, api_key etc
+        parameters: dict with trading_account_id, private_key, api_key etc<br>
+            Optional signing_executor selects where orders are signed: "inline" (default,
+            on the event loop), "thread" (dedicated signing thread) or "process"
+            (shared signing process pool).<br>
+            Optional signing_max_in_flight bounds concurrent signatures (default 64).<br>
+            Optional cookie_refresh_ahead_secs renews the session cookie in the background
+            this many seconds before it expires (default 60); None renews it only when a
+            request finds it expiring.
+        login_on_init: log in with a blocking request while constructing (default).
+            Use `create()` instead inside a running event loop.
 
     Examples:
         >>> from grvt_api_pro import GrvtCcxtPro
         >>> from grvt_env import GrvtEnv
         >>> grvt = GrvtCcxtPro(env=GrvtEnv.TESTNET)
         >>> await grvt.fetch_markets()
+
+        Without blocking the event loop, closing the session on exit:
+        >>> async with await GrvtCcxtPro.create(GrvtEnv.TESTNET, parameters=params) as grvt:
+        >>>     await grvt.fetch_balance()
     """
 
     def __init__(
@@ -57,21 +80,126 @@ class GrvtCcxtPro(GrvtCcxtBase):
         logger: logging.Logger | None = None,
         parameters: dict = {},
         order_book_ccxt_format: bool = False,
+        login_on_init: bool = True,
     ):
         """Initialize the GrvtCcxt instance."""
         super().__init__(env, logger, parameters, order_book_ccxt_format)
         self._clsname: str = type(self).__name__
-        self._session = aiohttp.ClientSession(headers={"Content-Type": "application/json"})
-        # Force sync call to get cookie here
-        self._cookie = get_cookie_with_expiration(
-            get_grvt_endpoint(self.env, "AUTH"), self._api_key
+        self._started = False
+        self._session = create_aiohttp_session(self._transport)
+        self._signing_executor = parameters.get("signing_executor", "inline")
+        self._signing_max_in_flight: int = parameters.get(
+            "signing_max_in_flight", DEFAULT_MAX_IN_FLIGHT
         )
-        self.update_session_with_cookie()
+        self._async_signer: AsyncSigner | None = None
+        self._keep_alive: AsyncKeepAlive | None = None
+        self._login_flight = AsyncSingleFlight()
+        self._cookie_refresher: AsyncCookieRefresher | None = None
+        refresh_ahead_secs: float | None = parameters.get(
+            "cookie_refresh_ahead_secs", DEFAULT_COOKIE_REFRESH_AHEAD_SECS
+        )
+        if refresh_ahead_secs is not None:
+            self._cookie_refresher = AsyncCookieRefresher(
+                lambda: self.refresh_cookie(force=True),
+                self._get_cookie_expiry,
+                refresh_ahead_secs,
+                self.logger,
+            )
+        if login_on_init:
+            # Force sync call to get cookie here
+            self._cookie = self._load_cached_cookie()
+            if not self._cookie:
+                self._cookie = get_cookie_with_expiration(
+                    get_grvt_endpoint(self.env, "AUTH"), self._api_key
+                )
+                self._store_cached_cookie(self._cookie)
+            self.update_session_with_cookie()
+
+    @classmethod
+    async def create(
+        cls: type[T],
+        env: GrvtEnv,
+        logger: logging.Logger | None = None,
+        parameters: dict = {},
+        order_book_ccxt_format: bool = False,
+    ) -> T:
+        """
+        Create an instance without blocking the event loop: logs in, loads markets
+        and opens the connections used for trading concurrently.<br>
+        Close it with `close()`, or use it with `async with`.
+        """
+        api = cls(env, logger, parameters, order_book_ccxt_format, login_on_init=False)
+        await api.start()
+        return api
+
+    async def start(self) -> None:
+        """Log in, load markets and warm up connections, once."""
+        if self._started:
+            return
+        try:
+            await asyncio.gather(
+                self.refresh_cookie(), self.load_markets(), self.warm_up_connections()
+            )
+        except BaseException:
+            await self.close()
+            raise
+        self._started = True
+
+    async def warm_up_connections(self) -> int:
+        """
+        Open warm_up_connections_per_host pooled connections (see the transport
+        parameter) to each of the edge, trade-data and market-data hosts, so that
+        the first requests do not pay for DNS, TCP and TLS setup. Then keeps them
+        open with probes while idle, if keep_alive_probe_secs is set.<br>
+        Returns the number of successful probes.
+        """
+        urls = self._get_warm_up_urls()
+        per_host = self._transport.warm_up_connections_per_host
+        opened = await warm_up_async(self._session, urls, per_host, self.logger)
+        self._latency.mark_warm()
+        if self._transport.keep_alive_probe_secs is not None:
+            if self._keep_alive is None:
+                self._keep_alive = AsyncKeepAlive(
+                    self._session,
+                    urls,
+                    per_host,
+                    self._transport.keep_alive_probe_secs,
+                    self._latency,
+                    self.logger,
+                )
+            self._keep_alive.ensure_started()
+        return opened
+
+    async def close(self) -> None:
+        """Stop background work and close the aiohttp session."""
+        if self._cookie_refresher:
+            self._cookie_refresher.stop()
+        if self._keep_alive:
+            self._keep_alive.stop()
+        if self._async_signer:
+            self._async_signer.close()
+            self._async_signer = None
+        if not self._session.closed:
+            self.logger.info(f"{self._clsname} closing session")
+            await self._session.close()
+
+    async def __aenter__(self: T) -> T:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
 
     def __del__(self):
-        """Close the aiohttp session when the instance is deleted."""
+        """Close the aiohttp session when the instance is deleted without close()."""
         self.logger.info(f"{self._clsname} __del__() called")
-        if self._session:
+        if self._async_signer:
+            self._async_signer.close()
+        if self._cookie_refresher:
+            self._cookie_refresher.stop()
+        if self._keep_alive:
+            self._keep_alive.stop()
+        if self._session and not self._session.closed:
             self.logger.info(f"{self._clsname} closing session")
             asyncio.get_running_loop().create_task(self._session.close())
 
@@ -87,12 +215,43 @@ class GrvtCcxtPro(GrvtCcxtBase):
                 f" {self._session.headers=}"
             )
 
-    async def refresh_cookie(self) -> dict | None:
-        """Refresh the session cookie."""
-        if not self.should_refresh_cookie():
+    def get_async_signer(self) -> AsyncSigner:
+        """
+        Returns the signer used for order entry, created on first use from the
+        signing_executor and signing_max_in_flight parameters.
+        """
+        if self._async_signer is None:
+            self._async_signer = AsyncSigner(
+                self.get_signing_context(),
+                executor=self._signing_executor,
+                max_in_flight=self._signing_max_in_flight,
+            )
+        return self._async_signer
+
+    def get_signing_metrics(self) -> AsyncSigningMetrics:
+        """
+        Returns signing metrics, including the event loop lag while orders were signed.
+        """
+        return self.get_async_signer().metrics
+
+    async def refresh_cookie(self, force: bool = False) -> dict | None:
+        """
+        Refresh the session cookie if it is about to expire, or always if force is True.
+        Concurrent callers share one login.
+        """
+        if self._cookie_refresher and self._cookie:
+            self._cookie_refresher.ensure_started()
+        if not force and not self.should_refresh_cookie():
             return self._cookie
+        return await self._login_flight.run(self._login)
+
+    async def _login(self) -> dict | None:
         path: str = get_grvt_endpoint(self.env, "AUTH")
-        self._cookie = await get_cookie_with_expiration_async(path, self._api_key)
+        cookie = self._load_cached_cookie()
+        if not cookie:
+            cookie = await get_cookie_with_expiration_async(path, self._api_key)
+            self._store_cached_cookie(cookie)
+        self._cookie = cookie
         self._path_return_value_map[path] = self._cookie
         self.update_session_with_cookie()
         return self._cookie
@@ -107,32 +266,30 @@ class GrvtCcxtPro(GrvtCcxtBase):
             raise GrvtInvalidOrder(f"{FN} Invalid path {path=} {payload=}")
         # Always see if need to referesh cookie before sending a request
         await self.refresh_cookie()
-        payload_json = json.dumps(payload, cls=EnumEncoder)
+        payload_json = json_dumps(payload)
         self.logger.info(f"{FN} {payload=}\n{payload_json=}")
-        return_text: str = ""
+        return_body: bytes = b""
+        start = time.perf_counter()
         async with self._session.post(
             url=path,
             data=payload_json,
             headers={"Content-Type": "application/json"},
-            timeout=5,
         ) as return_value:
-            return_text: str = ""
+            self._latency.record(time.perf_counter() - start)
             try:
-                return_text = await return_value.text()
-                response = await return_value.json(content_type="application/json")
+                # Parse the body bytes once, without decoding them to a str first
+                return_body = await return_value.read()
+                response = json_loads(return_body)
             except Exception as err:
-                self.logger.warning(
-                    f"{FN} Unable to parse {return_value=} as "
-                    f" json(content_type='application/json'). {err=}"
-                )
+                self.logger.warning(f"{FN} Unable to parse {return_value=} as json. {err=}")
             if not return_value.ok:
                 self.logger.warning(f"{FN} {payload_json=}\n{return_value=}\n{response=}")
-            else:
-                if len(return_text) > MAX_LEN_TO_LOG:
+            elif len(return_body) > MAX_LEN_TO_LOG:
+                if self.logger.isEnabledFor(logging.DEBUG):
                     self.logger.debug(f"{FN} OK {return_value=} response={response}")
-                    self.logger.info(f"{FN} OK {return_value=} response=**TOO LONG**")
-                else:
-                    self.logger.info(f"{FN} OK {return_value=} response={response}")
+                self.logger.info(f"{FN} OK {return_value=} response=**TOO LONG**")
+            else:
+                self.logger.info(f"{FN} OK {return_value=} response={response}")
         self._path_return_value_map[path] = response
         return response or {}
 
@@ -143,11 +300,12 @@ class GrvtCcxtPro(GrvtCcxtBase):
         Return: dictionary representing the order response.
         """
         FN = f"{self._clsname} _create_grvt_order cloid:{order.metadata.client_order_id}"
-        order_payload = get_order_payload(
+        order_payload = await get_order_payload_async(
             order,
-            private_key=self._private_key,
-            env=self.env,
-            instruments=self.markets,
+            self.env,
+            self.markets,
+            self.get_async_signer(),
+            signature_cache=self._signature_cache,
         )
         path = get_grvt_endpoint(self.env, "CREATE_ORDER")
         self.logger.info(f"{FN} {path=} {order_payload=}")
@@ -155,6 +313,8 @@ class GrvtCcxtPro(GrvtCcxtBase):
         if response.get("result") is None:
             self.logger.error(f"Error creating order, {response}")
             return {}
+        # Acknowledged: a retry of this order would need a new nonce anyway
+        self._evict_cached_signature(order_payload["order"])
         self.logger.info(
             f"{FN} Order created:"
             f"{response.get('result', {}).get('metadata', {}).get('client_order_id')}"
@@ -560,6 +720,81 @@ class GrvtCcxtPro(GrvtCcxtBase):
             response["result"] = trades
         return response
 
+    def iter_my_trades(
+        self,
+        symbol: str | None = None,
+        since: int | None = None,
+        limit: int | None = None,
+        params: dict = {},
+        stop_time: int | None = None,
+        max_buffered_items: int | None = DEFAULT_MAX_BUFFERED_ITEMS,
+    ) -> AsyncIterator[dict]:
+        """
+        HISTORICAL data.<br>
+        Iterate over the trades of every page of fetch_my_trades(), newest first,
+        with the next page fetched while the current one is processed.<br>
+        See grvt_history for `stop_time` and `max_buffered_items`.<br>
+
+        Args:
+            symbol, since, limit, params: as for fetch_my_trades().<br>
+            stop_time: stop at the first trade older than this time in nanoseconds.<br>
+            max_buffered_items: fetch the next page ahead only when both pages fit in
+                this many trades.<br>
+        """
+        # Pages are filtered here: a page without trades of `symbol` is not the last one
+        trades = aiter_items(
+            lambda cursor: self.fetch_my_trades(
+                None, since, limit, {**params, "cursor": cursor}
+            ),
+            stop_time,
+            ("event_time",),
+            max_buffered_items,
+        )
+        if not symbol:
+            return trades
+        return (t async for t in trades if t.get("instrument") == symbol)
+
+    def iter_order_history(
+        self,
+        params: dict = {},
+        stop_time: int | None = None,
+        max_buffered_items: int | None = DEFAULT_MAX_BUFFERED_ITEMS,
+    ) -> AsyncIterator[dict]:
+        """
+        HISTORICAL data.<br>
+        Iterate over the orders of every page of fetch_order_history(), newest first,
+        with the next page fetched while the current one is processed.<br>
+        See iter_my_trades() for `stop_time` and `max_buffered_items`.<br>
+        """
+        return aiter_items(
+            lambda cursor: self.fetch_order_history({**params, "cursor": cursor}),
+            stop_time,
+            ("metadata", "create_time"),
+            max_buffered_items,
+        )
+
+    def iter_account_history(
+        self,
+        params: dict = {},
+        limit: int = 500,
+        stop_time: int | None = None,
+        max_buffered_items: int | None = DEFAULT_MAX_BUFFERED_ITEMS,
+    ) -> AsyncIterator[dict]:
+        """
+        HISTORICAL data.<br>
+        Iterate over the snapshots of every page of fetch_account_history(), newest
+        first, with the next page fetched while the current one is processed.<br>
+        See iter_my_trades() for `stop_time` and `max_buffered_items`.<br>
+        """
+        return aiter_items(
+            lambda cursor: self.fetch_account_history(
+                {**params, "cursor": cursor}, limit
+            ),
+            stop_time,
+            ("event_time",),
+            max_buffered_items,
+        )
+
     # **************** PUBLIC API CALLS
     async def load_markets(self) -> dict | None:
         self.logger.info("load_markets START")
@@ -742,6 +977,30 @@ class GrvtCcxtPro(GrvtCcxtBase):
         response: dict = await self._auth_and_post(path, payload=payload)
         return response
 
+    def iter_trades(
+        self,
+        symbol: str,
+        since: int | None = None,
+        limit: int = 1_000,
+        params: dict = {},
+        stop_time: int | None = None,
+        max_buffered_items: int | None = DEFAULT_MAX_BUFFERED_ITEMS,
+    ) -> AsyncIterator[dict]:
+        """
+        HISTORICAL data.<br>
+        Iterate over the trades of every page of fetch_trades(), newest first,
+        with the next page fetched while the current one is processed.<br>
+        See iter_my_trades() for `stop_time` and `max_buffered_items`.<br>
+        """
+        return aiter_items(
+            lambda cursor: self.fetch_trades(
+                symbol, since, limit, {**params, "cursor": cursor}
+            ),
+            stop_time,
+            ("event_time",),
+            max_buffered_items,
+        )
+
     async def fetch_funding_rate_history(
         self,
         symbol: str,
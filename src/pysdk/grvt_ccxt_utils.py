@@ -10,6 +10,7 @@ import json
 import logging
 import random
 import time
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
@@ -19,18 +20,28 @@ from typing import Any
 
 import aiohttp
 import requests
-from eth_account import Account
-from eth_account.messages import encode_typed_data, SignableMessage
+from eth_account.messages import SignableMessage
 
 from .grvt_ccxt_env import CHAIN_IDS, GrvtEnv
 from .grvt_ccxt_types import (
-    BTC_ETH_SIZE_MULTIPLIER,
     DURATION_SECOND_IN_NSEC,
     Amount,
     GrvtOrderSide,
     GrvtOrderType,
     Num,
 )
+from .grvt_async_signing import AsyncSigner
+from .grvt_eip712 import EIP712StructHasher, get_EIP712_signable_message
+from .grvt_fixed_point import (
+    PRICE_DECIMALS,
+    get_instrument_scaler,
+    round_decimal,
+    to_scaled_int,
+)
+from .grvt_id_allocator import next_client_order_id, next_nonce
+from .grvt_signature_cache import SignatureCache, get_signature_cache_key
+from .grvt_signing_context import SigningContext
+from .grvt_signing_pool import sign_messages_batch
 
 
 def rand_uint32():
@@ -242,6 +253,7 @@ EIP712_ORDER_MESSAGE_TYPE = {
         {"name": "isBuyingContract", "type": "bool"},
     ],
 }
+EIP712_ORDER_HASHER = EIP712StructHasher(EIP712_ORDER_MESSAGE_TYPE)
 
 
 @dataclass
@@ -328,12 +340,10 @@ class GrvtOrder:
     reduce_only: bool = False
 
 
-def get_signable_message(
-    order: GrvtOrder, env: GrvtEnv, instruments: dict[str, dict]
-) -> bytes | None:
+def _get_order_message_data(
+    order: GrvtOrder, instruments: dict[str, dict]
+) -> dict | None:
     FN = f"get_signable_message {order=}"
-    size_multiplier = BTC_ETH_SIZE_MULTIPLIER
-    PRICE_MULTIPLIER = 1_000_000_000
     legs = []
     for leg in order.legs:
         instrument = instruments.get(leg.instrument)
@@ -343,15 +353,20 @@ def get_signable_message(
         if "base_decimals" not in instrument:
             logging.error(f"{FN}: no 'base_decimals' in {instrument=}")
             return None
-        size_multiplier = 10 ** instrument["base_decimals"]
         if "instrument_hash" not in instrument:
             logging.error(f"{FN}: no 'instrument_hash' in {instrument=}")
             return None
+        scaler = get_instrument_scaler(
+            leg.instrument,
+            instrument["base_decimals"],
+            instrument.get("tick_size"),
+            instrument.get("min_size"),
+        )
         legs.append(
             {
                 "assetID": instrument["instrument_hash"],
-                "contractSize": int(Decimal(leg.size) * Decimal(size_multiplier)),
-                "limitPrice": int(Decimal(leg.limit_price) * Decimal(PRICE_MULTIPLIER)),
+                "contractSize": scaler.size(leg.size),
+                "limitPrice": scaler.price(leg.limit_price),
                 "isBuyingContract": leg.is_buying_asset,
             }
         )
@@ -365,23 +380,29 @@ def get_signable_message(
         "nonce": order.signature.nonce,
         "expiration": order.signature.expiration,
     }
-    domain_data: dict[str, str | int]= get_EIP712_domain_data(env)
-    logging.info(f"{FN} {domain_data=}\n{EIP712_ORDER_MESSAGE_TYPE=}\n{message_data=}")
-    return encode_typed_data(domain_data, EIP712_ORDER_MESSAGE_TYPE, message_data)
+    logging.info(f"{FN}\n{EIP712_ORDER_MESSAGE_TYPE=}\n{message_data=}")
+    return message_data
 
 
-def get_order_payload(
-    order: GrvtOrder, private_key: str, env: GrvtEnv, instruments: dict[str, dict]
-) -> dict:
-    signable_message = get_signable_message(order, env, instruments)
-    if signable_message is None:
-        raise ValueError("Failed to create signable message")
-    signed_message = Account.sign_message(signable_message, private_key)
-    order.signature.s = "0x" + signed_message.s.to_bytes(32, byteorder="big").hex()
-    order.signature.r = "0x" + signed_message.r.to_bytes(32, byteorder="big").hex()
-    order.signature.v = signed_message.v
-    order.signature.signer = Account.from_key(private_key).address
+def get_signable_message(
+    order: GrvtOrder, env: GrvtEnv, instruments: dict[str, dict]
+) -> SignableMessage | None:
+    message_data = _get_order_message_data(order, instruments)
+    if message_data is None:
+        return None
+    return get_EIP712_signable_message(
+        CHAIN_IDS[env.value], EIP712_ORDER_HASHER, message_data
+    )
+
+
+def _set_order_signature(order: GrvtOrder, r: int, s: int, v: int, signer: str) -> None:
+    order.signature.s = "0x" + s.to_bytes(32, byteorder="big").hex()
+    order.signature.r = "0x" + r.to_bytes(32, byteorder="big").hex()
+    order.signature.v = v
+    order.signature.signer = signer
 
+
+def _build_order_payload(order: GrvtOrder) -> dict:
     return {
         "order": {
             "sub_account_id": str(order.sub_account_id),
@@ -413,14 +434,153 @@ def get_order_payload(
     }
 
 
+def get_order_payload(
+    order: GrvtOrder,
+    private_key: str,
+    env: GrvtEnv,
+    instruments: dict[str, dict],
+    signing_context: SigningContext | None = None,
+    signature_cache: SignatureCache | None = None,
+) -> dict:
+    """
+    Signs the order and returns the create_order payload.
+    Pass `signing_context` to reuse the parsed key and address instead of deriving
+    them from `private_key` for every order.
+    With `signature_cache`, a retry of an order with the same content, nonce and
+    expiration reuses the signature computed the first time.
+    """
+    message_data = _get_order_message_data(order, instruments)
+    if message_data is None:
+        raise ValueError("Failed to create signable message")
+    if signing_context is None:
+        signing_context = SigningContext.from_key(private_key, CHAIN_IDS[env.value])
+    cache_key = None
+    signature = None
+    if signature_cache is not None:
+        cache_key = get_signature_cache_key(
+            signing_context.chain_id, signing_context.address, message_data
+        )
+        signature = signature_cache.get(cache_key)
+    if signature is None:
+        signature = signing_context.sign_message(
+            get_EIP712_signable_message(
+                signing_context.chain_id, EIP712_ORDER_HASHER, message_data
+            )
+        )
+        if signature_cache is not None and cache_key is not None:
+            signature_cache.put(cache_key, signature)
+    r, s, v = signature
+    _set_order_signature(order, r, s, v, signing_context.address)
+    return _build_order_payload(order)
+
+
+def get_order_payloads_batch(
+    orders: list[GrvtOrder],
+    private_key: str,
+    env: GrvtEnv,
+    instruments: dict[str, dict],
+    executor: Executor | None = None,
+    signing_context: SigningContext | None = None,
+) -> list[dict]:
+    """
+    Signs a batch of orders in parallel and returns their create_order payloads.
+    Orders are hashed in the calling process and only the signable messages are sent
+    to `executor` (by default the shared process pool of `grvt_signing_pool`).
+    Payloads are returned in the order of `orders`.
+    """
+    signable_messages = []
+    for order in orders:
+        signable_message = get_signable_message(order, env, instruments)
+        if signable_message is None:
+            raise ValueError("Failed to create signable message")
+        signable_messages.append(signable_message)
+    if signing_context is None:
+        signing_context = SigningContext.from_key(private_key, CHAIN_IDS[env.value])
+    signatures = sign_messages_batch(
+        signing_context.private_key,
+        signable_messages,
+        executor,
+        signer_backend=signing_context.signer_backend,
+    )
+    signer = signing_context.address
+    payloads = []
+    for order, (r, s, v) in zip(orders, signatures):
+        _set_order_signature(order, r, s, v, signer)
+        payloads.append(_build_order_payload(order))
+    return payloads
+
+
 def get_order_rpc_payload(
     order: GrvtOrder,
     private_key: str,
     env: GrvtEnv,
     instruments: dict[str, dict],
     version: str = "v1",
+    signing_context: SigningContext | None = None,
+    signature_cache: SignatureCache | None = None,
 ) -> dict:
-    order_payload = get_order_payload(order, private_key, env, instruments)
+    order_payload = get_order_payload(
+        order,
+        private_key,
+        env,
+        instruments,
+        signing_context=signing_context,
+        signature_cache=signature_cache,
+    )
+    return {
+        "jsonrpc": "2.0",
+        "method": f"{version}/create_order",
+        "params": order_payload,
+    }
+
+
+async def get_order_payload_async(
+    order: GrvtOrder,
+    env: GrvtEnv,
+    instruments: dict[str, dict],
+    signer: AsyncSigner,
+    signature_cache: SignatureCache | None = None,
+) -> dict:
+    """
+    Signs the order with `signer` and returns the create_order payload.
+    Same payload as get_order_payload, but the signature is computed wherever
+    `signer` is configured to, so the event loop keeps running meanwhile.
+    """
+    message_data = _get_order_message_data(order, instruments)
+    if message_data is None:
+        raise ValueError("Failed to create signable message")
+    signing_context = signer.signing_context
+    cache_key = None
+    signature = None
+    if signature_cache is not None:
+        cache_key = get_signature_cache_key(
+            signing_context.chain_id, signing_context.address, message_data
+        )
+        signature = signature_cache.get(cache_key)
+    if signature is None:
+        signature = await signer.sign(
+            get_EIP712_signable_message(
+                signing_context.chain_id, EIP712_ORDER_HASHER, message_data
+            )
+        )
+        if signature_cache is not None and cache_key is not None:
+            signature_cache.put(cache_key, signature)
+    r, s, v = signature
+    _set_order_signature(order, r, s, v, signing_context.address)
+    return _build_order_payload(order)
+
+
+async def get_order_rpc_payload_async(
+    order: GrvtOrder,
+    env: GrvtEnv,
+    instruments: dict[str, dict],
+    signer: AsyncSigner,
+    version: str = "v1",
+    signature_cache: SignatureCache | None = None,
+) -> dict:
+    order_payload = await get_order_payload_async(
+        order, env, instruments, signer, signature_cache
+    )
     return {
         "jsonrpc": "2.0",
         "method": f"{version}/create_order",
@@ -455,9 +615,9 @@ def get_grvt_order(
     is_market = order_type == "market"
     leg = GrvtOrderLeg(
         instrument=symbol,
-        size=round(Decimal(amount), 9),
+        size=round_decimal(amount, 9),
         is_buying_asset=is_buying_asset,
-        limit_price=round(Decimal(limit_price), 9),
+        limit_price=round_decimal(limit_price, PRICE_DECIMALS),
     )
 
     # create an expiry time
@@ -471,19 +631,22 @@ def get_grvt_order(
     if "reduce_only" in params:
         reduce_only = params["reduce_only"]
     expiry_ns: int = 0
-    if order_duration_secs:
+    if "expiration" in params:
+        # Rebuilding an order to retry it: same nonce and expiration, same signature
+        expiry_ns = int(params["expiration"])
+    elif order_duration_secs:
         expiry_ns = time.time_ns() + int(order_duration_secs * DURATION_SECOND_IN_NSEC)
     if "client_order_id" in params:
         client_order_id = int(params["client_order_id"])
     else:
-        client_order_id = rand_uint32()
+        client_order_id = next_client_order_id()
     signature = GrvtSignature(
         signer="",
         r="",
         s="",
         v=0,
         expiration=str(expiry_ns),
-        nonce=rand_uint32(),
+        nonce=int(params["nonce"]) if "nonce" in params else next_nonce(),
     )
     metadata = OrderMetadata(client_order_id=str(client_order_id))
     return GrvtOrder(
@@ -497,8 +660,23 @@ def get_grvt_order(
         reduce_only=reduce_only,
     )
 
+EIP712_DERISK_MM_RATIO_MESSAGE_TYPE = {
+    "SetDeriskToMaintenanceMarginRatio": [
+        {"name": "subAccountID", "type": "uint64"},
+        {"name": "deriskToMaintenanceMarginRatio", "type": "uint32"},
+        {"name": "nonce", "type": "uint32"},
+        {"name": "expiration", "type": "int64"},
+    ]
+}
+EIP712_DERISK_MM_RATIO_HASHER = EIP712StructHasher(EIP712_DERISK_MM_RATIO_MESSAGE_TYPE)
+
+
 def sign_derisk_mm_ratio_request(
-    env: GrvtEnv, sub_account_id: int, ratio: str, private_key_hex: str
+    env: GrvtEnv,
+    sub_account_id: int,
+    ratio: str,
+    private_key_hex: str,
+    signing_context: SigningContext | None = None,
 ):
     """
     Generate a signature for setting the derisk to maintenance margin ratio.
@@ -506,22 +684,15 @@ def sign_derisk_mm_ratio_request(
     :param sub_account_id: The sub-account ID to set the ratio for.
     :param ratio: The derisk to maintenance margin ratio as a string (e.g., "2.0").
     :param private_key_hex: The private key in hexadecimal format.
+    :param signing_context: Optional pre-parsed key; avoids deriving the key from private_key_hex.
     :return: A dictionary containing the signature for the payload.
     """
-    derisk_ratio_int = int(Decimal(ratio) * 1_000_000)
+    derisk_ratio_int = to_scaled_int(ratio, 6, "truncate", name="ratio")
     expiration_ns = int((time.time() + 86400) * 1_000_000_000)
-    nonce = random.randint(1, 2**32 - 1)
+    nonce = next_nonce()
 
-    domain_data = get_EIP712_domain_data(env)
-
-    types = {
-        "SetDeriskToMaintenanceMarginRatio": [
-            {"name": "subAccountID", "type": "uint64"},
-            {"name": "deriskToMaintenanceMarginRatio", "type": "uint32"},
-            {"name": "nonce", "type": "uint32"},
-            {"name": "expiration", "type": "int64"},
-        ]
-    }
+    if signing_context is None:
+        signing_context = SigningContext.from_key(private_key_hex, CHAIN_IDS[env.value])
 
     signature_payload = {
         "subAccountID": sub_account_id,
@@ -530,15 +701,16 @@ def sign_derisk_mm_ratio_request(
         "expiration": expiration_ns,
     }
 
-    message = encode_typed_data(domain_data, types, signature_payload)
-    signed = Account.sign_message(message, private_key_hex)
-    signer = Account.from_key(private_key_hex)
+    message = get_EIP712_signable_message(
+        signing_context.chain_id, EIP712_DERISK_MM_RATIO_HASHER, signature_payload
+    )
+    r, s, v = signing_context.sign_message(message)
 
     return {
-        "signer": signer.address.lower(),
-        "r": hex(signed.r),
-        "s": hex(signed.s),
-        "v": signed.v,
+        "signer": signing_context.address_lower,
+        "r": hex(r),
+        "s": hex(s),
+        "v": v,
         "expiration": str(expiration_ns),
         "nonce": nonce,
-    }
\ No newline at end of file
+    }
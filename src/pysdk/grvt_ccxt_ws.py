@@ -7,7 +7,6 @@
 # ruff: noqa: E501
 
 import asyncio
-import json
 import logging
 import traceback
 from asyncio.events import AbstractEventLoop
@@ -32,7 +31,8 @@ from .grvt_ccxt_types import (
     GrvtOrderType,
     Num,
 )
-from .grvt_ccxt_utils import get_order_rpc_payload
+from .grvt_ccxt_utils import get_order_rpc_payload_async
+from .grvt_json import json_dumps, json_loads
 
 WS_READ_TIMEOUT = 5
 
@@ -58,9 +58,10 @@ class GrvtCcxtWS(GrvtCcxtPro):
         loop: AbstractEventLoop,
         logger: logging.Logger | None = None,
         parameters: dict = {},
+        login_on_init: bool = True,
     ):
         """Initialize the GrvtCcxt instance."""
-        super().__init__(env, logger, parameters)
+        super().__init__(env, logger, parameters, login_on_init=login_on_init)
         self._loop = loop
         self._clsname: str = type(self).__name__
         self.api_ws_version = parameters.get("api_ws_version", "v1")
@@ -92,9 +93,25 @@ class GrvtCcxtWS(GrvtCcxtPro):
     def __repr__(self) -> str:
         return f"{self._clsname} {self.env=} {self.api_ws_version=}"
 
-    async def __aexit__(self):
+    @classmethod
+    async def create(  # type: ignore[override]
+        cls,
+        env: GrvtEnv,
+        logger: logging.Logger | None = None,
+        parameters: dict = {},
+    ) -> "GrvtCcxtWS":
+        """
+        Create an instance on the running event loop without blocking it.
+        Call `initialize()` to connect to the WS server.
+        """
+        api = cls(env, asyncio.get_running_loop(), logger, parameters, login_on_init=False)
+        await api.start()
+        return api
+
+    async def __aexit__(self, *exc_info) -> None:
         for grvt_endpoint_type in self.endpoint_types:
             await self._close_connection(grvt_endpoint_type)
+        await super().__aexit__(*exc_info)
 
     def force_reconnect(self) -> None:
         self.force_reconnect_flag = True
@@ -288,7 +305,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
                     response = await asyncio.wait_for(
                         self.ws[grvt_endpoint_type].recv(), timeout=WS_READ_TIMEOUT
                     )
-                    message = json.loads(response)
+                    message = json_loads(response)
                     self.logger.debug(f"{FN} received {message=}")
                     self._check_susbcribed_stream(grvt_endpoint_type, message)
                     if "feed" in message:
@@ -331,6 +348,11 @@ class GrvtCcxtWS(GrvtCcxtPro):
                         'id': 2}
                     """
                         self.logger.debug(f"{FN} jsonrpc result:{message.get('result')}")
+                        result = message.get("result")
+                        if isinstance(result, dict):
+                            order = result.get("result", result)
+                            if isinstance(order, dict):
+                                self._evict_cached_signature(order)
                     else:
                         self.logger.info(f"{FN} Non-actionable message:{message}")
                 except (
@@ -519,7 +541,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
             GrvtWSEndpointType.TRADE_DATA,
             GrvtWSEndpointType.MARKET_DATA,
         ]:  # Legacy subscription
-            subscribe_json = json.dumps(
+            subscribe_json = json_dumps(
                 {
                     "request_id": self._request_id,
                     "stream": versioned_stream,
@@ -531,7 +553,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
             self.logger.info(f"{FN} {versioned_stream=} {subscribe_json=}")
         else:  # RPC WS format
             self._request_id += 1
-            subscribe_json = json.dumps(
+            subscribe_json = json_dumps(
                 {
                     "jsonrpc": "2.0",
                     "method": "subscribe",
@@ -563,7 +585,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
             GrvtWSEndpointType.TRADE_DATA,
             GrvtWSEndpointType.MARKET_DATA,
         ]:  # Legacy subscription
-            subscribe_json = json.dumps(
+            subscribe_json = json_dumps(
                 {
                     "request_id": self._request_id,
                     "stream": versioned_stream,
@@ -575,7 +597,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
             self.logger.info(f"{FN} {versioned_stream=} {subscribe_json=}")
         else:  # RPC WS format
             self._request_id += 1
-            subscribe_json = json.dumps(
+            subscribe_json = json_dumps(
                 {
                     "jsonrpc": "2.0",
                     "method": "unsubscribe",
@@ -609,7 +631,7 @@ class GrvtCcxtWS(GrvtCcxtPro):
         """
         Send a message to the server.
         """
-        await self._send(end_point_type, json.dumps(message))
+        await self._send(end_point_type, json_dumps(message))
         self.logger.info(f"{self._clsname} send_rpc_message {end_point_type=} {message=}")
 
     async def rpc_create_order(
@@ -631,7 +653,13 @@ class GrvtCcxtWS(GrvtCcxtPro):
             symbol, order_type, side, amount, price, params
         )
         self.logger.info(f"{FN} {order=}")
-        payload = get_order_rpc_payload(order, self._private_key, self.env, self.markets)
+        payload = await get_order_rpc_payload_async(
+            order,
+            self.env,
+            self.markets,
+            self.get_async_signer(),
+            signature_cache=self._signature_cache,
+        )
         self._request_id += 1
         payload["id"] = self._request_id
         self.logger.info(f"{FN} {payload=}")
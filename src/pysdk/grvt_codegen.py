@@ -0,0 +1,46 @@
+"""
+Helpers shared by the compiled decoders and encoders of `grvt_raw_types`.
+
+Both generate Python source specialized for the fields of one dataclass, and
+compile it once. `CodeCompiler` holds the globals that source refers to.
+"""
+
+import functools
+import operator
+import types
+import typing
+from collections.abc import Callable
+from typing import Any
+
+
+def get_optional_arg(type_: Any) -> Any:
+    """
+    `X` of `X | None`, None if `type_` is not optional.
+
+    A union of several types and None, such as `X | Y | None`, gives `X | Y`.
+    """
+    if typing.get_origin(type_) not in (typing.Union, types.UnionType):
+        return None
+    args = typing.get_args(type_)
+    if type(None) not in args:
+        return None
+    rest = tuple(arg for arg in args if arg is not type(None))
+    return functools.reduce(operator.or_, rest)
+
+
+class CodeCompiler:
+    """Builds functions from generated source, with the globals it refers to."""
+
+    def __init__(self, **names: Any) -> None:
+        self.namespace: dict[str, Any] = dict(names)
+
+    def add_global(self, value: Any) -> str:
+        """Return the name under which the generated source can refer to `value`."""
+        name = f"_g{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def build(self, name: str, lines: list[str]) -> Callable:
+        """Compile `lines` and return the function `name` they define."""
+        exec("\n".join(lines), self.namespace)
+        return self.namespace[name]
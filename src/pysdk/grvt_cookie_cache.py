@@ -0,0 +1,107 @@
+"""
+Opt-in on-disk cache of session cookies, shared by the processes using one API key.
+
+Each client logs in when it is created. Worker processes started for the same API
+key can instead reuse a cookie another process cached while it is still valid.
+Entries are keyed by environment and a hash of the API key, hold the gravity
+cookie, its expiry and the X-Grvt-Account-Id header, and are written atomically
+to files only their owner can read.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from .grvt_auth import COOKIE_EXPIRY_MARGIN_SECS
+
+DEFAULT_COOKIE_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "grvt-pysdk",
+    "cookies",
+)
+
+
+class CookieCache:
+    """
+    Cookies cached as JSON files in `directory`.
+
+    Each cookie is a dict with "gravity", "expires" (unix time) and
+    "X-Grvt-Account-Id" keys, the format of `get_cookie_with_expiration`.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike = DEFAULT_COOKIE_CACHE_DIR,
+        logger: logging.Logger | None = None,
+    ):
+        self.directory = Path(directory)
+        self._logger = logger or logging.getLogger(__name__)
+
+    def get_path(self, env: str, api_key: str) -> Path:
+        # The API key itself is never written to disk
+        key_hash = hashlib.sha256(api_key.encode()).hexdigest()[:32]
+        return self.directory / f"{env}-{key_hash}.json"
+
+    def load(
+        self, env: str, api_key: str, newer_than: float | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Returns the cached cookie if it is still valid, None otherwise.
+
+        When `newer_than` is given the cookie must also expire after that unix time.
+        """
+        path = self.get_path(env, api_key)
+        try:
+            with open(path) as f:
+                cookie = json.load(f)
+            expires = float(cookie["expires"])
+            gravity = str(cookie["gravity"])
+        except FileNotFoundError:
+            return None
+        except Exception as err:
+            self._logger.warning(f"CookieCache ignoring unreadable {path}: {err!r}")
+            return None
+        if expires - time.time() <= COOKIE_EXPIRY_MARGIN_SECS:
+            return None
+        if newer_than is not None and expires <= newer_than:
+            return None
+        return {
+            "gravity": gravity,
+            "expires": expires,
+            "X-Grvt-Account-Id": cookie.get("X-Grvt-Account-Id") or None,
+        }
+
+    def store(self, env: str, api_key: str, cookie: dict[str, Any]) -> None:
+        """Atomically replace the cached cookie; errors are logged, not raised."""
+        path = self.get_path(env, api_key)
+        entry = {
+            "gravity": cookie["gravity"],
+            "expires": cookie["expires"],
+            "X-Grvt-Account-Id": cookie.get("X-Grvt-Account-Id") or None,
+        }
+        try:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # mkstemp creates the file readable and writable by its owner only
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(entry, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as err:
+            self._logger.warning(f"CookieCache unable to write {path}: {err!r}")
+
+    def delete(self, env: str, api_key: str) -> None:
+        try:
+            self.get_path(env, api_key).unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,263 @@
+"""
+Precompiled EIP-712 hashing.
+
+`eth_account.messages.encode_typed_data` re-derives the type strings, type hashes
+and domain separator of every message it encodes. The hashers in this module do
+that work once per schema and then encode the struct fields directly, producing
+byte-for-byte the same `SignableMessage` for the flat schemas used by GRVT.
+"""
+
+from collections.abc import Callable
+from functools import cache
+from typing import Any
+
+from eth_account.messages import SignableMessage
+from eth_utils import keccak
+
+EIP712_DOMAIN_NAME = "GRVT Exchange"
+EIP712_DOMAIN_VERSION = "0"
+
+EIP712_DOMAIN_TYPE = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "version", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+    ],
+}
+
+FieldEncoder = Callable[[Any], bytes]
+
+_TRUE_WORD = (1).to_bytes(32, byteorder="big")
+_FALSE_WORD = bytes(32)
+_FALSY_BOOL_STRINGS = {"False", "false", "0"}
+# keccak hash of an empty array, as eth_account encodes it
+_EMPTY_ARRAY_HASH = keccak(b"")
+
+
+def _to_int(name: str, value: Any) -> int:
+    # Mirrors eth_account: ints pass through, strings are parsed as hex or decimal
+    if isinstance(value, str):
+        if value.startswith("0x"):
+            return int(value, 16)
+        return int(value)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    raise ValueError(f"Invalid value for field `{name}`: {value!r} is not an integer")
+
+
+def _uint_encoder(name: str, bits: int) -> FieldEncoder:
+    max_value = 2**bits - 1
+
+    def encode(value: Any) -> bytes:
+        int_value = _to_int(name, value)
+        if int_value < 0 or int_value > max_value:
+            raise ValueError(
+                f"Value {int_value} of field `{name}` is out of uint{bits} range"
+            )
+        return int_value.to_bytes(32, byteorder="big")
+
+    return encode
+
+
+def _int_encoder(name: str, bits: int) -> FieldEncoder:
+    min_value = -(2 ** (bits - 1))
+    max_value = 2 ** (bits - 1) - 1
+
+    def encode(value: Any) -> bytes:
+        int_value = _to_int(name, value)
+        if int_value < min_value or int_value > max_value:
+            raise ValueError(
+                f"Value {int_value} of field `{name}` is out of int{bits} range"
+            )
+        return int_value.to_bytes(32, byteorder="big", signed=True)
+
+    return encode
+
+
+def _bool_encoder(name: str) -> FieldEncoder:
+    def encode(value: Any) -> bytes:
+        if not value or value in _FALSY_BOOL_STRINGS:
+            return _FALSE_WORD
+        return _TRUE_WORD
+
+    return encode
+
+
+def _address_encoder(name: str) -> FieldEncoder:
+    def encode(value: Any) -> bytes:
+        if isinstance(value, bytes) and len(value) == 20:
+            return bytes(12) + value
+        if isinstance(value, str) and len(value) == 42 and value.startswith("0x"):
+            try:
+                return bytes(12) + bytes.fromhex(value[2:])
+            except ValueError:
+                pass
+        raise ValueError(f"Invalid value for field `{name}`: {value!r} is not an address")
+
+    return encode
+
+
+def _string_encoder(name: str) -> FieldEncoder:
+    def encode(value: Any) -> bytes:
+        if not isinstance(value, str):
+            raise ValueError(
+                f"Invalid value for field `{name}`: {value!r} is not a string"
+            )
+        return keccak(text=value)
+
+    return encode
+
+
+def _struct_array_encoder(name: str, hasher: "EIP712StructHasher") -> FieldEncoder:
+    def encode(value: Any) -> bytes:
+        if not isinstance(value, list):
+            raise ValueError(
+                f"Invalid value for field `{name}`: expected array, got {value!r}"
+            )
+        if not value:
+            return _EMPTY_ARRAY_HASH
+        return keccak(b"".join(hasher.hash_struct(item) for item in value))
+
+    return encode
+
+
+def _struct_encoder(name: str, hasher: "EIP712StructHasher") -> FieldEncoder:
+    def encode(value: Any) -> bytes:
+        return hasher.hash_struct(value)
+
+    return encode
+
+
+def _get_primary_type(types: dict[str, list[dict[str, str]]]) -> str:
+    dependencies = {
+        field["type"].split("[")[0]
+        for type_name, fields in types.items()
+        for field in fields
+        if field["type"].split("[")[0] != type_name
+    }
+    primary_types = [type_name for type_name in types if type_name not in dependencies]
+    if len(primary_types) != 1:
+        raise ValueError(f"Unable to determine primary type of {list(types)}")
+    return primary_types[0]
+
+
+def _find_dependencies(
+    type_name: str, types: dict[str, list[dict[str, str]]], found: set[str]
+) -> set[str]:
+    core_type = type_name.split("[")[0]
+    if core_type in found or core_type not in types:
+        return found
+    found.add(core_type)
+    for field in types[core_type]:
+        _find_dependencies(field["type"], types, found)
+    return found
+
+
+def encode_EIP712_type(type_name: str, types: dict[str, list[dict[str, str]]]) -> str:
+    """Return the EIP-712 `encodeType` string of `type_name`."""
+    dependencies = _find_dependencies(type_name, types, set())
+    dependencies.discard(type_name)
+    encoded = ""
+    for dependency in [type_name, *sorted(dependencies)]:
+        members = ",".join(
+            f"{field['type']} {field['name']}" for field in types[dependency]
+        )
+        encoded += f"{dependency}({members})"
+    return encoded
+
+
+class EIP712StructHasher:
+    """
+    Computes EIP-712 `hashStruct` for one struct type of a fixed schema.
+
+    The type hash and the per-field encoders are built once at construction,
+    so hashing a message only encodes its values.
+    """
+
+    def __init__(
+        self,
+        types: dict[str, list[dict[str, str]]],
+        primary_type: str | None = None,
+    ):
+        self.types = types
+        self.primary_type: str = primary_type or _get_primary_type(types)
+        self.type_hash: bytes = keccak(text=encode_EIP712_type(self.primary_type, types))
+        self._fields: list[tuple[str, FieldEncoder]] = [
+            (field["name"], self._compile_field(field["name"], field["type"]))
+            for field in types[self.primary_type]
+        ]
+        self._encoders: dict[str, FieldEncoder] = dict(self._fields)
+
+    def _compile_field(self, name: str, type_name: str) -> FieldEncoder:
+        if type_name.endswith("[]") and type_name[:-2] in self.types:
+            return _struct_array_encoder(
+                name, EIP712StructHasher(self.types, type_name[:-2])
+            )
+        if type_name in self.types:
+            return _struct_encoder(name, EIP712StructHasher(self.types, type_name))
+        if type_name == "bool":
+            return _bool_encoder(name)
+        if type_name == "address":
+            return _address_encoder(name)
+        if type_name == "string":
+            return _string_encoder(name)
+        if type_name.startswith("uint"):
+            return _uint_encoder(name, int(type_name[4:] or 256))
+        if type_name.startswith("int"):
+            return _int_encoder(name, int(type_name[3:] or 256))
+        raise ValueError(f"Unsupported EIP-712 type `{type_name}` of field `{name}`")
+
+    @property
+    def field_names(self) -> list[str]:
+        return [name for name, _ in self._fields]
+
+    def encode_field(self, name: str, value: Any) -> bytes:
+        """Return the 32-byte `encodeData` word of one field of the primary type."""
+        return self._encoders[name](value)
+
+    def hash_struct(self, data: dict[str, Any]) -> bytes:
+        encoded = [self.type_hash]
+        for name, encoder in self._fields:
+            value = data.get(name)
+            if value is None:
+                raise ValueError(
+                    f"Missing value for field `{name}` of {self.primary_type}"
+                )
+            encoded.append(encoder(value))
+        return keccak(b"".join(encoded))
+
+
+_DOMAIN_HASHER = EIP712StructHasher(EIP712_DOMAIN_TYPE)
+
+
+@cache
+def get_EIP712_domain_separator(chain_id: int) -> bytes:
+    """Return the GRVT EIP-712 domain separator for `chain_id`, computed once."""
+    return _DOMAIN_HASHER.hash_struct(
+        {
+            "name": EIP712_DOMAIN_NAME,
+            "version": EIP712_DOMAIN_VERSION,
+            "chainId": chain_id,
+        }
+    )
+
+
+def get_EIP712_signable_message(
+    chain_id: int, hasher: EIP712StructHasher, message_data: dict[str, Any]
+) -> SignableMessage:
+    """`encode_typed_data(domain, types, message_data)` for a compiled schema."""
+    return SignableMessage(
+        version=b"\x01",
+        header=get_EIP712_domain_separator(chain_id),
+        body=hasher.hash_struct(message_data),
+    )
+
+
+def get_EIP712_digest(signable_message: SignableMessage) -> bytes:
+    """Return the 32-byte EIP-191 digest actually signed for `signable_message`."""
+    return keccak(
+        b"\x19"
+        + signable_message.version
+        + signable_message.header
+        + signable_message.body
+    )
@@ -0,0 +1,292 @@
+"""
+Exact conversion between decimal amounts and the scaled integers that are signed.
+
+Sizes, prices and token amounts are signed as integers equal to the decimal value
+times 10**decimals. The helpers here parse strings and numbers straight into
+those integers, without building and multiplying `Decimal` objects per leg, and
+report precision loss instead of silently dropping digits unless asked to.
+
+`InstrumentScaler` caches the multipliers, tick size and minimum size of an
+instrument; the order builders use it to reject sizes and prices that cannot be
+signed as given.
+"""
+
+from collections.abc import Iterable
+from decimal import Decimal
+from functools import lru_cache
+from typing import Literal
+
+from .grvt_raw_types import Instrument
+
+# Decimals of limit prices, tick sizes and trigger prices
+PRICE_DECIMALS = 9
+
+# "exact" raises FixedPointError when digits beyond `decimals` are not zero,
+# "truncate" drops them (like int(Decimal(value) * 10**decimals)) and
+# "half_even" rounds them (like round(Decimal(value), decimals)).
+Rounding = Literal["exact", "truncate", "half_even"]
+
+ScalableValue = str | int | float | Decimal
+
+_POW10 = [10**i for i in range(78)]
+
+
+class FixedPointError(ValueError):
+    pass
+
+
+def _parse_plain(
+    text: str, value: ScalableValue, decimals: int, rounding: Rounding, name: str
+) -> int | None:
+    # Returns None when `text` is not a plain [+-]digits[.digits] number
+    negative = text[:1] == "-"
+    if text[:1] in ("-", "+"):
+        text = text[1:]
+    whole, _, frac = text.partition(".")
+    digits = whole + frac
+    if not digits or not digits.isascii() or not digits.isdigit():
+        return None
+    if len(frac) <= decimals:
+        scaled = int(digits) * _POW10[decimals - len(frac)]
+    else:
+        kept_digits = whole + frac[:decimals]
+        scaled = int(kept_digits) if kept_digits else 0
+        dropped = frac[decimals:]
+        if dropped.strip("0"):
+            if rounding == "exact":
+                raise FixedPointError(
+                    f"{name} {value!r} has more than {decimals} decimal places"
+                )
+            if rounding == "half_even" and (
+                dropped[0] > "5"
+                or (dropped[0] == "5" and (dropped[1:].strip("0") or scaled % 2))
+            ):
+                scaled += 1
+    return -scaled if negative else scaled
+
+
+def to_scaled_int(
+    value: ScalableValue,
+    decimals: int,
+    rounding: Rounding = "exact",
+    name: str = "value",
+) -> int:
+    """
+    Return `value` * 10**`decimals` as an int.
+
+    Strings and Decimals are converted exactly; floats use their shortest repr,
+    i.e. 0.1 is read as "0.1". Digits beyond `decimals` are handled per `rounding`.
+    """
+    if type(value) is str:
+        # Fast path: plain numbers within `decimals`; int() handles sign and whitespace
+        whole, _, frac = value.partition(".")
+        if len(frac) <= decimals and (not frac or frac.isdigit()) and "_" not in whole:
+            try:
+                return int(whole + frac) * _POW10[decimals - len(frac)]
+            except ValueError:
+                pass
+    if isinstance(value, str):
+        text = value.strip()
+        scaled = _parse_plain(text, value, decimals, rounding, name)
+        if scaled is not None:
+            return scaled
+        # Exponent notation such as "1e-9"; Decimal() would also accept "1_000"
+        if "_" in text:
+            raise FixedPointError(f"{name} {value!r} is not a decimal number")
+        try:
+            parsed = Decimal(text)
+        except ArithmeticError:
+            raise FixedPointError(f"{name} {value!r} is not a decimal number") from None
+        if not parsed.is_finite():
+            raise FixedPointError(f"{name} {value!r} is not a finite number")
+        scaled = _parse_plain(format(parsed, "f"), value, decimals, rounding, name)
+    elif isinstance(value, bool):
+        raise FixedPointError(f"{name} {value!r} is not a decimal number")
+    elif isinstance(value, int):
+        return value * _POW10[decimals]
+    elif isinstance(value, Decimal):
+        if not value.is_finite():
+            raise FixedPointError(f"{name} {value!r} is not a finite number")
+        scaled = _parse_plain(format(value, "f"), value, decimals, rounding, name)
+    elif isinstance(value, float):
+        if value != value or value in (float("inf"), float("-inf")):
+            raise FixedPointError(f"{name} {value!r} is not a finite number")
+        text = repr(value)
+        scaled = _parse_plain(text, value, decimals, rounding, name)
+        if scaled is None:
+            plain = format(Decimal(text), "f")
+            scaled = _parse_plain(plain, value, decimals, rounding, name)
+    else:
+        raise FixedPointError(f"{name} {value!r} is not a decimal number")
+    if scaled is None:
+        raise FixedPointError(f"{name} {value!r} is not a decimal number")
+    return scaled
+
+
+def to_scaled_ints(
+    values: Iterable[ScalableValue],
+    decimals: int,
+    rounding: Rounding = "exact",
+    name: str = "value",
+) -> list[int]:
+    """
+    Return `to_scaled_int` of every value, all with the same `decimals`.
+
+    Values are still converted one at a time; plain strings and ints are inlined
+    to save a function call each.
+    """
+    multiplier = _POW10[decimals]
+    scaled = []
+    for value in values:
+        # Same fast path as to_scaled_int, without the call overhead
+        if type(value) is str:
+            whole, _, frac = value.partition(".")
+            if (
+                len(frac) <= decimals
+                and (not frac or frac.isdigit())
+                and "_" not in whole
+            ):
+                try:
+                    scaled.append(int(whole + frac) * _POW10[decimals - len(frac)])
+                    continue
+                except ValueError:
+                    pass
+        elif type(value) is int:
+            scaled.append(value * multiplier)
+            continue
+        scaled.append(to_scaled_int(value, decimals, rounding, name))
+    return scaled
+
+
+def from_scaled_int(value: int, decimals: int) -> str:
+    """Return the decimal string of a scaled integer, without trailing zeros."""
+    sign = "-" if value < 0 else ""
+    whole, frac = divmod(abs(value), _POW10[decimals])
+    if not frac:
+        return f"{sign}{whole}"
+    return f"{sign}{whole}.{str(frac).rjust(decimals, '0').rstrip('0')}"
+
+
+def round_decimal(value: ScalableValue, decimals: int) -> Decimal:
+    """Equivalent of round(Decimal(value), decimals) that keeps `decimals` places."""
+    return Decimal(to_scaled_int(value, decimals, "half_even")).scaleb(-decimals)
+
+
+class InstrumentScaler:
+    """
+    Size and price conversion for one instrument.
+
+    Sizes are scaled by 10**base_decimals and prices by 10**PRICE_DECIMALS. When
+    validating, sizes must be positive and at least `min_size`, and prices a
+    multiple of `tick_size`.
+    """
+
+    def __init__(
+        self,
+        instrument: str,
+        base_decimals: int,
+        tick_size: str | None = None,
+        min_size: str | None = None,
+    ):
+        self.instrument = instrument
+        self.base_decimals = base_decimals
+        self.tick_size: int | None = (
+            to_scaled_int(tick_size, PRICE_DECIMALS, name=f"{instrument} tick_size")
+            if tick_size
+            else None
+        )
+        self.min_size: int | None = (
+            to_scaled_int(min_size, base_decimals, name=f"{instrument} min_size")
+            if min_size
+            else None
+        )
+        # Smallest valid scaled size, for checking a batch at once
+        self._size_floor = max(self.min_size or 1, 1)
+
+    @classmethod
+    def from_instrument(cls, instrument: Instrument) -> "InstrumentScaler":
+        return get_instrument_scaler(
+            instrument.instrument,
+            instrument.base_decimals,
+            instrument.tick_size,
+            instrument.min_size,
+        )
+
+    def _check_size(self, scaled: int, value: ScalableValue) -> None:
+        if scaled <= 0:
+            raise FixedPointError(f"{self.instrument} size {value!r} must be positive")
+        if self.min_size is not None and scaled < self.min_size:
+            raise FixedPointError(
+                f"{self.instrument} size {value!r} is below min_size"
+                f" {from_scaled_int(self.min_size, self.base_decimals)}"
+            )
+
+    def _check_price(self, scaled: int, value: ScalableValue) -> None:
+        if self.tick_size is not None and scaled % self.tick_size:
+            raise FixedPointError(
+                f"{self.instrument} price {value!r} is not a multiple of tick_size"
+                f" {from_scaled_int(self.tick_size, PRICE_DECIMALS)}"
+            )
+
+    def size(
+        self, value: ScalableValue, rounding: Rounding = "exact", validate: bool = True
+    ) -> int:
+        scaled = to_scaled_int(
+            value, self.base_decimals, rounding, name=f"{self.instrument} size"
+        )
+        if validate:
+            self._check_size(scaled, value)
+        return scaled
+
+    def price(
+        self, value: ScalableValue, rounding: Rounding = "exact", validate: bool = True
+    ) -> int:
+        scaled = to_scaled_int(
+            value, PRICE_DECIMALS, rounding, name=f"{self.instrument} price"
+        )
+        if validate:
+            self._check_price(scaled, value)
+        return scaled
+
+    def sizes(
+        self,
+        values: Iterable[ScalableValue],
+        rounding: Rounding = "exact",
+        validate: bool = True,
+    ) -> list[int]:
+        values = list(values)
+        scaled = to_scaled_ints(
+            values, self.base_decimals, rounding, name=f"{self.instrument} size"
+        )
+        # One pass over the batch; the offending value is looked up on failure
+        if validate and scaled and min(scaled) < self._size_floor:
+            for scaled_size, value in zip(scaled, values):
+                self._check_size(scaled_size, value)
+        return scaled
+
+    def prices(
+        self,
+        values: Iterable[ScalableValue],
+        rounding: Rounding = "exact",
+        validate: bool = True,
+    ) -> list[int]:
+        values = list(values)
+        scaled = to_scaled_ints(
+            values, PRICE_DECIMALS, rounding, name=f"{self.instrument} price"
+        )
+        tick_size = self.tick_size
+        if validate and tick_size and any(price % tick_size for price in scaled):
+            for scaled_price, value in zip(scaled, values):
+                self._check_price(scaled_price, value)
+        return scaled
+
+
+@lru_cache(maxsize=1024)
+def get_instrument_scaler(
+    instrument: str,
+    base_decimals: int,
+    tick_size: str | None = None,
+    min_size: str | None = None,
+) -> InstrumentScaler:
+    """Return the cached scaler of an instrument."""
+    return InstrumentScaler(instrument, base_decimals, tick_size, min_size)
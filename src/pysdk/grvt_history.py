@@ -0,0 +1,390 @@
+"""
+Iterators over the cursor paginated history endpoints.
+
+History endpoints return one page of results, newest first, and a `next`
+cursor to query the page after it. The iterators here follow the cursors and
+keep the request for the next page in flight while the caller works on the
+current one: in a task for the async clients, in a thread for the sync ones.
+
+At most two pages are held, the current one and the one being fetched. With
+`max_buffered_items`, the next page is only fetched ahead when both pages fit
+in that many items, counting the next page as large as the current one; it is
+fetched once the current page is consumed otherwise.
+
+With `stop_time` (unix nanoseconds), iteration stops at the first item older
+than it and no page after that item is fetched. Setting `start_time` on the
+request makes the API stop there as well.
+
+`download_history` and `adownload_history` fetch a time range in windows
+concurrently, following the cursors inside each window, and merge the windows
+newest first without duplicates. Windows not started yet are resized after
+each one finishes, to hold about `target_window_items` items at its density.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from . import grvt_raw_types as types
+from .grvt_raw_base import GrvtError
+
+DEFAULT_MAX_BUFFERED_ITEMS = 10_000
+
+# Field holding the time of the items of each history request, in unix nanoseconds
+HISTORY_TIME_FIELDS: dict[type, tuple[str, ...]] = {
+    types.ApiFillHistoryRequest: ("event_time",),
+    types.ApiOrderHistoryRequest: ("metadata", "create_time"),
+    types.ApiTradeHistoryRequest: ("event_time",),
+    types.ApiFundingPaymentHistoryRequest: ("event_time",),
+    types.ApiTransferHistoryRequest: ("event_time",),
+    types.ApiWithdrawalHistoryRequest: ("event_time",),
+    types.ApiDepositHistoryRequest: ("initiated_time",),
+    types.ApiSubAccountHistoryRequest: ("event_time",),
+    types.ApiCandlestickRequest: ("open_time",),
+}
+DEFAULT_TIME_FIELD = ("event_time",)
+
+
+def get_time_field(req: Any) -> tuple[str, ...]:
+    """Field holding the time of the items returned for the history request `req`."""
+    return HISTORY_TIME_FIELDS.get(type(req), DEFAULT_TIME_FIELD)
+
+
+class GrvtHistoryError(Exception):
+    """A page of history could not be fetched, `error` is what the API returned."""
+
+    def __init__(self, error: Any):
+        super().__init__(f"History page request failed: {error}")
+        self.error = error
+
+
+def _get(value: Any, name: str) -> Any:
+    if isinstance(value, dict):
+        return value.get(name)
+    return getattr(value, name, None)
+
+
+def get_item_time(item: Any, time_field: tuple[str, ...]) -> int | None:
+    """Time of a history item, a dataclass or a dict; None if it has none."""
+    for name in time_field:
+        if item is None:
+            return None
+        item = _get(item, name)
+    return None if item is None else int(item)
+
+
+class _Pager:
+    """Reads the pages of one iteration and decides when to fetch the next."""
+
+    def __init__(
+        self,
+        time_field: tuple[str, ...],
+        stop_time: int | None,
+        max_buffered_items: int | None,
+    ):
+        self.time_field = time_field
+        self.stop_time = stop_time
+        self.max_buffered_items = max_buffered_items
+        self.cursor: str | None = None
+
+    def read(self, page: Any) -> tuple[list, str | None]:
+        """Items of `page` and the cursor of the next page, None after the last."""
+        if isinstance(page, GrvtError) or (isinstance(page, dict) and page.get("code")):
+            raise GrvtHistoryError(page)
+        items = _get(page, "result") or []
+        cursor = _get(page, "next") or None
+        if not items or cursor == self.cursor or self.is_past_stop(items[-1]):
+            cursor = None
+        self.cursor = cursor
+        return items, cursor
+
+    def is_past_stop(self, item: Any) -> bool:
+        if self.stop_time is None:
+            return False
+        item_time = get_item_time(item, self.time_field)
+        return item_time is not None and item_time < self.stop_time
+
+    def can_prefetch(self, items: list) -> bool:
+        bound = self.max_buffered_items
+        return bound is None or 2 * len(items) <= bound
+
+
+def iter_pages(
+    fetch: Callable[[str | None], Any],
+    stop_time: int | None = None,
+    time_field: tuple[str, ...] = DEFAULT_TIME_FIELD,
+    max_buffered_items: int | None = DEFAULT_MAX_BUFFERED_ITEMS,
+) -> Iterator[Any]:
+    """
+    Pages returned by `fetch(cursor)`, from `fetch(None)` until the last page.
+
+    Raises GrvtHistoryError for a page that is an error. Closing the generator
+    waits for the page being fetched ahead, if any.
+    """
+    pager = _Pager(time_field, stop_time, max_buffered_items)
+    executor: ThreadPoolExecutor | None = None
+    try:
+        page = fetch(None)
+        while True:
+            items, cursor = pager.read(page)
+            if cursor is None:
+                yield page
+                return
+            if pager.can_prefetch(items):
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="grvt-history"
+                    )
+                future = executor.submit(fetch, cursor)
+                yield page
+                page = future.result()
+            else:
+                yield page
+                page = fetch(cursor)
+    finally:
+        if executor is not None:
+            # A fetch already running cannot be cancelled, join its thread
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_items(
+    fetch: Callable[[str | None], Any],
+    stop_time: int | None = None,
+    time_field: tuple[str, ...] = DEFAULT_TIME_FIELD,
+    max_buffered_items: int | None = DEFAULT_MAX_BUFFERED_ITEMS,
+) -> Iterator[Any]:
+    """Items of the pages of `iter_pages`, newest first, up to `stop_time`."""
+    pager = _Pager(time_field, stop_time, None)
+    pages = iter_pages(fetch, stop_time, time_field, max_buffered_items)
+    with contextlib.closing(pages):
+        for page in pages:
+            for item in _get(page, "result") or []:
+                if pager.is_past_stop(item):
+                    return
+                yield item
+
+
+async def aiter_pages(
+    fetch: Callable[[str | None], Awaitable[Any]],
+    stop_time: int | None = None,
+    time_field: tuple[str, ...] = DEFAULT_TIME_FIELD,
+    max_buffered_items: int | None = DEFAULT_MAX_BUFFERED_ITEMS,
+) -> AsyncIterator[Any]:
+    """
+    Same as `iter_pages`, with the next page fetched ahead in a task.
+
+    Closing the generator cancels that task and waits for it to finish.
+    """
+    pager = _Pager(time_field, stop_time, max_buffered_items)
+    task: asyncio.Task | None = None
+    try:
+        page = await fetch(None)
+        while True:
+            items, cursor = pager.read(page)
+            if cursor is None:
+                yield page
+                return
+            if pager.can_prefetch(items):
+                task = asyncio.ensure_future(fetch(cursor))
+                yield page
+                page = await task
+                task = None
+            else:
+                yield page
+                page = await fetch(cursor)
+    finally:
+        if task is not None:
+            task.cancel()
+            await asyncio.wait([task])
+
+
+async def aiter_items(
+    fetch: Callable[[str | None], Awaitable[Any]],
+    stop_time: int | None = None,
+    time_field: tuple[str, ...] = DEFAULT_TIME_FIELD,
+    max_buffered_items: int | None = DEFAULT_MAX_BUFFERED_ITEMS,
+) -> AsyncIterator[Any]:
+    """Same as `iter_items`, over `aiter_pages`."""
+    pager = _Pager(time_field, stop_time, None)
+    pages = aiter_pages(fetch, stop_time, time_field, max_buffered_items)
+    async with contextlib.aclosing(pages):
+        async for page in pages:
+            for item in _get(page, "result") or []:
+                if pager.is_past_stop(item):
+                    return
+                yield item
+
+
+DEFAULT_TARGET_WINDOW_ITEMS = 5_000
+MIN_WINDOW_NS = 1_000_000_000
+
+# Fields identifying the items of each history request, to drop the duplicates
+# returned by two windows sharing a boundary
+HISTORY_KEY_FIELDS: dict[type, tuple[str, ...]] = {
+    types.ApiFillHistoryRequest: ("trade_id", "event_time"),
+    types.ApiTradeHistoryRequest: ("trade_id", "event_time"),
+    types.ApiOrderHistoryRequest: ("order_id",),
+    types.ApiFundingPaymentHistoryRequest: ("event_time", "instrument"),
+    types.ApiCandlestickRequest: ("open_time",),
+}
+
+
+def get_key_fields(req: Any) -> tuple[str, ...]:
+    """
+    Fields identifying the items returned for the history request `req`.
+
+    Raises ValueError for requests not in HISTORY_KEY_FIELDS, whose items could
+    not be told apart from others sharing their time.
+    """
+    key_fields = HISTORY_KEY_FIELDS.get(type(req))
+    if key_fields is None:
+        raise ValueError(f"No key fields to download the history of {type(req).__name__}")
+    return key_fields
+
+
+class _WindowPlan:
+    """
+    Splits [start_time, end_time] into windows, newest first, and merges their items.
+
+    Each finished window resizes the windows not started yet so that they hold
+    about `target_items` at the density it had, growing them at most twofold at a
+    time.
+    """
+
+    def __init__(
+        self,
+        start_time: int,
+        end_time: int,
+        max_concurrency: int,
+        window_ns: int | None,
+        target_items: int,
+    ):
+        if end_time < start_time:
+            raise ValueError(f"end_time {end_time} is before start_time {start_time}")
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be positive, got {max_concurrency}")
+        self.start_time = start_time
+        # Wider windows would leave requests idle, narrower ones probe the density
+        self.max_window_ns = max(
+            (end_time - start_time) // max_concurrency, MIN_WINDOW_NS
+        )
+        self.window_ns = window_ns or max(self.max_window_ns // 4, MIN_WINDOW_NS)
+        self.target_items = target_items
+        self.next_end: int | None = end_time
+        self.items: dict[int, list] = {}
+
+    def next_window(self) -> tuple[int, int] | None:
+        """Next window to fetch, as (start_time, end_time); None once all started."""
+        if self.next_end is None:
+            return None
+        end = self.next_end
+        start = max(self.start_time, end - self.window_ns)
+        # Windows share their boundary, whether the API includes it or not
+        self.next_end = start if start > self.start_time else None
+        return start, end
+
+    def add(self, start: int, end: int, items: list) -> None:
+        self.items[end] = items
+        window_ns = 2 * self.window_ns
+        if items:
+            # Shrink at once, but grow step by step in case denser data follows
+            window_ns = min((end - start) * self.target_items // len(items), window_ns)
+        self.window_ns = min(max(window_ns, MIN_WINDOW_NS), self.max_window_ns)
+
+    def merge(self, key_fields: tuple[str, ...]) -> list:
+        merged = []
+        seen = set()
+        for end in sorted(self.items, reverse=True):
+            for item in self.items[end]:
+                key = tuple(_get(item, name) for name in key_fields)
+                if key not in seen:
+                    seen.add(key)
+                    merged.append(item)
+        return merged
+
+
+def download_history(
+    get_fetch: Callable[[int, int], Callable[[str | None], Any]],
+    start_time: int,
+    end_time: int,
+    time_field: tuple[str, ...],
+    key_fields: tuple[str, ...],
+    max_concurrency: int = 8,
+    window_ns: int | None = None,
+    target_window_items: int = DEFAULT_TARGET_WINDOW_ITEMS,
+) -> list:
+    """
+    Items between `start_time` and `end_time` (unix nanoseconds), newest first.
+
+    Duplicates, items with the same `key_fields` values, are dropped, and the
+    items are fetched in time windows by `max_concurrency` threads.
+    `get_fetch(start, end)` returns the `fetch(cursor)` of the pages of a window,
+    whose cursors are followed. Raises GrvtHistoryError for a page that is an error.
+    """
+    plan = _WindowPlan(
+        start_time, end_time, max_concurrency, window_ns, target_window_items
+    )
+
+    def fetch_window(start: int, end: int) -> tuple[int, int, list]:
+        # Windows are fetched concurrently, their pages one after the other
+        fetch = get_fetch(start, end)
+        return start, end, list(iter_items(fetch, start, time_field, 0))
+
+    with ThreadPoolExecutor(max_concurrency, thread_name_prefix="grvt-history") as pool:
+        pending: set[Future] = set()
+        try:
+            while True:
+                while len(pending) < max_concurrency and (window := plan.next_window()):
+                    pending.add(pool.submit(fetch_window, *window))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    plan.add(*future.result())
+        finally:
+            for future in pending:
+                future.cancel()
+    return plan.merge(key_fields)
+
+
+async def adownload_history(
+    get_fetch: Callable[[int, int], Callable[[str | None], Awaitable[Any]]],
+    start_time: int,
+    end_time: int,
+    time_field: tuple[str, ...],
+    key_fields: tuple[str, ...],
+    max_concurrency: int = 8,
+    window_ns: int | None = None,
+    target_window_items: int = DEFAULT_TARGET_WINDOW_ITEMS,
+) -> list:
+    """Same as `download_history`, with the windows fetched in tasks."""
+    plan = _WindowPlan(
+        start_time, end_time, max_concurrency, window_ns, target_window_items
+    )
+
+    async def fetch_window(start: int, end: int) -> tuple[int, int, list]:
+        fetch = get_fetch(start, end)
+        return (
+            start,
+            end,
+            [item async for item in aiter_items(fetch, start, time_field, 0)],
+        )
+
+    pending: set[asyncio.Future] = set()
+    try:
+        while True:
+            while len(pending) < max_concurrency and (window := plan.next_window()):
+                pending.add(asyncio.ensure_future(fetch_window(*window)))
+            if not pending:
+                break
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                plan.add(*task.result())
+    finally:
+        for task in pending:
+            task.cancel()
+    return plan.merge(key_fields)
@@ -0,0 +1,301 @@
+"""
+Nonces and client order ids that do not collide across threads and processes.
+
+`IdAllocator` partitions the id space per process. Client order ids are
+partitioned by the pid, and nonces, which have room for only 1024 partitions, by
+a nonce partition each allocator registers in a lock file for as long as it
+lives. No two live allocators of one user on a host share a nonce partition.
+`SharedIdAllocator` instead reserves blocks from a counter in shared memory, for
+processes started from one parent.
+
+Client order ids are drawn from [2^63, 2^64 - 1], the range GRVT reserves for
+client machines, and nonces from [1, 2^32 - 1].
+"""
+
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from multiprocessing.context import BaseContext
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+CLIENT_ORDER_ID_MIN = 2**63
+CLIENT_ORDER_ID_MAX = 2**64 - 1
+NONCE_MAX = 2**32 - 1
+
+# Client order id: 1 | partition (23 bits, covers Linux pid_max) | counter (40 bits)
+PARTITION_BITS = 23
+_COUNTER_BITS = 63 - PARTITION_BITS
+_COUNTER_MASK = 2**_COUNTER_BITS - 1
+# Nonce: nonce partition (10 bits) | counter (22 bits)
+NONCE_PARTITION_BITS = 10
+_NONCE_COUNTER_BITS = 32 - NONCE_PARTITION_BITS
+_NONCE_PARTITION_MASK = 2**NONCE_PARTITION_BITS - 1
+_NONCE_COUNTER_MASK = 2**_NONCE_COUNTER_BITS - 1
+
+DEFAULT_PARTITION_LOCK_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "grvt-pysdk",
+    "id-partitions",
+)
+
+
+def _time_seed() -> int:
+    # Microseconds: a later process reusing a pid starts ahead of its predecessor
+    return time.time_ns() // 1_000
+
+
+class BaseIdAllocator(ABC):
+    @abstractmethod
+    def next_client_order_id(self) -> int:
+        """Return a client order id in [2^63, 2^64 - 1]."""
+
+    @abstractmethod
+    def next_nonce(self) -> int:
+        """Return a nonce in [1, 2^32 - 1]."""
+
+
+class NoncePartitionLock:
+    """
+    Exclusive hold on a nonce partition, until `release` or garbage collection.
+
+    The hold is a non-blocking lock on the file `<lock_dir>/<partition>.lock`, which
+    the OS drops when the process exits, so partitions of dead processes are free.
+    """
+
+    def __init__(self, lock_dir: str | os.PathLike, partition: int | None = None):
+        self._fd: int | None = None
+        os.makedirs(lock_dir, exist_ok=True)
+        candidates = range(2**NONCE_PARTITION_BITS) if partition is None else [partition]
+        for candidate in candidates:
+            fd = os.open(
+                os.path.join(lock_dir, f"{candidate}.lock"), os.O_RDWR | os.O_CREAT, 0o600
+            )
+            if _try_lock(fd):
+                self.partition = candidate
+                self._fd = fd
+                return
+            os.close(fd)
+        if partition is None:
+            raise RuntimeError(
+                f"All {2**NONCE_PARTITION_BITS} nonce partitions in {lock_dir} are"
+                " held; use SharedIdAllocator for this many processes"
+            )
+        raise ValueError(
+            f"Nonce partition {partition} is held by another allocator, in this or"
+            f" another process; partitions {partition} + k * 1024 share its nonces"
+        )
+
+    def release(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __del__(self) -> None:
+        self.release()
+
+
+def _try_lock(fd: int) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+class IdAllocator(BaseIdAllocator):
+    """
+    Per-process partitioned allocator; thread-safe and lock-free.
+
+    Client order ids never collide between allocators with different partitions,
+    by default the pid. Nonces repeat only after 2^22 allocations and never
+    collide between live allocators sharing `lock_dir`: each holds its nonce
+    partition there, the first free one by default. An explicit `partition` uses
+    its low 10 bits, and raises ValueError if another allocator holds them. With
+    `lock_dir=None` an explicit partition is not registered, and the caller keeps
+    the low 10 bits of the partitions of its processes distinct.
+
+    In a forked child, allocators with the default partition move to partitions
+    of their own when next used, while ones with an explicit partition raise
+    RuntimeError, as their ids would repeat the parent's.
+    """
+
+    def __init__(
+        self,
+        partition: int | None = None,
+        lock_dir: str | os.PathLike | None = DEFAULT_PARTITION_LOCK_DIR,
+    ):
+        if partition is not None and not 0 <= partition < 2**PARTITION_BITS:
+            raise ValueError(
+                f"partition must be in [0, 2^{PARTITION_BITS}), got {partition}"
+            )
+        if partition is None and lock_dir is None:
+            raise ValueError("The default partition needs a lock_dir to register in")
+        self._explicit_partition = partition
+        self._lock_dir = lock_dir
+        self._forked = False
+        self._fork_lock = threading.Lock()
+        self._init_partition()
+        _allocators.add(self)
+
+    def _init_partition(self) -> None:
+        partition = self._explicit_partition
+        self.partition = os.getpid() if partition is None else partition
+        if self._lock_dir is None:
+            self._partition_lock = None
+            self.nonce_partition = self.partition & _NONCE_PARTITION_MASK
+        else:
+            self._partition_lock = NoncePartitionLock(
+                self._lock_dir,
+                None if partition is None else partition & _NONCE_PARTITION_MASK,
+            )
+            self.nonce_partition = self._partition_lock.partition
+        seed = _time_seed()
+        # next() on itertools.count is atomic under the GIL
+        self._client_order_ids = itertools.count(seed)
+        self._nonces = itertools.count(seed)
+        self._client_order_id_base = CLIENT_ORDER_ID_MIN | (
+            self.partition << _COUNTER_BITS
+        )
+        self._nonce_base = self.nonce_partition << _NONCE_COUNTER_BITS
+
+    def _after_fork(self) -> None:
+        # The parent keeps holding its nonce partition
+        if self._partition_lock is not None:
+            self._partition_lock.release()
+        self._fork_lock = threading.Lock()
+        self._forked = True
+
+    def _leave_parent_partition(self) -> None:
+        if self._explicit_partition is not None:
+            raise RuntimeError(
+                f"IdAllocator({self._explicit_partition}) was copied into a forked"
+                " process, where its ids would repeat the parent's; create one with"
+                " another partition in the child"
+            )
+        with self._fork_lock:
+            if self._forked:
+                self._init_partition()
+                self._forked = False
+
+    def next_client_order_id(self) -> int:
+        if self._forked:
+            self._leave_parent_partition()
+        return self._client_order_id_base | (next(self._client_order_ids) & _COUNTER_MASK)
+
+    def next_nonce(self) -> int:
+        if self._forked:
+            self._leave_parent_partition()
+        nonce = self._nonce_base | (next(self._nonces) & _NONCE_COUNTER_MASK)
+        return nonce or self.next_nonce()
+
+
+_allocators: "weakref.WeakSet[IdAllocator]" = weakref.WeakSet()
+
+
+class SharedIdAllocator(BaseIdAllocator):
+    """
+    Allocator backed by a shared-memory counter.
+
+    Create it in the parent and hand it to worker processes when they start: by
+    fork, as a `Process` argument or with `set_id_allocator` as a pool
+    initializer. Each process reserves `block_size` consecutive
+    values under the counter's lock, so nonces and client order ids are unique
+    across all processes sharing the counter.
+    """
+
+    def __init__(self, block_size: int = 1024, mp_context: BaseContext | None = None):
+        if block_size < 1:
+            raise ValueError(f"block_size must be positive, got {block_size}")
+        self.block_size = block_size
+        # Memory of the "fork" context cannot be shared with spawned processes,
+        # while memory of the "spawn" context can be shared both ways
+        mp_context = mp_context or multiprocessing.get_context("spawn")
+        self._counter = mp_context.Value("Q", _time_seed())
+        self._init_local_state()
+
+    def _init_local_state(self) -> None:
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._next = 0
+        self._end = 0
+
+    def __getstate__(self) -> dict:
+        return {"block_size": self.block_size, "_counter": self._counter}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._init_local_state()
+
+    def _next_value(self) -> int:
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked: the parent's reserved block is not ours
+                self._pid = os.getpid()
+                self._next = self._end = 0
+            if self._next == self._end:
+                with self._counter.get_lock():
+                    self._next = self._counter.value
+                    self._counter.value = self._next + self.block_size
+                self._end = self._next + self.block_size
+            value = self._next
+            self._next += 1
+            return value
+
+    def next_client_order_id(self) -> int:
+        return CLIENT_ORDER_ID_MIN + (self._next_value() & (CLIENT_ORDER_ID_MIN - 1))
+
+    def next_nonce(self) -> int:
+        return self._next_value() % NONCE_MAX + 1
+
+
+_default_allocator: BaseIdAllocator | None = None
+_default_allocator_lock = threading.Lock()
+
+
+def get_id_allocator() -> BaseIdAllocator:
+    """Return the default allocator, an `IdAllocator()` unless set."""
+    global _default_allocator
+    if _default_allocator is None:
+        with _default_allocator_lock:
+            if _default_allocator is None:
+                _default_allocator = IdAllocator()
+    return _default_allocator
+
+
+def set_id_allocator(allocator: BaseIdAllocator | None) -> None:
+    """Replace the default allocator; None restores the `IdAllocator` default."""
+    global _default_allocator
+    _default_allocator = allocator
+
+
+def _reset_after_fork() -> None:
+    # A forked child must not continue the parent's partitions and counters
+    global _default_allocator, _default_allocator_lock
+    _default_allocator_lock = threading.Lock()
+    if isinstance(_default_allocator, IdAllocator):
+        _default_allocator = None
+    for allocator in list(_allocators):
+        allocator._after_fork()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def next_client_order_id() -> int:
+    return get_id_allocator().next_client_order_id()
+
+
+def next_nonce() -> int:
+    return get_id_allocator().next_nonce()
@@ -0,0 +1,169 @@
+"""
+JSON codec shared by the raw, ccxt and websocket clients.
+
+The optional `msgspec` or `orjson` packages (`pip install msgspec` or
+`pip install orjson`) encode and decode several times faster than the `json`
+module. The fastest one installed is used unless the `GRVT_JSON_BACKEND`
+environment variable or `set_json_codec` selects another. Every backend
+encodes enums as their value and dataclasses as dicts of their fields, like
+`DataclassJSONEncoder` and `EnumEncoder` do, Decimals as strings, and raises
+ValueError for NaN and infinite floats. The output has no whitespace with any
+backend.
+
+orjson decodes integers over 64 bits as floats; the API sends those as strings.
+Values a fast backend cannot encode, like those integers, are encoded by `json`.
+"""
+
+import dataclasses
+import json
+import math
+import os
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+try:
+    import msgspec
+except ImportError:  # optional dependency
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+# Errors of a fast backend that make the `json` module encode the value instead
+_FALLBACK_ERRORS: tuple[type[Exception], ...] = (TypeError, ValueError, OverflowError)
+if msgspec is not None:
+    _FALLBACK_ERRORS += (msgspec.EncodeError,)
+
+
+class JsonBackend(Enum):
+    MSGSPEC = "msgspec"
+    ORJSON = "orjson"
+    JSON = "json"
+
+
+def get_available_json_backends() -> list[JsonBackend]:
+    """Installed backends, fastest first."""
+    backends = []
+    if msgspec is not None:
+        backends.append(JsonBackend.MSGSPEC)
+    if orjson is not None:
+        backends.append(JsonBackend.ORJSON)
+    backends.append(JsonBackend.JSON)
+    return backends
+
+
+def _default(o: Any) -> Any:
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if isinstance(o, Enum):
+        return o.value
+    if isinstance(o, Decimal):
+        return str(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _enc_hook(o: Any) -> Any:
+    if isinstance(o, Enum):
+        return o.value
+    raise NotImplementedError(f"Object of type {type(o).__name__} is not supported")
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(value) for value in obj.values())
+    if isinstance(obj, list | tuple):
+        return any(_has_non_finite_float(item) for item in obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return any(
+            _has_non_finite_float(getattr(obj, field.name))
+            for field in dataclasses.fields(obj)
+        )
+    return False
+
+
+def _json_dumps(obj: Any) -> str:
+    return json.dumps(obj, default=_default, allow_nan=False, separators=(",", ":"))
+
+
+class JsonCodec:
+    """Encodes to and decodes from JSON with one backend."""
+
+    def __init__(self, backend: JsonBackend | str | None = None):
+        if backend is None:
+            backend = (
+                os.environ.get("GRVT_JSON_BACKEND") or get_available_json_backends()[0]
+            )
+        self.backend = JsonBackend(backend)
+        if self.backend not in get_available_json_backends():
+            raise ImportError(
+                f"The {self.backend.value} JSON backend is not installed: "
+                f"pip install {self.backend.value}"
+            )
+        if self.backend == JsonBackend.MSGSPEC:
+            self._encoder = msgspec.json.Encoder(
+                enc_hook=_enc_hook, decimal_format="string"
+            )
+            self._decoder = msgspec.json.Decoder()
+
+    def dumpb(self, obj: Any) -> bytes:
+        """Encode `obj` to UTF-8 JSON bytes."""
+        if self.backend != JsonBackend.JSON:
+            try:
+                if self.backend == JsonBackend.MSGSPEC:
+                    data = self._encoder.encode(obj)
+                else:
+                    data = orjson.dumps(obj, default=_default)
+            except _FALLBACK_ERRORS:
+                # Unsupported by the fast backend, e.g. integers over 64 bits
+                pass
+            else:
+                # The fast backends encode NaN and infinities as null, leave
+                # those to `json` to raise ValueError for them
+                if b"null" not in data or not _has_non_finite_float(obj):
+                    return data
+        return _json_dumps(obj).encode()
+
+    def dumps(self, obj: Any) -> str:
+        """Encode `obj` to a JSON string."""
+        if self.backend == JsonBackend.JSON:
+            return _json_dumps(obj)
+        return self.dumpb(obj).decode()
+
+    def loads(self, data: str | bytes | bytearray | memoryview) -> Any:
+        """Decode JSON text or UTF-8 bytes."""
+        if self.backend == JsonBackend.MSGSPEC:
+            return self._decoder.decode(data)
+        if self.backend == JsonBackend.ORJSON:
+            return orjson.loads(data)
+        return json.loads(data)
+
+
+_codec = JsonCodec()
+
+
+def get_json_codec() -> JsonCodec:
+    return _codec
+
+
+def set_json_codec(codec: JsonCodec) -> None:
+    """Replace the codec used by every client of this process."""
+    global _codec
+    _codec = codec
+
+
+def json_dumps(obj: Any) -> str:
+    return _codec.dumps(obj)
+
+
+def json_dumpb(obj: Any) -> bytes:
+    return _codec.dumpb(obj)
+
+
+def json_loads(data: str | bytes | bytearray | memoryview) -> Any:
+    return _codec.loads(data)
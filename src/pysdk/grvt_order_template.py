@@ -0,0 +1,287 @@
+"""
+Order templates and pre-signed quote ladders.
+
+Quotes usually differ only in leg sizes and prices. `OrderTemplate` encodes every
+other word of the EIP-712 Order struct once, from the message data produced by
+`get_order_message_data`. `PresignedOrderLadder` signs price levels ahead
+of time, so firing an order is a lookup of an already signed `Order`.
+"""
+
+import copy
+import time
+from collections import deque
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor
+
+from eth_account.messages import SignableMessage
+from eth_utils import keccak
+
+from .grvt_eip712 import EIP712StructHasher, get_EIP712_domain_separator
+from .grvt_fixed_point import InstrumentScaler, ScalableValue
+from .grvt_id_allocator import next_client_order_id, next_nonce
+from .grvt_raw_signing import (
+    EIP712_ORDER_MESSAGE_TYPE,
+    get_order_message_data,
+    set_order_signature,
+)
+from .grvt_raw_types import Instrument, Order, OrderLeg
+from .grvt_signing_context import SigningContext
+from .grvt_signing_pool import sign_messages_batch
+
+EIP712_ORDER_LEG_HASHER = EIP712StructHasher(EIP712_ORDER_MESSAGE_TYPE, "OrderLeg")
+
+# Fields of the Order struct that change between orders built from one template
+_VARIABLE_FIELDS = {"legs", "nonce", "expiration"}
+
+# Leg size and limit price, as (size, limit_price)
+LegQuote = tuple[ScalableValue, ScalableValue]
+# Leg size and limit price scaled to the integers that are signed
+ScaledLegQuote = tuple[int, int]
+
+
+class OrderTemplate:
+    """
+    Fixed order shape whose legs differ only in size and limit price.
+
+    `order` is the prototype: its sub account, flags, time in force, builder and
+    the instrument and side of every leg are kept; leg sizes, limit prices, nonce
+    and expiration are supplied per order.
+    """
+
+    def __init__(self, order: Order, instruments: dict[str, Instrument], chain_id: int):
+        self.chain_id = chain_id
+        self._prototype = copy.deepcopy(order)
+        message_data, self._hasher = get_order_message_data(order, instruments)
+        # Encoded word per struct field, None where a variable field goes
+        self._fields: list[tuple[str, bytes | None]] = [
+            (
+                name,
+                None
+                if name in _VARIABLE_FIELDS
+                else self._hasher.encode_field(name, message_data[name]),
+            )
+            for name in self._hasher.field_names
+        ]
+        self._leg_prefixes = [
+            EIP712_ORDER_LEG_HASHER.type_hash
+            + EIP712_ORDER_LEG_HASHER.encode_field("assetID", leg["assetID"])
+            for leg in message_data["legs"]
+        ]
+        self._leg_suffixes = [
+            EIP712_ORDER_LEG_HASHER.encode_field(
+                "isBuyingContract", leg["isBuyingContract"]
+            )
+            for leg in message_data["legs"]
+        ]
+        self._scalers = [
+            InstrumentScaler.from_instrument(instruments[leg.instrument])
+            for leg in order.legs
+        ]
+
+    @property
+    def num_legs(self) -> int:
+        return len(self._leg_prefixes)
+
+    def scale_legs(self, legs: Sequence[LegQuote]) -> tuple[ScaledLegQuote, ...]:
+        """Return the signed integer (size, limit price) of every leg."""
+        if len(legs) != self.num_legs:
+            raise ValueError(f"Expected {self.num_legs} legs, got {len(legs)}")
+        return tuple(
+            (scaler.size(size), scaler.price(limit_price))
+            for (size, limit_price), scaler in zip(legs, self._scalers)
+        )
+
+    def new_order(
+        self, legs: Sequence[LegQuote], nonce: int, expiration: int | str
+    ) -> Order:
+        """Return an unsigned copy of the prototype with these legs, nonce and expiry."""
+        if len(legs) != self.num_legs:
+            raise ValueError(f"Expected {self.num_legs} legs, got {len(legs)}")
+        order = copy.deepcopy(self._prototype)
+        order.legs = [
+            OrderLeg(
+                instrument=leg.instrument,
+                size=str(size),
+                is_buying_asset=leg.is_buying_asset,
+                limit_price=str(limit_price),
+            )
+            for leg, (size, limit_price) in zip(self._prototype.legs, legs)
+        ]
+        order.signature.nonce = nonce
+        order.signature.expiration = str(expiration)
+        order.signature.signer = ""
+        order.signature.r = ""
+        order.signature.s = ""
+        order.signature.v = 0
+        return order
+
+    def hash_struct(
+        self, scaled_legs: Sequence[ScaledLegQuote], nonce: int, expiration: int | str
+    ) -> bytes:
+        leg_hashes = b"".join(
+            keccak(
+                prefix
+                + EIP712_ORDER_LEG_HASHER.encode_field("contractSize", size)
+                + EIP712_ORDER_LEG_HASHER.encode_field("limitPrice", limit_price)
+                + suffix
+            )
+            for (size, limit_price), prefix, suffix in zip(
+                scaled_legs, self._leg_prefixes, self._leg_suffixes
+            )
+        )
+        variable = {
+            "legs": keccak(leg_hashes),
+            "nonce": self._hasher.encode_field("nonce", nonce),
+            "expiration": self._hasher.encode_field("expiration", expiration),
+        }
+        words = [
+            word if word is not None else variable[name] for name, word in self._fields
+        ]
+        return keccak(self._hasher.type_hash + b"".join(words))
+
+    def get_signable_message(self, order: Order) -> SignableMessage:
+        """
+        Signable message of an order built by `new_order`.
+
+        Only leg sizes and prices, nonce and expiration are read from `order`.
+        """
+        scaled_legs = self.scale_legs(
+            [(leg.size, leg.limit_price or "0") for leg in order.legs]
+        )
+        return SignableMessage(
+            version=b"\x01",
+            header=get_EIP712_domain_separator(self.chain_id),
+            body=self.hash_struct(
+                scaled_legs, order.signature.nonce, order.signature.expiration
+            ),
+        )
+
+
+class PresignedOrderLadder:
+    """
+    Orders of one template signed ahead of time, keyed by their leg quotes.
+
+    Every pre-signed order gets a fresh nonce and client order id from the id
+    allocator, and expires `ttl_secs` after it is signed. Orders with less than
+    `min_remaining_secs` left are evicted automatically on `presign` and `take`,
+    so `take` never returns an order that is about to expire. Each pre-signed
+    order is returned by `take` at most once.
+    """
+
+    def __init__(
+        self,
+        template: OrderTemplate,
+        signing_context: SigningContext,
+        ttl_secs: float = 60,
+        min_remaining_secs: float = 5,
+        executor: Executor | None = None,
+    ):
+        if ttl_secs <= min_remaining_secs:
+            raise ValueError(
+                f"ttl_secs ({ttl_secs}) must exceed "
+                f"min_remaining_secs ({min_remaining_secs})"
+            )
+        if template.chain_id != signing_context.chain_id:
+            raise ValueError(
+                f"Template chain id {template.chain_id} does not match signing"
+                f" context chain id {signing_context.chain_id}"
+            )
+        self.template = template
+        self.signing_context = signing_context
+        self.ttl_ns = int(ttl_secs * 1_000_000_000)
+        self.min_remaining_ns = int(min_remaining_secs * 1_000_000_000)
+        self.executor = executor
+        self._orders: dict[tuple[ScaledLegQuote, ...], deque[tuple[int, Order]]] = {}
+        # Earliest time at which some pre-signed order becomes too old to use
+        self._next_eviction_ns: int | None = None
+
+    def __len__(self) -> int:
+        return sum(len(orders) for orders in self._orders.values())
+
+    def presign(self, levels: Iterable[Sequence[LegQuote]], copies: int = 1) -> int:
+        """
+        Sign `copies` orders for every level of `levels`.
+
+        A level gives the (size, limit price) of each leg. Returns the number of
+        orders signed. Signing runs on `executor` when one was given, see
+        `sign_messages_batch`.
+        """
+        now_ns = time.time_ns()
+        self.evict_expired(now_ns)
+        expiration = now_ns + self.ttl_ns
+        scaled_levels = []
+        orders = []
+        for legs in levels:
+            scaled = self.template.scale_legs(legs)
+            for _ in range(copies):
+                scaled_levels.append(scaled)
+                order = self.template.new_order(legs, next_nonce(), expiration)
+                # Copies of a level must not share the prototype's client order id
+                order.metadata.client_order_id = str(next_client_order_id())
+                orders.append(order)
+        messages = [
+            SignableMessage(
+                version=b"\x01",
+                header=self.signing_context.domain_separator,
+                body=self.template.hash_struct(
+                    scaled, order.signature.nonce, order.signature.expiration
+                ),
+            )
+            for scaled, order in zip(scaled_levels, orders)
+        ]
+        if self.executor is None:
+            signatures = [
+                self.signing_context.sign_message(message) for message in messages
+            ]
+        else:
+            signatures = sign_messages_batch(
+                self.signing_context.private_key,
+                messages,
+                self.executor,
+                signer_backend=self.signing_context.signer_backend,
+            )
+        signer = self.signing_context.address
+        for scaled, order, (r, s, v) in zip(scaled_levels, orders, signatures):
+            set_order_signature(order, r, s, v, signer)
+            self._orders.setdefault(scaled, deque()).append((expiration, order))
+        if orders:
+            evict_at = expiration - self.min_remaining_ns
+            if self._next_eviction_ns is None or evict_at < self._next_eviction_ns:
+                self._next_eviction_ns = evict_at
+        return len(orders)
+
+    def take(self, legs: Sequence[LegQuote]) -> Order | None:
+        """
+        Remove and return a pre-signed order for `legs`.
+
+        Returns None if there is none that is still valid.
+        """
+        now_ns = time.time_ns()
+        if self._next_eviction_ns is not None and now_ns >= self._next_eviction_ns:
+            self.evict_expired(now_ns)
+        orders = self._orders.get(self.template.scale_legs(legs))
+        while orders:
+            expiration, order = orders.popleft()
+            if expiration - now_ns >= self.min_remaining_ns:
+                return order
+        return None
+
+    def evict_expired(self, now_ns: int | None = None) -> int:
+        """Drop orders too close to expiration; returns the number evicted."""
+        now_ns = now_ns or time.time_ns()
+        evicted = 0
+        next_eviction_ns = None
+        for key in list(self._orders):
+            orders = self._orders[key]
+            # Orders of a level are appended in expiration order
+            while orders and orders[0][0] - now_ns < self.min_remaining_ns:
+                orders.popleft()
+                evicted += 1
+            if not orders:
+                del self._orders[key]
+                continue
+            evict_at = orders[0][0] - self.min_remaining_ns
+            if next_eviction_ns is None or evict_at < next_eviction_ns:
+                next_eviction_ns = evict_at
+        self._next_eviction_ns = next_eviction_ns
+        return evicted
@@ -2,6 +2,7 @@ import dataclasses
 import json
 import logging
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -12,7 +13,37 @@ import aiohttp
 import requests  # type: ignore
 from eth_account import Account
 
-from .grvt_raw_env import GrvtEnv, GrvtEnvConfig, get_env_config
+from .grvt_auth import (
+    COOKIE_EXPIRY_MARGIN_SECS,
+    DEFAULT_COOKIE_REFRESH_AHEAD_SECS,
+    NO_REQUEST_AUTH,
+    AsyncCookieRefresher,
+    AsyncSingleFlight,
+    RequestAuth,
+    SyncAuthManager,
+)
+from .grvt_cookie_cache import CookieCache
+from .grvt_json import json_dumps, json_loads
+from .grvt_raw_decoder import DecodeMode, LazyResponse, from_dict
+from .grvt_raw_encoder import to_dict
+from .grvt_raw_env import CHAIN_IDS, GrvtEnv, GrvtEnvConfig, get_env_config
+from .grvt_raw_types import CurrencyDetail
+from .grvt_signer import SignerBackend
+from .grvt_signing_context import SigningContext
+from .grvt_transport import (
+    DEFAULT_TRANSPORT_CONFIG,
+    TransportConfig,
+    create_aiohttp_session,
+    create_requests_session,
+    get_requests_timeout,
+)
+from .grvt_warmup import (
+    AsyncKeepAlive,
+    LatencyRecorder,
+    SyncKeepAlive,
+    warm_up_async,
+    warm_up_sync,
+)
 
 
 @dataclass
@@ -22,6 +53,19 @@ class GrvtApiConfig:
     private_key: str | None
     api_key: str | None
     logger: logging.Logger | None
+    # secp256k1 backend used for signing, see grvt_signer
+    signer_backend: SignerBackend | str = SignerBackend.ETH_ACCOUNT
+    # The cookie is renewed in the background this many seconds before it
+    # expires; None renews it only when a request finds it expiring
+    cookie_refresh_ahead_secs: float | None = DEFAULT_COOKIE_REFRESH_AHEAD_SECS
+    # Directory of the cookies shared by processes using this API key, see
+    # grvt_cookie_cache.DEFAULT_COOKIE_CACHE_DIR; None disables the cache
+    cookie_cache_dir: str | None = None
+    # Connection pooling, keep-alive and timeouts of the HTTP session
+    transport: TransportConfig = DEFAULT_TRANSPORT_CONFIG
+    # What API methods return on success, unless a call passes decode=; the
+    # return annotations describe DecodeMode.DATACLASS. Errors are GrvtError.
+    decode: DecodeMode | str = DecodeMode.DATACLASS
 
 
 @dataclass
@@ -50,20 +94,136 @@ class GrvtRawBase:
         self.env: GrvtEnvConfig = get_env_config(config.env)
         self.logger: logging.Logger = config.logger or logging.getLogger(__name__)
         self._cookie: GrvtCookie | None = None
+        self._latency = LatencyRecorder()
+        self.decode = DecodeMode(config.decode)
+        self._cookie_cache: CookieCache | None = None
+        if config.cookie_cache_dir is not None:
+            self._cookie_cache = CookieCache(config.cookie_cache_dir, self.logger)
+        # Currencies by symbol, see get_currency_details
+        self._currencies: dict[str, CurrencyDetail] | None = None
+        self.signing_context: SigningContext | None = None
         if self.config.private_key is not None:
-            self.account: Account = Account.from_key(self.config.private_key)
+            self.signing_context = SigningContext.from_key(
+                self.config.private_key, CHAIN_IDS[config.env], config.signer_backend
+            )
+            self.account: Account = self.signing_context.account
+
+    def get_latency_histograms(self) -> dict[str, dict]:
+        """
+        Histograms of request latencies before and after warm_up_connections().
+
+        See grvt_warmup.LatencyHistogram.to_dict() for the format.
+        """
+        return self._latency.to_dict()
+
+    def _get_warm_up_urls(self) -> list[str]:
+        return [
+            self.env.edge.rpc_endpoint,
+            self.env.trade_data.rpc_endpoint,
+            self.env.market_data.rpc_endpoint,
+        ]
+
+    def _decode_response(self, data_class: type, resp: Any, decode: DecodeMode) -> Any:
+        if isinstance(resp, bytes):
+            return resp
+        if resp.get("code"):
+            return GrvtError(**resp)
+        if decode == DecodeMode.DICT:
+            return resp
+        if decode == DecodeMode.LAZY:
+            return LazyResponse(data_class, resp)
+        return from_dict(data_class, resp)
+
+    def _get_raw_response(self, resp_body: bytes) -> Any:
+        # Errors may be sent with a 2xx status; only bodies naming a "code" are parsed
+        if b'"code"' not in resp_body:
+            return resp_body
+        try:
+            resp_json = json_loads(resp_body)
+        except Exception:
+            return resp_body
+        if isinstance(resp_json, dict) and resp_json.get("code"):
+            return resp_json
+        return resp_body
+
+    def _check_history_decode(self, decode: DecodeMode | str | None) -> None:
+        if (self.decode if decode is None else DecodeMode(decode)) == DecodeMode.RAW:
+            raise ValueError("History iterators cannot return DecodeMode.RAW pages")
+
+    def _get_history_fetch(
+        self, call: Callable[..., Any], req: Any, decode: DecodeMode | str | None
+    ) -> Callable[[str | None], Any]:
+        """`fetch(cursor)` of grvt_history, calling `call` with `req` at `cursor`."""
+        self._check_history_decode(decode)
+
+        def fetch(cursor: str | None) -> Any:
+            if cursor is None:
+                return call(req, decode)
+            return call(dataclasses.replace(req, cursor=cursor), decode)
+
+        return fetch
+
+    def _get_history_window_fetch(
+        self, call: Callable[..., Any], req: Any, decode: DecodeMode | str | None
+    ) -> Callable[[int, int], Callable[[str | None], Any]]:
+        """`get_fetch(start, end)` of grvt_history, for `req` limited to that window."""
+        self._check_history_decode(decode)
+
+        def get_fetch(start: int, end: int) -> Callable[[str | None], Any]:
+            window_req = dataclasses.replace(
+                req, start_time=str(start), end_time=str(end), cursor=None
+            )
+            return self._get_history_fetch(call, window_req, decode)
+
+        return get_fetch
 
     """
     Cookie handling
     """
 
+    def _get_cookie_expiry(self) -> float | None:
+        if self._cookie and self._cookie.expires:
+            return self._cookie.expires.timestamp()
+        return None
+
+    def _load_cached_cookie(self) -> GrvtCookie | None:
+        """A cookie cached by another client, if it outlives the current one."""
+        if not self._cookie_cache:
+            return None
+        cached = self._cookie_cache.load(
+            self.config.env.value, str(self.config.api_key), self._get_cookie_expiry()
+        )
+        if not cached:
+            return None
+        self.logger.info(f"using cached cookie expiring at {cached['expires']}")
+        return GrvtCookie(
+            gravity=cached["gravity"],
+            expires=datetime.fromtimestamp(cached["expires"]),
+            grvt_account_id=cached["X-Grvt-Account-Id"],
+        )
+
+    def _store_cached_cookie(self, cookie: GrvtCookie) -> None:
+        if self._cookie_cache:
+            self._cookie_cache.store(
+                self.config.env.value,
+                str(self.config.api_key),
+                {
+                    "gravity": cookie.gravity,
+                    "expires": cookie.expires.timestamp(),
+                    "X-Grvt-Account-Id": cookie.grvt_account_id,
+                },
+            )
+
     def _should_refresh_cookie(self) -> bool:
         if not self.config.api_key:
             raise ValueError("Attempting to use Authenticated API without API key set")
         time_till_expiration = None
         if self._cookie and self._cookie.expires:
             time_till_expiration = self._cookie.expires.timestamp() - time.time()
-        is_cookie_fresh = time_till_expiration is not None and time_till_expiration > 5
+        is_cookie_fresh = (
+            time_till_expiration is not None
+            and time_till_expiration > COOKIE_EXPIRY_MARGIN_SECS
+        )
         if not is_cookie_fresh:
             self.logger.info(
                 f"cookie should be refreshed now={time.time()}"
@@ -76,29 +236,79 @@ class GrvtRawSyncBase(GrvtRawBase):
     def __init__(self, config: GrvtApiConfig):
         super().__init__(config)
         # Sync API session
-        self._session: requests.Session = requests.Session()
-        self._session.headers.update({"Content-Type": "application/json"})
+        self._session: requests.Session = create_requests_session(config.transport)
+        self._timeout = get_requests_timeout(config.transport)
+        self._keep_alive: SyncKeepAlive | None = None
+        # The session is shared by all threads using this client, so the cookie
+        # is not stored in it but sent with each request
+        self._request_auth: RequestAuth = NO_REQUEST_AUTH
+        self._auth = SyncAuthManager(
+            self._should_refresh_cookie,
+            self._login,
+            self._get_cookie_expiry,
+            config.cookie_refresh_ahead_secs,
+            self.logger,
+        )
+
+    def close(self) -> None:
+        """Stop the background cookie refresh and keep-alive, and close the session."""
+        self._auth.stop()
+        if self._keep_alive:
+            self._keep_alive.stop()
+        self._session.close()
+
+    def warm_up_connections(self) -> int:
+        """
+        Open pooled connections to the edge, trade-data and market-data hosts.
+
+        config.transport.warm_up_connections_per_host connections are opened to
+        each host, then kept open with probes while idle if keep_alive_probe_secs
+        is set. Returns the number of successful probes.
+        """
+        transport = self.config.transport
+        urls = self._get_warm_up_urls()
+        per_host = transport.warm_up_connections_per_host
+        opened = warm_up_sync(self._session, urls, per_host, self._timeout, self.logger)
+        self._latency.mark_warm()
+        if transport.keep_alive_probe_secs is not None:
+            if self._keep_alive is None:
+                self._keep_alive = SyncKeepAlive(
+                    self._session,
+                    urls,
+                    per_host,
+                    transport.keep_alive_probe_secs,
+                    self._timeout,
+                    self._latency,
+                    self.logger,
+                )
+            self._keep_alive.ensure_started()
+        return opened
 
     """
     Cookie handling
     """
 
-    def _refresh_cookie(self) -> None:
-        if not self._should_refresh_cookie():
-            return None
+    def _refresh_cookie(self, force: bool = False) -> None:
+        # Thread-safe, concurrent callers wait for one login
+        self._auth.refresh(force)
+
+    def _login(self) -> None:
         # Get cookie
-        self._cookie = self._get_cookie(
-            self.env.edge.rpc_endpoint + "/auth/api_key/login", str(self.config.api_key)
-        )
-        self.logger.info(f"refresh_cookie cookie={self._cookie}")
-        # Update cookie in session
-        if self._cookie:
-            self._session.cookies.update({"gravity": self._cookie.gravity})
-            if self._cookie.grvt_account_id:
-                self._session.headers.update(
-                    {"X-Grvt-Account-Id": self._cookie.grvt_account_id}
-                )
-        return None
+        cookie = self._load_cached_cookie()
+        if not cookie:
+            cookie = self._get_cookie(
+                self.env.edge.rpc_endpoint + "/auth/api_key/login",
+                str(self.config.api_key),
+            )
+            if cookie:
+                self._store_cached_cookie(cookie)
+        self.logger.info(f"refresh_cookie cookie={cookie}")
+        if cookie:
+            headers = {}
+            if cookie.grvt_account_id:
+                headers["X-Grvt-Account-Id"] = cookie.grvt_account_id
+            self._request_auth = RequestAuth({"gravity": cookie.gravity}, headers)
+        self._cookie = cookie
 
     def _get_cookie(self, path: str, api_key: str) -> GrvtCookie | None:
         FN = f"_get_cookie {path=}"
@@ -107,7 +317,7 @@ class GrvtRawSyncBase(GrvtRawBase):
                 path,
                 json={"api_key": api_key},
                 headers={"Content-Type": "application/json"},
-                timeout=5,
+                timeout=self._timeout,
             )
             self.logger.info(f"{FN} {return_value=}")
             if return_value.ok:
@@ -141,25 +351,57 @@ class GrvtRawSyncBase(GrvtRawBase):
     Post handling
     """
 
-    def _post(self, is_auth: bool, path: str, req: Any) -> Any:
+    def _call(
+        self,
+        is_auth: bool,
+        path: str,
+        req: Any,
+        data_class: type,
+        decode: DecodeMode | str | None,
+    ) -> Any:
+        mode = self.decode if decode is None else DecodeMode(decode)
+        resp = self._post(is_auth, path, req, raw=mode == DecodeMode.RAW)
+        return self._decode_response(data_class, resp, mode)
+
+    def _post(self, is_auth: bool, path: str, req: Any, raw: bool = False) -> Any:
+        """
+        Parsed JSON response, {} if it is not JSON.
+
+        With `raw`, the body bytes of a successful response are returned unparsed,
+        unless they hold an error `code`.
+        """
         FN = f"_post {path=}"
         # Always see if need to referesh cookie before sending an authenticated request
         if is_auth:
             self._refresh_cookie()
 
-        req_json = json.dumps(req, cls=DataclassJSONEncoder)
+        req_json = json_dumps(to_dict(req))
         resp_json: Any = {}
 
         self.logger.debug(f"{FN} {req_json=}")
-        resp: requests.Response = self._session.post(path, data=req_json, timeout=5)
+        auth = self._request_auth
+        start = time.perf_counter()
+        resp: requests.Response = self._session.post(
+            path,
+            data=req_json,
+            cookies=auth.cookies,
+            headers=auth.headers,
+            timeout=self._timeout,
+        )
+        self._latency.record(time.perf_counter() - start)
+        # Parse the body bytes once; resp.text would decode them to a str first
+        resp_body = resp.content
+        if raw and resp.ok:
+            return self._get_raw_response(resp_body)
         try:
-            resp_json = resp.json()
+            resp_json = json_loads(resp_body)
             if not resp.ok:
                 self.logger.warning(f"{FN} Error {resp_json=}")
-            else:
+            elif self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(f"{FN} OK {resp_json=}")
         except Exception as err:
-            self.logger.error(f"{FN} Unable to parse {resp.text=} as json:{err=}")
+            resp_text = resp_body.decode(errors="replace")
+            self.logger.error(f"{FN} Unable to parse {resp_text=} as json:{err=}")
         return resp_json
 
 
@@ -167,22 +409,73 @@ class GrvtRawAsyncBase(GrvtRawBase):
     def __init__(self, config: GrvtApiConfig):
         super().__init__(config)
         # Async API session
-        self._session: aiohttp.ClientSession = aiohttp.ClientSession(
-            headers={"Content-Type": "application/json"}
-        )
+        self._session: aiohttp.ClientSession = create_aiohttp_session(config.transport)
+        self._keep_alive: AsyncKeepAlive | None = None
+        self._login_flight = AsyncSingleFlight()
+        self._cookie_refresher: AsyncCookieRefresher | None = None
+        if config.cookie_refresh_ahead_secs is not None:
+            self._cookie_refresher = AsyncCookieRefresher(
+                lambda: self._refresh_cookie(force=True),
+                self._get_cookie_expiry,
+                config.cookie_refresh_ahead_secs,
+                self.logger,
+            )
+
+    async def close(self) -> None:
+        """Stop the background cookie refresh and keep-alive, and close the session."""
+        if self._cookie_refresher:
+            self._cookie_refresher.stop()
+        if self._keep_alive:
+            self._keep_alive.stop()
+        await self._session.close()
+
+    async def warm_up_connections(self) -> int:
+        """
+        Open pooled connections to the edge, trade-data and market-data hosts.
+
+        config.transport.warm_up_connections_per_host connections are opened to
+        each host, then kept open with probes while idle if keep_alive_probe_secs
+        is set. Returns the number of successful probes.
+        """
+        transport = self.config.transport
+        urls = self._get_warm_up_urls()
+        per_host = transport.warm_up_connections_per_host
+        opened = await warm_up_async(self._session, urls, per_host, self.logger)
+        self._latency.mark_warm()
+        if transport.keep_alive_probe_secs is not None:
+            if self._keep_alive is None:
+                self._keep_alive = AsyncKeepAlive(
+                    self._session,
+                    urls,
+                    per_host,
+                    transport.keep_alive_probe_secs,
+                    self._latency,
+                    self.logger,
+                )
+            self._keep_alive.ensure_started()
+        return opened
 
     """
     Cookie handling
     """
 
-    async def _refresh_cookie(self) -> None:
-        if not self._should_refresh_cookie():
-            return None
+    async def _refresh_cookie(self, force: bool = False) -> None:
+        if not force and not self._should_refresh_cookie():
+            return
+        # Concurrent callers share one login
+        await self._login_flight.run(self._login)
 
+    async def _login(self) -> None:
         # Get cookie
-        self._cookie = await self._get_cookie(
-            self.env.edge.rpc_endpoint + "/auth/api_key/login", str(self.config.api_key)
-        )
+        cookie = self._load_cached_cookie()
+        if not cookie:
+            cookie = await self._get_cookie(
+                self.env.edge.rpc_endpoint + "/auth/api_key/login",
+                str(self.config.api_key),
+            )
+            if cookie:
+                self._store_cached_cookie(cookie)
+        self._cookie = cookie
         self.logger.info(f"refresh_cookie cookie={self._cookie}")
 
         # Update cookie in session
@@ -192,38 +485,39 @@ class GrvtRawAsyncBase(GrvtRawBase):
                 self._session.headers.update(
                     {"X-Grvt-Account-Id": self._cookie.grvt_account_id}
                 )
-        return None
+            if self._cookie_refresher:
+                self._cookie_refresher.ensure_started()
 
     async def _get_cookie(self, path: str, api_key: str) -> GrvtCookie | None:
         FN = f"_get_cookie {path=}"
         try:
             data = {"api_key": api_key}
             self.logger.info(f"{FN} ask for cookie {path=} {data=}")
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url=path, json=data, timeout=5) as return_value:
-                    self.logger.info(f"{FN} {return_value=}")
-                    if return_value.ok:
-                        cookie = SimpleCookie()
-                        cookie_header = return_value.headers.get("Set-Cookie")
-                        grvt_cookie = return_value.cookies.get("gravity")
-                        self.logger.info(
-                            f"{FN} OK {return_value.headers=} \n "
-                            f"{return_value.cookies=}\n{grvt_cookie=}\n{cookie_header=}"
-                        )
-                        cookie.load(cookie_header)
-                        cookie_value = cookie["gravity"].value
-                        cookie_expiry = datetime.strptime(
-                            cookie["gravity"]["expires"],
-                            "%a, %d %b %Y %H:%M:%S %Z",
-                        )
-                        grvt_account_id: str | None = return_value.headers.get(
-                            "X-Grvt-Account-Id"
-                        )
-                        return GrvtCookie(
-                            gravity=cookie_value,
-                            expires=cookie_expiry,
-                            grvt_account_id=grvt_account_id,
-                        )
+            # Through the shared session, which keeps the edge connection open
+            async with self._session.post(url=path, json=data) as return_value:
+                self.logger.info(f"{FN} {return_value=}")
+                if return_value.ok:
+                    cookie = SimpleCookie()
+                    cookie_header = return_value.headers.get("Set-Cookie")
+                    grvt_cookie = return_value.cookies.get("gravity")
+                    self.logger.info(
+                        f"{FN} OK {return_value.headers=} \n "
+                        f"{return_value.cookies=}\n{grvt_cookie=}\n{cookie_header=}"
+                    )
+                    cookie.load(cookie_header)
+                    cookie_value = cookie["gravity"].value
+                    cookie_expiry = datetime.strptime(
+                        cookie["gravity"]["expires"],
+                        "%a, %d %b %Y %H:%M:%S %Z",
+                    )
+                    grvt_account_id: str | None = return_value.headers.get(
+                        "X-Grvt-Account-Id"
+                    )
+                    return GrvtCookie(
+                        gravity=cookie_value,
+                        expires=cookie_expiry,
+                        grvt_account_id=grvt_account_id,
+                    )
             return None
         except Exception as e:
             self.logger.error(f"{FN} Error getting cookie: {e}")
@@ -233,27 +527,50 @@ class GrvtRawAsyncBase(GrvtRawBase):
     Post handling
     """
 
-    async def _post(self, is_auth: bool, path: str, req: Any) -> Any:
+    async def _call(
+        self,
+        is_auth: bool,
+        path: str,
+        req: Any,
+        data_class: type,
+        decode: DecodeMode | str | None,
+    ) -> Any:
+        mode = self.decode if decode is None else DecodeMode(decode)
+        resp = await self._post(is_auth, path, req, raw=mode == DecodeMode.RAW)
+        return self._decode_response(data_class, resp, mode)
+
+    async def _post(self, is_auth: bool, path: str, req: Any, raw: bool = False) -> Any:
+        """
+        Parsed JSON response, {} if it is not JSON.
+
+        With `raw`, the body bytes of a successful response are returned unparsed,
+        unless they hold an error `code`.
+        """
         FN = f"_post {path=}"
         # Always see if need to referesh cookie before sending an authenticated request
         if is_auth:
             await self._refresh_cookie()
 
-        req_json = json.dumps(req, cls=DataclassJSONEncoder)
+        req_json = json_dumps(to_dict(req))
         resp_json: Any = {}
 
         self.logger.debug(f"{FN} {req_json=}")
-        resp: aiohttp.ClientResponse = await self._session.post(
-            path, data=req_json, timeout=5
-        )
+        start = time.perf_counter()
+        resp: aiohttp.ClientResponse = await self._session.post(path, data=req_json)
+        self._latency.record(time.perf_counter() - start)
+        resp_body = b""
         try:
-            resp_text = await resp.text()
-            resp_json = json.loads(resp_text)
+            # Parse the body bytes once; the text is only built to be logged
+            resp_body = await resp.read()
+            if raw and resp.ok:
+                return self._get_raw_response(resp_body)
+            resp_json = json_loads(resp_body)
             if not resp.ok:
-                self.logger.warning(f"{FN} Error {resp_text=}")
-            else:
-                self.logger.debug(f"{FN} OK {resp_text=}")
+                self.logger.warning(f"{FN} Error {resp_json=}")
+            elif self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"{FN} OK {resp_json=}")
         except Exception as err:
+            resp_text = resp_body.decode(errors="replace")
             self.logger.error(f"{FN} Unable to parse {resp_text=} as json:{err=}")
         return resp_json
 
@@ -0,0 +1,247 @@
+"""
+Response decoders for the dataclasses of `grvt_raw_types`.
+
+`from_dict(Type, data)` builds the same object as
+`dacite.from_dict(Type, data, Config(cast=[Enum]))`, with a decoder compiled
+once per dataclass instead of walking its type hints on every call. Each
+decoder is generated Python code specialized for the fields of its class:
+scalars are type checked, enums cast, nested dataclasses and lists decoded by
+their own compiled decoders, and missing fields take their defaults.
+
+Data that does not match the type hints is decoded again by dacite, so errors
+are the ones dacite raises. Field types a decoder cannot be compiled for are
+always decoded by dacite.
+
+`DecodeMode` selects what the raw clients return instead of dataclasses: the
+parsed dict, a `LazyResponse` decoding fields on access, or the body bytes.
+"""
+
+import dataclasses
+import functools
+import typing
+from collections.abc import Callable
+from enum import Enum
+from typing import Any
+
+from dacite import Config
+from dacite import from_dict as dacite_from_dict
+
+from .grvt_codegen import CodeCompiler, get_optional_arg
+
+DACITE_CONFIG = Config(cast=[Enum])
+_MISSING = object()
+_SCALAR_TYPES = (str, int, bool)
+
+
+class _Mismatch(Exception):
+    """Data does not match the type hints; dacite raises the actual error."""
+
+
+class _Unsupported(TypeError):
+    pass
+
+
+class _DecoderCompiler(CodeCompiler):
+    """Generates the statements converting one variable."""
+
+    def __init__(self) -> None:
+        super().__init__(_Mismatch=_Mismatch, _MISSING=_MISSING)
+
+    def convert(self, type_: Any, var: str, indent: str) -> list[str]:
+        if type_ is Any:
+            return []
+        if type_ in _SCALAR_TYPES:
+            return [
+                f"{indent}if not isinstance({var}, {type_.__name__}):",
+                f"{indent}    raise _Mismatch",
+            ]
+        if isinstance(type_, type) and issubclass(type_, Enum):
+            # A lookup of the member is several times faster than calling the enum
+            members = self.add_global(type_._value2member_map_)
+            enum = self.add_global(type_)
+            return [
+                f"{indent}member = {members}.get({var})",
+                f"{indent}{var} = {enum}({var}) if member is None else member",
+            ]
+        if dataclasses.is_dataclass(type_):
+            decoder = self.add_global(get_decoder(type_))
+            return [
+                f"{indent}if not isinstance({var}, dict):",
+                f"{indent}    raise _Mismatch",
+                f"{indent}{var} = {decoder}({var})",
+            ]
+        if typing.get_origin(type_) is list:
+            (item_type,) = typing.get_args(type_) or (Any,)
+            lines = [
+                f"{indent}if not isinstance({var}, list):",
+                f"{indent}    raise _Mismatch",
+            ]
+            if self.convert(item_type, "item", ""):
+                converter = self.add_global(_get_converter(item_type))
+                return lines + [f"{indent}{var} = [{converter}(item) for item in {var}]"]
+            return lines + [f"{indent}{var} = list({var})"]
+        optional_arg = get_optional_arg(type_)
+        if optional_arg is not None:
+            inner = self.convert(optional_arg, var, indent + "    ")
+            return [f"{indent}if {var} is not None:", *inner] if inner else []
+        raise _Unsupported(f"field type {type_}")
+
+
+@functools.cache
+def _get_converter(type_: Any) -> Callable[[Any], Any]:
+    compiler = _DecoderCompiler()
+    body = compiler.convert(type_, "value", "    ")
+    return compiler.build("convert", ["def convert(value):", *body, "    return value"])
+
+
+def _add_field_lines(
+    compiler: _DecoderCompiler,
+    lines: list[str],
+    var: str,
+    field: dataclasses.Field,
+    type_: Any,
+) -> None:
+    if not field.init:
+        raise _Unsupported(f"init=False field {field.name}")
+    lines.append(f"    {var} = data.get({field.name!r}, _MISSING)")
+    lines.append(f"    if {var} is _MISSING:")
+    if field.default is not dataclasses.MISSING:
+        lines.append(f"        {var} = {compiler.add_global(field.default)}")
+    elif field.default_factory is not dataclasses.MISSING:
+        factory = compiler.add_global(field.default_factory)
+        lines.append(f"        {var} = {factory}()")
+    elif get_optional_arg(type_) is not None:
+        lines.append(f"        {var} = None")
+    else:
+        lines.append("        raise _Mismatch")
+    convert = compiler.convert(type_, var, "        ")
+    if convert:
+        lines.append("    else:")
+        lines.extend(convert)
+
+
+def _compile_decoder(data_class: type) -> Callable[[dict], Any]:
+    compiler = _DecoderCompiler()
+    hints = typing.get_type_hints(data_class)
+    lines = ["def decode(data):"]
+    kwargs = []
+    for index, field in enumerate(dataclasses.fields(data_class)):
+        var = f"v{index}"
+        _add_field_lines(compiler, lines, var, field, hints[field.name])
+        kwargs.append(f"{field.name}={var}")
+    cls = compiler.add_global(data_class)
+    lines.append(f"    return {cls}({', '.join(kwargs)})")
+    return compiler.build("decode", lines)
+
+
+@functools.cache
+def _get_field_decoders(data_class: type) -> dict[str, Callable[[dict], Any]]:
+    """Compiled decoder of each field of `data_class`, for `LazyResponse`."""
+    hints = typing.get_type_hints(data_class)
+    decoders = {}
+    for field in dataclasses.fields(data_class):
+        compiler = _DecoderCompiler()
+        lines = ["def decode(data):"]
+        try:
+            _add_field_lines(compiler, lines, "value", field, hints[field.name])
+        except _Unsupported:
+            decoders[field.name] = functools.partial(
+                _dacite_field, data_class, field.name
+            )
+            continue
+        lines.append("    return value")
+        decoders[field.name] = compiler.build("decode", lines)
+    return decoders
+
+
+def _dacite_field(data_class: type, name: str, data: dict) -> Any:
+    return getattr(dacite_from_dict(data_class, data, DACITE_CONFIG), name)
+
+
+@functools.cache
+def get_decoder(data_class: type) -> Callable[[dict], Any]:
+    """
+    Compiled decoder of `data_class`.
+
+    It raises on data not matching the type hints, where `from_dict` falls back
+    to dacite.
+    """
+    try:
+        return _compile_decoder(data_class)
+    except _Unsupported:
+
+        def decode(data: dict) -> Any:
+            return dacite_from_dict(data_class, data, DACITE_CONFIG)
+
+        return decode
+
+
+def from_dict(data_class: type, data: dict) -> Any:
+    """Same as `dacite.from_dict(data_class, data, Config(cast=[Enum]))`, faster."""
+    try:
+        return get_decoder(data_class)(data)
+    except Exception:
+        # Let dacite build the value, or raise the error it would have raised
+        return dacite_from_dict(data_class, data, DACITE_CONFIG)
+
+
+class DecodeMode(Enum):
+    """What the methods of the raw clients return for a successful response."""
+
+    # Dataclass of grvt_raw_types, as annotated
+    DATACLASS = "dataclass"
+    # Parsed JSON dict, as sent by the API
+    DICT = "dict"
+    # LazyResponse decoding each field of the dataclass on first access
+    LAZY = "lazy"
+    # Response body bytes, not parsed
+    RAW = "raw"
+
+
+class LazyResponse:
+    """
+    Read-only view of a response dict as a `data_class` instance.
+
+    Each field is decoded on first access to the value `from_dict` would give
+    it, so fields that are never read cost nothing.
+    """
+
+    __slots__ = ("_values", "data", "data_class")
+
+    def __init__(self, data_class: type, data: dict):
+        self.data_class = data_class
+        self.data = data
+        self._values: dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        # Private and dunder lookups, e.g. by copy and pickle before __init__ ran,
+        # must not reach the field decoders or self._values
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        decoder = _get_field_decoders(self.data_class).get(name)
+        if decoder is None:
+            raise AttributeError(f"{self.data_class.__name__} has no field {name!r}")
+        try:
+            value = decoder(self.data)
+        except Exception:
+            value = _dacite_field(self.data_class, name, self.data)
+        self._values[name] = value
+        return value
+
+    def __reduce__(self) -> tuple:
+        return LazyResponse, (self.data_class, self.data)
+
+    def to_dataclass(self) -> Any:
+        return from_dict(self.data_class, self.data)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyResponse):
+            return self.data_class is other.data_class and self.data == other.data
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazyResponse({self.data_class.__name__}, {self.data!r})"
@@ -0,0 +1,95 @@
+"""
+Request encoders for the dataclasses of `grvt_raw_types`.
+
+`to_dict(request)` builds the JSON-ready dict of a request with an encoder
+compiled once per dataclass, reading its fields directly instead of deep
+copying the request like `dataclasses.asdict`. Enums are encoded as their
+value inline. Every field is sent, None as null, so the JSON is the same as
+`DataclassJSONEncoder` makes.
+
+Values that do not match the type hints, like a str given for an enum field or
+a dict for a nested dataclass, are encoded by their runtime type instead.
+"""
+
+import dataclasses
+import functools
+import typing
+from collections.abc import Callable
+from enum import Enum
+from typing import Any
+
+from .grvt_codegen import CodeCompiler, get_optional_arg
+
+_SCALAR_TYPES = (str, int, bool)
+
+
+def encode_value(value: Any) -> Any:
+    """JSON-ready copy of `value`, encoding dataclasses with their compiled encoder."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return get_encoder(type(value))(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, list | tuple):
+        return [encode_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: encode_value(item) for key, item in value.items()}
+    return value
+
+
+class _EncoderCompiler(CodeCompiler):
+    """Generates the expressions encoding one variable."""
+
+    def __init__(self) -> None:
+        super().__init__(encode_value=encode_value)
+
+    def encode(self, type_: Any, var: str, depth: int = 0) -> str | None:
+        """Expression encoding `var`, None if it is encoded as is."""
+        if type_ in _SCALAR_TYPES:
+            return None
+        if isinstance(type_, type) and issubclass(type_, Enum):
+            enum = self.add_global(type_)
+            return f"({var}.value if {var}.__class__ is {enum} else {var})"
+        if dataclasses.is_dataclass(type_):
+            encoder = self.add_global(get_encoder(type_))
+            cls = self.add_global(type_)
+            return (
+                f"({encoder}({var}) if {var}.__class__ is {cls} else encode_value({var}))"
+            )
+        if typing.get_origin(type_) is list:
+            (item_type,) = typing.get_args(type_) or (Any,)
+            item = f"item{depth}"
+            item_expr = self.encode(item_type, item, depth + 1)
+            items = var if item_expr is None else f"[{item_expr} for {item} in {var}]"
+            return f"({items} if {var}.__class__ is list else encode_value({var}))"
+        optional_arg = get_optional_arg(type_)
+        if optional_arg is not None:
+            # None encodes to None with every expression above, and the unions
+            # left of several types are encoded by their runtime type
+            return self.encode(optional_arg, var, depth)
+        return f"encode_value({var})"
+
+
+def _compile_encoder(data_class: type) -> Callable[[Any], dict]:
+    compiler = _EncoderCompiler()
+    hints = typing.get_type_hints(data_class)
+    lines = ["def encode(obj):", "    out = {}"]
+    for field in dataclasses.fields(data_class):
+        type_ = hints[field.name]
+        expr = compiler.encode(type_, "value") or "value"
+        lines.append(f"    value = obj.{field.name}")
+        lines.append(f"    out[{field.name!r}] = {expr}")
+    lines.append("    return out")
+    return compiler.build("encode", lines)
+
+
+@functools.cache
+def get_encoder(data_class: type) -> Callable[[Any], dict]:
+    """Compiled encoder of `data_class` instances."""
+    return _compile_encoder(data_class)
+
+
+def to_dict(request: Any) -> Any:
+    """JSON-ready dict of a request dataclass, other values are returned as they are."""
+    if dataclasses.is_dataclass(request) and not isinstance(request, type):
+        return get_encoder(type(request))(request)
+    return request
@@ -9,6 +9,17 @@ class GrvtEnv(Enum):
     PROD = "prod"
 
 
+#####################
+# EIP-712 chain IDs #
+#####################
+CHAIN_IDS = {
+    GrvtEnv.DEV: 327,
+    GrvtEnv.STAGING: 327,
+    GrvtEnv.TESTNET: 326,
+    GrvtEnv.PROD: 325,
+}
+
+
 @dataclass
 class GrvtEndpointConfig:
     rpc_endpoint: str
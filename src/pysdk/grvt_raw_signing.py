@@ -1,14 +1,21 @@
+from concurrent.futures import Executor
 from enum import Enum
-from decimal import Decimal
 from typing import Any, Optional
 
 from eth_account import Account
-from eth_account.messages import encode_typed_data
+from eth_account.messages import SignableMessage
 
 from .grvt_ccxt_utils import GrvtCurrency
-from .grvt_raw_base import GrvtApiConfig, GrvtEnv
-from .grvt_raw_types import Instrument, Order, Withdrawal, TimeInForce
+from .grvt_eip712 import EIP712StructHasher, get_EIP712_signable_message
+from .grvt_fixed_point import InstrumentScaler, to_scaled_int
 from .grvt_fixed_types import Transfer
+from .grvt_id_allocator import next_client_order_id, next_nonce
+from .grvt_raw_base import GrvtApiConfig, GrvtEnv
+from .grvt_raw_env import CHAIN_IDS
+from .grvt_raw_types import CurrencyDetail, Instrument, Order, TimeInForce, Withdrawal
+from .grvt_signature_cache import SignatureCache, get_signature_cache_key
+from .grvt_signing_context import SigningContext
+from .grvt_signing_pool import sign_messages_batch
 
 #########################
 # INSTRUMENT CONVERSION #
@@ -33,17 +40,6 @@ TIME_IN_FORCE_TO_SIGN_TIME_IN_FORCE = {
 }
 
 
-#####################
-# EIP-712 chain IDs #
-#####################
-CHAIN_IDS = {
-    GrvtEnv.DEV: 327,
-    GrvtEnv.STAGING: 327,
-    GrvtEnv.TESTNET: 326,
-    GrvtEnv.PROD: 325,
-}
-
-
 def get_EIP712_domain_data(env: GrvtEnv, chainId: int | None) -> dict[str, str | int]:
     return {
         "name": "GRVT Exchange",
@@ -103,8 +99,18 @@ EIP712_ORDER_WITH_BUILDER_FEE_MESSAGE_TYPE = {
     ],
 }
 
+# Compiled once at import; see grvt_eip712 for why encode_typed_data is avoided
+EIP712_ORDER_HASHER = EIP712StructHasher(EIP712_ORDER_MESSAGE_TYPE)
+EIP712_ORDER_WITH_BUILDER_FEE_HASHER = EIP712StructHasher(
+    EIP712_ORDER_WITH_BUILDER_FEE_MESSAGE_TYPE
+)
+
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 
+# Token decimals assumed by sign_transfer and sign_withdrawal (USDT has 6 decimals);
+# the batch methods take them from get_currency_v1 instead
+USDT_DECIMALS = 6
+
 
 def _has_builder(order: Order) -> bool:
     """Check if the order has a non-zero builder address."""
@@ -116,38 +122,125 @@ def _has_builder(order: Order) -> bool:
     )
 
 
+def get_order_message_data(
+    order: Order, instruments: dict[str, Instrument]
+) -> tuple[dict[str, Any], EIP712StructHasher]:
+    """Return the EIP-712 message data of `order` and the hasher of its struct."""
+    if _has_builder(order):
+        message_data = build_EIP712_order_with_builder_fee_message_data(
+            order, instruments
+        )
+        return message_data, EIP712_ORDER_WITH_BUILDER_FEE_HASHER
+    return build_EIP712_order_message_data(order, instruments), EIP712_ORDER_HASHER
+
+
+def _get_order_signable_message(
+    order: Order, chain_id: int, instruments: dict[str, Instrument]
+) -> SignableMessage:
+    message_data, hasher = get_order_message_data(order, instruments)
+    return get_EIP712_signable_message(chain_id, hasher, message_data)
+
+
+def set_order_signature(order: Order, r: int, s: int, v: int, signer: str) -> None:
+    """Store the (r, s, v) signature of `order` and the address that signed it."""
+    order.signature.s = "0x" + s.to_bytes(32, byteorder="big").hex()
+    order.signature.r = "0x" + r.to_bytes(32, byteorder="big").hex()
+    order.signature.v = v
+    order.signature.signer = signer
+
+
+def _assign_order_ids(order: Order) -> None:
+    # Unset (zero or empty) ids come from the id allocator of grvt_id_allocator
+    if not order.signature.nonce:
+        order.signature.nonce = next_nonce()
+    if order.metadata is not None and not order.metadata.client_order_id:
+        order.metadata.client_order_id = str(next_client_order_id())
+
+
 def sign_order(
     order: Order,
     config: GrvtApiConfig,
     account: Account,
     instruments: dict[str, Instrument],
+    signing_context: SigningContext | None = None,
+    signature_cache: SignatureCache | None = None,
 ) -> Order:
+    """
+    Sign `order` in place.
+
+    When `signing_context` is given its signer backend, address and chain id are
+    used instead of `account` and `config.env`. A zero nonce and an empty
+    `metadata.client_order_id` are filled in from the id allocator first.
+    With `signature_cache`, an order signed before with the same content, nonce
+    and expiration reuses its signature.
+    """
     if config.private_key is None:
         raise ValueError("Private key is not set")
+    _assign_order_ids(order)
 
-    domain_data = get_EIP712_domain_data(config.env, CHAIN_IDS[config.env])
-
-    if _has_builder(order):
-        message_data = build_EIP712_order_with_builder_fee_message_data(
-            order, instruments
-        )
-        signable_message = encode_typed_data(
-            domain_data, EIP712_ORDER_WITH_BUILDER_FEE_MESSAGE_TYPE, message_data
-        )
+    if signing_context is not None:
+        chain_id, signer = signing_context.chain_id, signing_context.address
     else:
-        message_data = build_EIP712_order_message_data(order, instruments)
-        signable_message = encode_typed_data(
-            domain_data, EIP712_ORDER_MESSAGE_TYPE, message_data
-        )
+        chain_id, signer = CHAIN_IDS[config.env], str(account.address)
+    message_data, hasher = get_order_message_data(order, instruments)
+    cache_key = None
+    if signature_cache is not None:
+        cache_key = get_signature_cache_key(chain_id, signer, message_data)
+        signature = signature_cache.get(cache_key)
+        if signature is not None:
+            set_order_signature(order, *signature, signer)
+            return order
+
+    signable_message = get_EIP712_signable_message(chain_id, hasher, message_data)
+    if signing_context is not None:
+        r, s, v = signing_context.sign_message(signable_message)
+    else:
+        signed_message = account.sign_message(signable_message)
+        r, s, v = signed_message.r, signed_message.s, signed_message.v
+    if signature_cache is not None and cache_key is not None:
+        signature_cache.put(cache_key, (r, s, v))
+    set_order_signature(order, r, s, v, signer)
+    return order
 
-    signed_message = account.sign_message(signable_message)
 
-    order.signature.s = "0x" + signed_message.s.to_bytes(32, byteorder="big").hex()
-    order.signature.r = "0x" + signed_message.r.to_bytes(32, byteorder="big").hex()
-    order.signature.v = signed_message.v
-    order.signature.signer = str(account.address)
+def sign_orders_batch(
+    orders: list[Order],
+    config: GrvtApiConfig,
+    instruments: dict[str, Instrument],
+    executor: Executor | None = None,
+    signing_context: SigningContext | None = None,
+) -> list[Order]:
+    """
+    Sign many orders at once, spreading the secp256k1 work over `executor`.
 
-    return order
+    Orders are hashed in the calling process, so only the 64-byte signable
+    messages cross the process boundary. Orders are signed in place and returned
+    in input order. `executor` defaults to the shared process pool of
+    `grvt_signing_pool`; any `concurrent.futures.Executor` may be passed instead.
+    Unset nonces and client order ids are filled in as by `sign_order`.
+    """
+    if config.private_key is None:
+        raise ValueError("Private key is not set")
+    for order in orders:
+        _assign_order_ids(order)
+
+    signing_context = signing_context or SigningContext.from_key(
+        config.private_key, CHAIN_IDS[config.env]
+    )
+    messages = [
+        _get_order_signable_message(order, signing_context.chain_id, instruments)
+        for order in orders
+    ]
+    signatures = sign_messages_batch(
+        signing_context.private_key,
+        messages,
+        executor,
+        signer_backend=signing_context.signer_backend,
+    )
+    signer = signing_context.address
+    for order, (r, s, v) in zip(orders, signatures):
+        set_order_signature(order, r, s, v, signer)
+    return orders
 
 
 def build_EIP712_order_with_builder_fee_message_data(
@@ -163,7 +256,9 @@ def build_EIP712_order_with_builder_fee_message_data(
     if order.builder_fee is None:
         raise ValueError("builder_fee is required when builder is set")
     base = build_EIP712_order_message_data(order, instruments)
-    builder_fee_int = int(Decimal(order.builder_fee) * Decimal(BUILDER_FEE_MULTIPLIER))
+    builder_fee_int = to_scaled_int(
+        order.builder_fee, BUILDER_FEE_DECIMALS, "truncate", name="builder_fee"
+    )
     return {
         "subAccountID": base["subAccountID"],
         "isMarket": base["isMarket"],
@@ -184,13 +279,14 @@ def build_EIP712_order_message_data(
     legs = []
     for leg in order.legs:
         instrument = instruments[leg.instrument]
-        size_multiplier = 10**instrument.base_decimals
+        scaler = InstrumentScaler.from_instrument(instrument)
 
-        # use Decimal() instead of float() to avoid precision loss
+        # parse exactly instead of via float() to avoid precision loss
         # int(float("1.013") * 1e9) = 1012999999
-        # int(Decimal("1.013") * Decimal(1e9) = 1013000000
-        size_int = int(Decimal(leg.size) * Decimal(size_multiplier))
-        price_int = int(Decimal(leg.limit_price) * Decimal(PRICE_MULTIPLIER))
+        # digits beyond the signed precision, sizes below min_size and prices off
+        # the tick raise FixedPointError
+        size_int = scaler.size(leg.size)
+        price_int = scaler.price(leg.limit_price)
         legs.append(
             {
                 "assetID": instrument.instrument_hash,
@@ -227,18 +323,21 @@ EIP712_TRANSFER_MESSAGE_TYPE = {
         {"name": "expiration", "type": "int64"},
     ],
 }
+EIP712_TRANSFER_HASHER = EIP712StructHasher(EIP712_TRANSFER_MESSAGE_TYPE)
 
 
-def build_EIP712_transfer_message_data(transfer: Transfer, currencyId: int):
+def build_EIP712_transfer_message_data(
+    transfer: Transfer, currencyId: int, decimals: int = USDT_DECIMALS
+):
     return {
         "fromAccount": transfer.from_account_id,
         "fromSubAccount": transfer.from_sub_account_id,
         "toAccount": transfer.to_account_id,
         "toSubAccount": transfer.to_sub_account_id,
         "tokenCurrency": currencyId,
-        "numTokens": int(
-            Decimal(transfer.num_tokens) * Decimal(1e6)
-        ),  # USDT has 6 decimals
+        "numTokens": to_scaled_int(
+            transfer.num_tokens, decimals, "truncate", name="num_tokens"
+        ),
         "nonce": transfer.signature.nonce,
         "expiration": transfer.signature.expiration,
     }
@@ -250,22 +349,30 @@ def sign_transfer(
     account: Account,
     chainId: int | None = None,
     currencyId: int = 3,  # currencyId of USDT; refer to Get Currency API
+    signing_context: SigningContext | None = None,
+    decimals: int = USDT_DECIMALS,  # balance_decimals of the currency
 ) -> Transfer:
     if config.private_key is None:
         raise ValueError("Private key is not set")
 
-    domain = get_EIP712_domain_data(config.env, chainId)
-
-    message_data = build_EIP712_transfer_message_data(transfer, currencyId)
-    signable_message = encode_typed_data(
-        domain, EIP712_TRANSFER_MESSAGE_TYPE, message_data
+    if signing_context is not None:
+        chainId = chainId or signing_context.chain_id
+    message_data = build_EIP712_transfer_message_data(transfer, currencyId, decimals)
+    signable_message = get_EIP712_signable_message(
+        chainId or CHAIN_IDS[config.env], EIP712_TRANSFER_HASHER, message_data
     )
-    signed_message = account.sign_message(signable_message)
+    if signing_context is not None:
+        r, s, v = signing_context.sign_message(signable_message)
+        signer = signing_context.address
+    else:
+        signed_message = account.sign_message(signable_message)
+        r, s, v = signed_message.r, signed_message.s, signed_message.v
+        signer = str(account.address)
 
-    transfer.signature.r = "0x" + signed_message.r.to_bytes(32, byteorder="big").hex()
-    transfer.signature.s = "0x" + signed_message.s.to_bytes(32, byteorder="big").hex()
-    transfer.signature.v = signed_message.v
-    transfer.signature.signer = str(account.address)
+    transfer.signature.r = "0x" + r.to_bytes(32, byteorder="big").hex()
+    transfer.signature.s = "0x" + s.to_bytes(32, byteorder="big").hex()
+    transfer.signature.v = v
+    transfer.signature.signer = signer
 
     return transfer
 
@@ -284,16 +391,19 @@ EIP712_WITHDRAWAL_MESSAGE_TYPE = {
         {"name": "expiration", "type": "int64"},
     ],
 }
+EIP712_WITHDRAWAL_HASHER = EIP712StructHasher(EIP712_WITHDRAWAL_MESSAGE_TYPE)
 
 
-def build_EIP712_withdrawal_message_data(withdrawal: Withdrawal, currencyId: int):
+def build_EIP712_withdrawal_message_data(
+    withdrawal: Withdrawal, currencyId: int, decimals: int = USDT_DECIMALS
+):
     return {
         "fromAccount": withdrawal.from_account_id,
         "toEthAddress": withdrawal.to_eth_address,
         "tokenCurrency": currencyId,
-        "numTokens": int(
-            Decimal(withdrawal.num_tokens) * Decimal(1e6)
-        ),  # USDT has 6 decimals
+        "numTokens": to_scaled_int(
+            withdrawal.num_tokens, decimals, "truncate", name="num_tokens"
+        ),
         "nonce": withdrawal.signature.nonce,
         "expiration": withdrawal.signature.expiration,
     }
@@ -305,21 +415,132 @@ def sign_withdrawal(
     account: Account,
     chainId: int | None = None,
     currencyId: int = 3,  # currencyId of USDT; refer to Get Currency API
+    signing_context: SigningContext | None = None,
+    decimals: int = USDT_DECIMALS,  # balance_decimals of the currency
 ) -> Withdrawal:
     if config.private_key is None:
         raise ValueError("Private key is not set")
 
-    domain = get_EIP712_domain_data(config.env, chainId)
-
-    message_data = build_EIP712_withdrawal_message_data(withdrawal, currencyId)
-    signable_message = encode_typed_data(
-        domain, EIP712_WITHDRAWAL_MESSAGE_TYPE, message_data
+    if signing_context is not None:
+        chainId = chainId or signing_context.chain_id
+    message_data = build_EIP712_withdrawal_message_data(withdrawal, currencyId, decimals)
+    signable_message = get_EIP712_signable_message(
+        chainId or CHAIN_IDS[config.env], EIP712_WITHDRAWAL_HASHER, message_data
     )
-    signed_message = account.sign_message(signable_message)
+    if signing_context is not None:
+        r, s, v = signing_context.sign_message(signable_message)
+        signer = signing_context.address
+    else:
+        signed_message = account.sign_message(signable_message)
+        r, s, v = signed_message.r, signed_message.s, signed_message.v
+        signer = str(account.address)
 
-    withdrawal.signature.r = "0x" + signed_message.r.to_bytes(32, byteorder="big").hex()
-    withdrawal.signature.s = "0x" + signed_message.s.to_bytes(32, byteorder="big").hex()
-    withdrawal.signature.v = signed_message.v
-    withdrawal.signature.signer = str(account.address)
+    withdrawal.signature.r = "0x" + r.to_bytes(32, byteorder="big").hex()
+    withdrawal.signature.s = "0x" + s.to_bytes(32, byteorder="big").hex()
+    withdrawal.signature.v = v
+    withdrawal.signature.signer = signer
 
     return withdrawal
+
+
+##################################
+# Batch Transfer and Withdrawal #
+##################################
+
+
+def _get_currency(currencies: dict[str, CurrencyDetail], symbol: str) -> CurrencyDetail:
+    currency = currencies.get(symbol)
+    if currency is None:
+        raise ValueError(
+            f"Unknown currency {symbol!r}, expected one of {sorted(currencies)}"
+        )
+    return currency
+
+
+def _sign_payloads_batch(
+    payloads: list[Transfer] | list[Withdrawal],
+    messages: list[SignableMessage],
+    executor: Executor | None,
+    signing_context: SigningContext,
+) -> None:
+    signatures = sign_messages_batch(
+        signing_context.private_key,
+        messages,
+        executor,
+        signer_backend=signing_context.signer_backend,
+    )
+    signer = signing_context.address
+    for payload, (r, s, v) in zip(payloads, signatures):
+        payload.signature.r = "0x" + r.to_bytes(32, byteorder="big").hex()
+        payload.signature.s = "0x" + s.to_bytes(32, byteorder="big").hex()
+        payload.signature.v = v
+        payload.signature.signer = signer
+
+
+def sign_transfers_batch(
+    transfers: list[Transfer],
+    config: GrvtApiConfig,
+    currencies: dict[str, CurrencyDetail],
+    executor: Executor | None = None,
+    signing_context: SigningContext | None = None,
+) -> list[Transfer]:
+    """
+    Sign many transfers at once, as `sign_orders_batch` does for orders.
+
+    The token id and decimals of each transfer's currency come from `currencies`,
+    keyed by symbol, as returned by the raw clients' `get_currency_details`.
+    Zero nonces are filled in from the id allocator. Transfers are signed in
+    place and returned in input order.
+    """
+    if config.private_key is None:
+        raise ValueError("Private key is not set")
+
+    signing_context = signing_context or SigningContext.from_key(
+        config.private_key, CHAIN_IDS[config.env]
+    )
+    messages = []
+    for transfer in transfers:
+        if not transfer.signature.nonce:
+            transfer.signature.nonce = next_nonce()
+        currency = _get_currency(currencies, transfer.currency)
+        message_data = build_EIP712_transfer_message_data(
+            transfer, currency.id, currency.balance_decimals
+        )
+        messages.append(
+            get_EIP712_signable_message(
+                signing_context.chain_id, EIP712_TRANSFER_HASHER, message_data
+            )
+        )
+    _sign_payloads_batch(transfers, messages, executor, signing_context)
+    return transfers
+
+
+def sign_withdrawals_batch(
+    withdrawals: list[Withdrawal],
+    config: GrvtApiConfig,
+    currencies: dict[str, CurrencyDetail],
+    executor: Executor | None = None,
+    signing_context: SigningContext | None = None,
+) -> list[Withdrawal]:
+    """Sign many withdrawals at once; see `sign_transfers_batch`."""
+    if config.private_key is None:
+        raise ValueError("Private key is not set")
+
+    signing_context = signing_context or SigningContext.from_key(
+        config.private_key, CHAIN_IDS[config.env]
+    )
+    messages = []
+    for withdrawal in withdrawals:
+        if not withdrawal.signature.nonce:
+            withdrawal.signature.nonce = next_nonce()
+        currency = _get_currency(currencies, withdrawal.currency)
+        message_data = build_EIP712_withdrawal_message_data(
+            withdrawal, currency.id, currency.balance_decimals
+        )
+        messages.append(
+            get_EIP712_signable_message(
+                signing_context.chain_id, EIP712_WITHDRAWAL_HASHER, message_data
+            )
+        )
+    _sign_payloads_batch(withdrawals, messages, executor, signing_context)
+    return withdrawals
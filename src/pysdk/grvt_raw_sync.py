@@ -1,9 +1,18 @@
-from enum import Enum
-
-from dacite import Config, from_dict
+from collections.abc import Callable, Iterator
+from typing import Any
 
 from . import grvt_raw_types as types
+from .grvt_history import (
+    DEFAULT_MAX_BUFFERED_ITEMS,
+    DEFAULT_TARGET_WINDOW_ITEMS,
+    download_history,
+    get_key_fields,
+    get_time_field,
+    iter_items,
+    iter_pages,
+)
 from .grvt_raw_base import GrvtApiConfig, GrvtError, GrvtRawSyncBase
+from .grvt_raw_decoder import DecodeMode
 
 # mypy: disable-error-code="no-any-return"
 
@@ -14,338 +23,511 @@ class GrvtRawSync(GrvtRawSyncBase):
         self.md_rpc = self.env.market_data.rpc_endpoint
         self.td_rpc = self.env.trade_data.rpc_endpoint
 
+    def iter_history(
+        self,
+        call: Callable[..., Any],
+        req: Any,
+        stop_time: int | None = None,
+        max_buffered_items: int | None = DEFAULT_MAX_BUFFERED_ITEMS,
+        decode: DecodeMode | str | None = None,
+    ) -> Iterator[Any]:
+        """
+        Items of every page of a history endpoint, newest first.
+
+        The next page is fetched ahead; see grvt_history. `call` is the method of
+        the endpoint and `req` the request of the first page, e.g.
+        `iter_history(api.fill_history_v1, ApiFillHistoryRequest(sub_account_id))`.
+        """
+        fetch = self._get_history_fetch(call, req, decode)
+        return iter_items(fetch, stop_time, get_time_field(req), max_buffered_items)
+
+    def iter_history_pages(
+        self,
+        call: Callable[..., Any],
+        req: Any,
+        stop_time: int | None = None,
+        max_buffered_items: int | None = DEFAULT_MAX_BUFFERED_ITEMS,
+        decode: DecodeMode | str | None = None,
+    ) -> Iterator[Any]:
+        """Responses of every page of a history endpoint, see `iter_history`."""
+        fetch = self._get_history_fetch(call, req, decode)
+        return iter_pages(fetch, stop_time, get_time_field(req), max_buffered_items)
+
+    def download_history(
+        self,
+        call: Callable[..., Any],
+        req: Any,
+        start_time: int,
+        end_time: int,
+        max_concurrency: int = 8,
+        window_ns: int | None = None,
+        target_window_items: int = DEFAULT_TARGET_WINDOW_ITEMS,
+        decode: DecodeMode | str | None = None,
+    ) -> list[Any]:
+        """
+        Items of a history endpoint between `start_time` and `end_time`, newest first.
+
+        The times are unix nanoseconds. Duplicates are dropped, and the items are
+        fetched in time windows with at most `max_concurrency` threads; see
+        grvt_history. `req` sets the other filters, e.g.
+        `download_history(api.fill_history_v1, req, start, end)`.
+        Works for the fill, trade, order, funding payment and candlestick histories,
+        raises ValueError for other requests.
+        """
+        return download_history(
+            self._get_history_window_fetch(call, req, decode),
+            start_time,
+            end_time,
+            get_time_field(req),
+            get_key_fields(req),
+            max_concurrency,
+            window_ns,
+            target_window_items,
+        )
+
     def get_instrument_v1(
-        self, req: types.ApiGetInstrumentRequest
+        self, req: types.ApiGetInstrumentRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiGetInstrumentResponse | GrvtError:
-        resp = self._post(False, self.md_rpc + "/full/v1/instrument", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiGetInstrumentResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            False,
+            self.md_rpc + "/full/v1/instrument",
+            req,
+            types.ApiGetInstrumentResponse,
+            decode,
+        )
 
     def get_all_instruments_v1(
-        self, req: types.ApiGetAllInstrumentsRequest
+        self,
+        req: types.ApiGetAllInstrumentsRequest,
+        decode: DecodeMode | str | None = None,
     ) -> types.ApiGetAllInstrumentsResponse | GrvtError:
-        resp = self._post(False, self.md_rpc + "/full/v1/all_instruments", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiGetAllInstrumentsResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            False,
+            self.md_rpc + "/full/v1/all_instruments",
+            req,
+            types.ApiGetAllInstrumentsResponse,
+            decode,
+        )
 
     def get_filtered_instruments_v1(
-        self, req: types.ApiGetFilteredInstrumentsRequest
+        self,
+        req: types.ApiGetFilteredInstrumentsRequest,
+        decode: DecodeMode | str | None = None,
     ) -> types.ApiGetFilteredInstrumentsResponse | GrvtError:
-        resp = self._post(False, self.md_rpc + "/full/v1/instruments", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(
-            types.ApiGetFilteredInstrumentsResponse, resp, Config(cast=[Enum])
+        return self._call(
+            False,
+            self.md_rpc + "/full/v1/instruments",
+            req,
+            types.ApiGetFilteredInstrumentsResponse,
+            decode,
         )
 
     def get_currency_v1(
-        self, req: types.ApiGetCurrencyRequest
+        self, req: types.ApiGetCurrencyRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiGetCurrencyResponse | GrvtError:
-        resp = self._post(False, self.md_rpc + "/full/v1/currency", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiGetCurrencyResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            False,
+            self.md_rpc + "/full/v1/currency",
+            req,
+            types.ApiGetCurrencyResponse,
+            decode,
+        )
+
+    def get_currency_details(self) -> dict[str, types.CurrencyDetail] | GrvtError:
+        """Currencies by symbol, from get_currency_v1 on first use and cached after."""
+        if self._currencies is None:
+            resp = self.get_currency_v1(
+                types.ApiGetCurrencyRequest(), decode=DecodeMode.DATACLASS
+            )
+            if isinstance(resp, GrvtError):
+                return resp
+            self._currencies = {currency.symbol: currency for currency in resp.result}
+        return self._currencies
 
     def mini_ticker_v1(
-        self, req: types.ApiMiniTickerRequest
+        self, req: types.ApiMiniTickerRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiMiniTickerResponse | GrvtError:
-        resp = self._post(False, self.md_rpc + "/full/v1/mini", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiMiniTickerResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            False, self.md_rpc + "/full/v1/mini", req, types.ApiMiniTickerResponse, decode
+        )
 
     def ticker_v1(
-        self, req: types.ApiTickerRequest
+        self, req: types.ApiTickerRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiTickerResponse | GrvtError:
-        resp = self._post(False, self.md_rpc + "/full/v1/ticker", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiTickerResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            False, self.md_rpc + "/full/v1/ticker", req, types.ApiTickerResponse, decode
+        )
 
     def orderbook_levels_v1(
-        self, req: types.ApiOrderbookLevelsRequest
+        self, req: types.ApiOrderbookLevelsRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiOrderbookLevelsResponse | GrvtError:
-        resp = self._post(False, self.md_rpc + "/full/v1/book", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiOrderbookLevelsResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            False,
+            self.md_rpc + "/full/v1/book",
+            req,
+            types.ApiOrderbookLevelsResponse,
+            decode,
+        )
 
-    def trade_v1(self, req: types.ApiTradeRequest) -> types.ApiTradeResponse | GrvtError:
-        resp = self._post(False, self.md_rpc + "/full/v1/trade", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiTradeResponse, resp, Config(cast=[Enum]))
+    def trade_v1(
+        self, req: types.ApiTradeRequest, decode: DecodeMode | str | None = None
+    ) -> types.ApiTradeResponse | GrvtError:
+        return self._call(
+            False, self.md_rpc + "/full/v1/trade", req, types.ApiTradeResponse, decode
+        )
 
     def trade_history_v1(
-        self, req: types.ApiTradeHistoryRequest
+        self, req: types.ApiTradeHistoryRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiTradeHistoryResponse | GrvtError:
-        resp = self._post(False, self.md_rpc + "/full/v1/trade_history", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiTradeHistoryResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            False,
+            self.md_rpc + "/full/v1/trade_history",
+            req,
+            types.ApiTradeHistoryResponse,
+            decode,
+        )
 
     def candlestick_v1(
-        self, req: types.ApiCandlestickRequest
+        self, req: types.ApiCandlestickRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiCandlestickResponse | GrvtError:
-        resp = self._post(False, self.md_rpc + "/full/v1/kline", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiCandlestickResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            False,
+            self.md_rpc + "/full/v1/kline",
+            req,
+            types.ApiCandlestickResponse,
+            decode,
+        )
 
     def funding_rate_v1(
-        self, req: types.ApiFundingRateRequest
+        self, req: types.ApiFundingRateRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiFundingRateResponse | GrvtError:
-        resp = self._post(False, self.md_rpc + "/full/v1/funding", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiFundingRateResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            False,
+            self.md_rpc + "/full/v1/funding",
+            req,
+            types.ApiFundingRateResponse,
+            decode,
+        )
 
     def create_order_v1(
-        self, req: types.ApiCreateOrderRequest
+        self, req: types.ApiCreateOrderRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiCreateOrderResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/create_order", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiCreateOrderResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/create_order",
+            req,
+            types.ApiCreateOrderResponse,
+            decode,
+        )
 
     def cancel_order_v1(
-        self, req: types.ApiCancelOrderRequest
+        self, req: types.ApiCancelOrderRequest, decode: DecodeMode | str | None = None
     ) -> types.AckResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/cancel_order", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True, self.td_rpc + "/full/v1/cancel_order", req, types.AckResponse, decode
+        )
 
     def cancel_all_orders_v1(
-        self, req: types.ApiCancelAllOrdersRequest
+        self, req: types.ApiCancelAllOrdersRequest, decode: DecodeMode | str | None = None
     ) -> types.AckResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/cancel_all_orders", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/cancel_all_orders",
+            req,
+            types.AckResponse,
+            decode,
+        )
 
     def get_order_v1(
-        self, req: types.ApiGetOrderRequest
+        self, req: types.ApiGetOrderRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiGetOrderResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/order", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiGetOrderResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True, self.td_rpc + "/full/v1/order", req, types.ApiGetOrderResponse, decode
+        )
 
     def open_orders_v1(
-        self, req: types.ApiOpenOrdersRequest
+        self, req: types.ApiOpenOrdersRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiOpenOrdersResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/open_orders", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiOpenOrdersResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/open_orders",
+            req,
+            types.ApiOpenOrdersResponse,
+            decode,
+        )
 
     def order_history_v1(
-        self, req: types.ApiOrderHistoryRequest
+        self, req: types.ApiOrderHistoryRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiOrderHistoryResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/order_history", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiOrderHistoryResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/order_history",
+            req,
+            types.ApiOrderHistoryResponse,
+            decode,
+        )
 
     def cancel_on_disconnect_v1(
-        self, req: types.ApiCancelOnDisconnectRequest
+        self,
+        req: types.ApiCancelOnDisconnectRequest,
+        decode: DecodeMode | str | None = None,
     ) -> types.AckResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/cancel_on_disconnect", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/cancel_on_disconnect",
+            req,
+            types.AckResponse,
+            decode,
+        )
 
     def fill_history_v1(
-        self, req: types.ApiFillHistoryRequest
+        self, req: types.ApiFillHistoryRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiFillHistoryResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/fill_history", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiFillHistoryResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/fill_history",
+            req,
+            types.ApiFillHistoryResponse,
+            decode,
+        )
 
     def positions_v1(
-        self, req: types.ApiPositionsRequest
+        self, req: types.ApiPositionsRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiPositionsResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/positions", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiPositionsResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/positions",
+            req,
+            types.ApiPositionsResponse,
+            decode,
+        )
 
     def funding_payment_history_v1(
-        self, req: types.ApiFundingPaymentHistoryRequest
+        self,
+        req: types.ApiFundingPaymentHistoryRequest,
+        decode: DecodeMode | str | None = None,
     ) -> types.ApiFundingPaymentHistoryResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/funding_payment_history", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(
-            types.ApiFundingPaymentHistoryResponse, resp, Config(cast=[Enum])
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/funding_payment_history",
+            req,
+            types.ApiFundingPaymentHistoryResponse,
+            decode,
         )
 
     def deposit_history_v1(
-        self, req: types.ApiDepositHistoryRequest
+        self, req: types.ApiDepositHistoryRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiDepositHistoryResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/deposit_history", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiDepositHistoryResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/deposit_history",
+            req,
+            types.ApiDepositHistoryResponse,
+            decode,
+        )
 
     def transfer_v1(
-        self, req: types.ApiTransferRequest
+        self, req: types.ApiTransferRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiTransferResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/transfer", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiTransferResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/transfer",
+            req,
+            types.ApiTransferResponse,
+            decode,
+        )
 
     def transfer_history_v1(
-        self, req: types.ApiTransferHistoryRequest
+        self, req: types.ApiTransferHistoryRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiTransferHistoryResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/transfer_history", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiTransferHistoryResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/transfer_history",
+            req,
+            types.ApiTransferHistoryResponse,
+            decode,
+        )
 
     def withdrawal_v1(
-        self, req: types.ApiWithdrawalRequest
+        self, req: types.ApiWithdrawalRequest, decode: DecodeMode | str | None = None
     ) -> types.AckResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/withdrawal", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True, self.td_rpc + "/full/v1/withdrawal", req, types.AckResponse, decode
+        )
 
     def withdrawal_history_v1(
-        self, req: types.ApiWithdrawalHistoryRequest
+        self,
+        req: types.ApiWithdrawalHistoryRequest,
+        decode: DecodeMode | str | None = None,
     ) -> types.ApiWithdrawalHistoryResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/withdrawal_history", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiWithdrawalHistoryResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/withdrawal_history",
+            req,
+            types.ApiWithdrawalHistoryResponse,
+            decode,
+        )
 
     def sub_account_summary_v1(
-        self, req: types.ApiSubAccountSummaryRequest
+        self,
+        req: types.ApiSubAccountSummaryRequest,
+        decode: DecodeMode | str | None = None,
     ) -> types.ApiSubAccountSummaryResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/account_summary", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiSubAccountSummaryResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/account_summary",
+            req,
+            types.ApiSubAccountSummaryResponse,
+            decode,
+        )
 
     def sub_account_history_v1(
-        self, req: types.ApiSubAccountHistoryRequest
+        self,
+        req: types.ApiSubAccountHistoryRequest,
+        decode: DecodeMode | str | None = None,
     ) -> types.ApiSubAccountHistoryResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/account_history", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiSubAccountHistoryResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/account_history",
+            req,
+            types.ApiSubAccountHistoryResponse,
+            decode,
+        )
 
     def aggregated_account_summary_v1(
-        self, req: types.EmptyRequest
+        self, req: types.EmptyRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiAggregatedAccountSummaryResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/aggregated_account_summary", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(
-            types.ApiAggregatedAccountSummaryResponse, resp, Config(cast=[Enum])
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/aggregated_account_summary",
+            req,
+            types.ApiAggregatedAccountSummaryResponse,
+            decode,
         )
 
     def funding_account_summary_v1(
-        self, req: types.EmptyRequest
+        self, req: types.EmptyRequest, decode: DecodeMode | str | None = None
     ) -> types.ApiFundingAccountSummaryResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/funding_account_summary", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(
-            types.ApiFundingAccountSummaryResponse, resp, Config(cast=[Enum])
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/funding_account_summary",
+            req,
+            types.ApiFundingAccountSummaryResponse,
+            decode,
         )
 
     def set_derisk_mm_ratio_v1(
-        self, req: types.ApiSetDeriskToMaintenanceMarginRatioRequest
+        self,
+        req: types.ApiSetDeriskToMaintenanceMarginRatioRequest,
+        decode: DecodeMode | str | None = None,
     ) -> types.ApiSetDeriskToMaintenanceMarginRatioResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/set_derisk_mm_ratio", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(
-            types.ApiSetDeriskToMaintenanceMarginRatioResponse, resp, Config(cast=[Enum])
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/set_derisk_mm_ratio",
+            req,
+            types.ApiSetDeriskToMaintenanceMarginRatioResponse,
+            decode,
         )
 
     def get_all_initial_leverage_v1(
-        self, req: types.ApiGetAllInitialLeverageRequest
+        self,
+        req: types.ApiGetAllInitialLeverageRequest,
+        decode: DecodeMode | str | None = None,
     ) -> types.ApiGetAllInitialLeverageResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/get_all_initial_leverage", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(
-            types.ApiGetAllInitialLeverageResponse, resp, Config(cast=[Enum])
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/get_all_initial_leverage",
+            req,
+            types.ApiGetAllInitialLeverageResponse,
+            decode,
         )
 
     def set_initial_leverage_v1(
-        self, req: types.ApiSetInitialLeverageRequest
+        self,
+        req: types.ApiSetInitialLeverageRequest,
+        decode: DecodeMode | str | None = None,
     ) -> types.ApiSetInitialLeverageResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/set_initial_leverage", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiSetInitialLeverageResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/set_initial_leverage",
+            req,
+            types.ApiSetInitialLeverageResponse,
+            decode,
+        )
 
     def vault_burn_tokens_v1(
-        self, req: types.ApiVaultBurnTokensRequest
+        self, req: types.ApiVaultBurnTokensRequest, decode: DecodeMode | str | None = None
     ) -> types.AckResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/vault_burn_tokens", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/vault_burn_tokens",
+            req,
+            types.AckResponse,
+            decode,
+        )
 
     def vault_invest_v1(
-        self, req: types.ApiVaultInvestRequest
+        self, req: types.ApiVaultInvestRequest, decode: DecodeMode | str | None = None
     ) -> types.AckResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/vault_invest", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True, self.td_rpc + "/full/v1/vault_invest", req, types.AckResponse, decode
+        )
 
     def vault_investor_summary_v1(
-        self, req: types.ApiVaultInvestorSummaryRequest
+        self,
+        req: types.ApiVaultInvestorSummaryRequest,
+        decode: DecodeMode | str | None = None,
     ) -> types.ApiVaultInvestorSummaryResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/vault_investor_summary", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.ApiVaultInvestorSummaryResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/vault_investor_summary",
+            req,
+            types.ApiVaultInvestorSummaryResponse,
+            decode,
+        )
 
     def vault_redeem_v1(
-        self, req: types.ApiVaultRedeemRequest
+        self, req: types.ApiVaultRedeemRequest, decode: DecodeMode | str | None = None
     ) -> types.AckResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/vault_redeem", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True, self.td_rpc + "/full/v1/vault_redeem", req, types.AckResponse, decode
+        )
 
     def vault_redeem_cancel_v1(
-        self, req: types.ApiVaultRedeemCancelRequest
+        self,
+        req: types.ApiVaultRedeemCancelRequest,
+        decode: DecodeMode | str | None = None,
     ) -> types.AckResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/vault_redeem_cancel", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(types.AckResponse, resp, Config(cast=[Enum]))
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/vault_redeem_cancel",
+            req,
+            types.AckResponse,
+            decode,
+        )
 
     def vault_redemption_queue_v1(
-        self, req: types.ApiVaultViewRedemptionQueueRequest
+        self,
+        req: types.ApiVaultViewRedemptionQueueRequest,
+        decode: DecodeMode | str | None = None,
     ) -> types.ApiVaultViewRedemptionQueueResponse | GrvtError:
-        resp = self._post(True, self.td_rpc + "/full/v1/vault_view_redemption_queue", req)
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(
-            types.ApiVaultViewRedemptionQueueResponse, resp, Config(cast=[Enum])
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/vault_view_redemption_queue",
+            req,
+            types.ApiVaultViewRedemptionQueueResponse,
+            decode,
         )
 
     def query_vault_manager_investor_history_v1(
-        self, req: types.ApiQueryVaultManagerInvestorHistoryRequest
+        self,
+        req: types.ApiQueryVaultManagerInvestorHistoryRequest,
+        decode: DecodeMode | str | None = None,
     ) -> types.ApiQueryVaultManagerInvestorHistoryResponse | GrvtError:
-        resp = self._post(
-            True, self.td_rpc + "/full/v1/vault_manager_investor_history", req
-        )
-        if resp.get("code"):
-            return GrvtError(**resp)
-        return from_dict(
-            types.ApiQueryVaultManagerInvestorHistoryResponse, resp, Config(cast=[Enum])
+        return self._call(
+            True,
+            self.td_rpc + "/full/v1/vault_manager_investor_history",
+            req,
+            types.ApiQueryVaultManagerInvestorHistoryResponse,
+            decode,
         )
@@ -317,7 +317,7 @@ class ApiPositionsRequest:
     quote: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Positions:
     # Time at which the event was emitted in unix nanoseconds
     event_time: str
@@ -403,7 +403,7 @@ class ApiFillHistoryRequest:
     cursor: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Fill:
     # Time at which the event was emitted in unix nanoseconds
     event_time: str
@@ -493,7 +493,7 @@ class ApiFundingPaymentHistoryRequest:
     cursor: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FundingPayment:
     # Time at which the event was emitted in unix nanoseconds
     event_time: str
@@ -714,7 +714,7 @@ class ApiGetAllInitialLeverageResponse:
     results: list[InitialLeverageResult]
 
 
-@dataclass
+@dataclass(slots=True)
 class Signature:
     # The address (public key) of the wallet signing the payload
     signer: str
@@ -940,7 +940,7 @@ class WSOrderbookLevelsFeedSelectorV1:
     depth: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderbookLevel:
     # The price of the level, expressed in `9` decimals
     price: str
@@ -1168,7 +1168,7 @@ class WSTradeFeedSelectorV1:
     limit: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     # Time at which the event was emitted in unix nanoseconds
     event_time: str
@@ -1236,7 +1236,7 @@ class WSCandlestickFeedSelectorV1:
     type: CandlestickType
 
 
-@dataclass
+@dataclass(slots=True)
 class Candlestick:
     # Open time of kline bar in unix nanoseconds
     open_time: str
@@ -1535,7 +1535,7 @@ class ApiFundingRateRequest:
     cursor: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FundingRate:
     # The readable instrument name:<ul><li>Perpetual: `ETH_USDT_Perp`</li><li>Future: `BTC_USDT_Fut_20Oct23`</li><li>Call: `ETH_USDT_Call_20Oct23_2800`</li><li>Put: `ETH_USDT_Put_20Oct23_2800`</li></ul>
     instrument: str
@@ -1603,7 +1603,7 @@ class ApiQueryVaultManagerInvestorHistoryResponse:
     result: list[ApiVaultInvestorHistory]
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderLeg:
     # The instrument to trade in this leg
     instrument: str
@@ -1619,7 +1619,7 @@ class OrderLeg:
     limit_price: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TPSLOrderMetadata:
     """
     Contains metadata for Take Profit (TP) and Stop Loss (SL) trigger orders.
@@ -1639,7 +1639,7 @@ class TPSLOrderMetadata:
     close_position: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class TriggerOrderMetadata:
     """
     Contains metadata related to trigger orders, such as Take Profit (TP) or Stop Loss (SL).
@@ -1659,7 +1659,7 @@ class TriggerOrderMetadata:
     tpsl: TPSLOrderMetadata
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderMetadata:
     """
     Metadata fields are used to support Backend only operations. These operations are not trustless by nature.
@@ -1686,7 +1686,7 @@ class OrderMetadata:
     broker: BrokerTag | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderState:
     # The status of the order
     status: OrderStatus
@@ -1702,7 +1702,7 @@ class OrderState:
     avg_fill_price: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """
     Order is a typed payload used throughout the GRVT platform to express all orderbook, RFQ, and liquidation orders.
@@ -0,0 +1,141 @@
+"""
+Bounded LRU of order signatures, so retries of an order are not signed again.
+
+When a request times out or a websocket resends after reconnecting, the same
+order is often rebuilt with the same nonce and expiration. Its signature is the
+same too, as signing is deterministic, so it is looked up here by the content
+that is signed instead of being recomputed. Entries are dropped once the order
+expires, once it is acknowledged (see `SignatureCache.evict`) or when the cache
+is full, least recently used first.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import NamedTuple
+
+from .grvt_signer import SignatureRSV
+
+DEFAULT_SIGNATURE_CACHE_SIZE = 1024
+
+
+class SignatureCacheKey(NamedTuple):
+    nonce: int
+    expiration: int
+    # Chain id, signer and every signed field of the order
+    content: Hashable
+
+
+def _nonce_key(nonce: int | str, expiration: int | str) -> tuple[int, int]:
+    # Payloads and results may carry either as a string; keys always hold ints
+    return int(nonce), int(expiration)
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def get_signature_cache_key(
+    chain_id: int, signer: str, message_data: dict
+) -> SignatureCacheKey:
+    """
+    Key of an EIP-712 order message.
+
+    `message_data` is built by `build_EIP712_order_message_data` or the ccxt
+    `get_signable_message`. Sizes and prices are already scaled to integers
+    there, so "0.10" and "0.1" give the same key.
+    """
+    nonce, expiration = _nonce_key(message_data["nonce"], message_data["expiration"])
+    return SignatureCacheKey(
+        nonce=nonce,
+        expiration=expiration,
+        content=(chain_id, signer, _freeze(message_data)),
+    )
+
+
+class SignatureCache:
+    """Thread-safe LRU of at most `maxsize` order signatures."""
+
+    def __init__(self, maxsize: int = DEFAULT_SIGNATURE_CACHE_SIZE):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[SignatureCacheKey, SignatureRSV] = OrderedDict()
+        # (nonce, expiration) -> keys, to evict acknowledged orders
+        self._keys_by_nonce: dict[tuple[int, int], list[SignatureCacheKey]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: SignatureCacheKey) -> None:
+        del self._entries[key]
+        nonce_key = (key.nonce, key.expiration)
+        keys = self._keys_by_nonce[nonce_key]
+        keys.remove(key)
+        if not keys:
+            del self._keys_by_nonce[nonce_key]
+
+    def get(
+        self, key: SignatureCacheKey, now_ns: int | None = None
+    ) -> SignatureRSV | None:
+        """Return the cached signature of `key`, or None if missing or expired."""
+        with self._lock:
+            signature = self._entries.get(key)
+            if signature is None:
+                self.misses += 1
+                return None
+            if key.expiration and key.expiration <= (now_ns or time.time_ns()):
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return signature
+
+    def put(self, key: SignatureCacheKey, signature: SignatureRSV) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return
+            self._entries[key] = signature
+            self._keys_by_nonce.setdefault((key.nonce, key.expiration), []).append(key)
+            if len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def evict(self, nonce: int | str, expiration: int | str) -> int:
+        """
+        Drop the signatures of an order once the exchange acknowledged it.
+
+        Returns the number of entries dropped.
+        """
+        with self._lock:
+            keys = list(self._keys_by_nonce.get(_nonce_key(nonce, expiration), []))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def evict_expired(self, now_ns: int | None = None) -> int:
+        """Drop every expired signature; returns the number dropped."""
+        now_ns = now_ns or time.time_ns()
+        with self._lock:
+            expired = [
+                key
+                for key in self._entries
+                if key.expiration and key.expiration <= now_ns
+            ]
+            for key in expired:
+                self._remove(key)
+            return len(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_nonce.clear()
@@ -0,0 +1,94 @@
+"""
+secp256k1 signer backends for precomputed EIP-712 digests.
+
+`eth_account` is the default backend. When the optional `coincurve` package
+(bindings to libsecp256k1, `pip install coincurve`) is installed, the `secp256k1`
+backend signs the same 32-byte digest natively. Both use RFC 6979 nonces and
+low-s normalization, so they produce identical (r, s, v) signatures.
+"""
+
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Any
+
+from eth_account import Account
+
+try:
+    import coincurve
+except ImportError:  # optional dependency
+    coincurve = None
+
+# (r, s, v) with v in {27, 28}, as returned by eth_account
+SignatureRSV = tuple[int, int, int]
+
+
+class SignerBackend(Enum):
+    ETH_ACCOUNT = "eth_account"
+    SECP256K1 = "secp256k1"
+
+
+class Signer(ABC):
+    """Signs 32-byte digests with one private key."""
+
+    backend: SignerBackend
+
+    @abstractmethod
+    def sign_digest(self, digest: bytes) -> SignatureRSV:
+        """Return the (r, s, v) signature of the 32-byte `digest`."""
+
+
+class EthAccountSigner(Signer):
+    backend = SignerBackend.ETH_ACCOUNT
+
+    def __init__(self, private_key: str, account: Any | None = None):
+        self.account = account or Account.from_key(private_key)
+
+    def sign_digest(self, digest: bytes) -> SignatureRSV:
+        signed = self.account.unsafe_sign_hash(digest)
+        return signed.r, signed.s, signed.v
+
+
+class Secp256k1Signer(Signer):
+    backend = SignerBackend.SECP256K1
+
+    def __init__(self, private_key: str):
+        if coincurve is None:
+            raise ImportError(
+                "The secp256k1 signer backend requires coincurve: pip install coincurve"
+            )
+        self._key = coincurve.PrivateKey(bytes.fromhex(private_key.removeprefix("0x")))
+
+    def sign_digest(self, digest: bytes) -> SignatureRSV:
+        # 65 bytes: r (32) || s (32) || recovery id (1)
+        signature = self._key.sign_recoverable(digest, hasher=None)
+        return (
+            int.from_bytes(signature[:32], byteorder="big"),
+            int.from_bytes(signature[32:64], byteorder="big"),
+            signature[64] + 27,
+        )
+
+
+def is_signer_backend_available(backend: SignerBackend | str) -> bool:
+    if SignerBackend(backend) == SignerBackend.SECP256K1:
+        return coincurve is not None
+    return True
+
+
+def get_available_signer_backends() -> list[SignerBackend]:
+    return [backend for backend in SignerBackend if is_signer_backend_available(backend)]
+
+
+def get_signer(
+    private_key: str,
+    backend: SignerBackend | str = SignerBackend.ETH_ACCOUNT,
+    account: Any | None = None,
+) -> Signer:
+    """
+    Return a signer for `private_key` using `backend`.
+
+    `account` may pass an already parsed eth_account key to the default backend.
+    """
+    backend = SignerBackend(backend)
+    if backend == SignerBackend.SECP256K1:
+        return Secp256k1Signer(private_key)
+    return EthAccountSigner(private_key, account)
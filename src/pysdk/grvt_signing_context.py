@@ -0,0 +1,66 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from eth_account import Account
+from eth_account.messages import SignableMessage
+
+from .grvt_eip712 import (
+    EIP712_DOMAIN_NAME,
+    EIP712_DOMAIN_VERSION,
+    get_EIP712_digest,
+    get_EIP712_domain_separator,
+)
+from .grvt_signer import SignatureRSV, Signer, SignerBackend, get_signer
+
+
+@dataclass
+class SigningContext:
+    """
+    Everything derived from a private key and chain that signing needs.
+
+    Parsing a private key costs milliseconds, so clients build one context and pass
+    it to the sign_* functions instead of deriving the key and address per message.
+    Signatures are produced by `signer`, see grvt_signer for the available backends.
+    """
+
+    private_key: str = field(repr=False)
+    account: Any = field(repr=False)
+    signer: Signer = field(repr=False)
+    # Checksummed address, as used for order and transfer signers
+    address: str
+    # Lowercase address, as used for the derisk ratio signer
+    address_lower: str
+    chain_id: int
+    domain: dict[str, str | int]
+    domain_separator: bytes = field(repr=False)
+
+    @classmethod
+    def from_key(
+        cls,
+        private_key: str,
+        chain_id: int,
+        signer_backend: SignerBackend | str = SignerBackend.ETH_ACCOUNT,
+    ) -> "SigningContext":
+        account = Account.from_key(private_key)
+        address = str(account.address)
+        return cls(
+            private_key=private_key,
+            account=account,
+            signer=get_signer(private_key, signer_backend, account),
+            address=address,
+            address_lower=address.lower(),
+            chain_id=chain_id,
+            domain={
+                "name": EIP712_DOMAIN_NAME,
+                "version": EIP712_DOMAIN_VERSION,
+                "chainId": chain_id,
+            },
+            domain_separator=get_EIP712_domain_separator(chain_id),
+        )
+
+    @property
+    def signer_backend(self) -> SignerBackend:
+        return self.signer.backend
+
+    def sign_message(self, signable_message: SignableMessage) -> SignatureRSV:
+        return self.signer.sign_digest(get_EIP712_digest(signable_message))
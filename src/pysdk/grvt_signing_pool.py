@@ -0,0 +1,190 @@
+"""
+Parallel signing of precomputed EIP-712 messages.
+
+Batch signing APIs hash every message in the calling process and ship only the
+resulting `SignableMessage` (two 32-byte hashes) to a pool of workers, so no
+instrument or order objects are pickled. Pools created by this module build
+their signer once, in their initializer, and chunks are then sent without the
+private key.
+"""
+
+import atexit
+import math
+import os
+import threading
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Any
+
+from eth_account.messages import SignableMessage
+
+from .grvt_eip712 import get_EIP712_digest
+from .grvt_signer import SignatureRSV, Signer, SignerBackend, get_signer
+
+# Signer of the pool this worker process belongs to, set by its initializer
+_worker_signer: Signer | None = None
+# Signers of the keys sent with each call to executors not created here
+_worker_signers: dict[tuple[str, SignerBackend], Signer] = {}
+
+# Private key, signer backend and worker count of the pools created here
+_executor_info: "weakref.WeakKeyDictionary[Executor, tuple[str, SignerBackend, int]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+_executors: dict[tuple[str, SignerBackend], ProcessPoolExecutor] = {}
+_executor_lock = threading.Lock()
+
+
+def _init_worker(private_key: str, backend: SignerBackend) -> None:
+    global _worker_signer
+    _worker_signer = get_signer(private_key, backend)
+
+
+def _sign_with_signer(
+    signer: Signer, messages: list[SignableMessage]
+) -> list[SignatureRSV]:
+    return [signer.sign_digest(get_EIP712_digest(message)) for message in messages]
+
+
+def _get_pool_signer() -> Signer:
+    if _worker_signer is None:
+        raise RuntimeError("Signing worker was started without a private key")
+    return _worker_signer
+
+
+def _get_worker_signer(private_key: str, backend: SignerBackend) -> Signer:
+    signer = _worker_signers.get((private_key, backend))
+    if signer is None:
+        signer = get_signer(private_key, backend)
+        _worker_signers[(private_key, backend)] = signer
+    return signer
+
+
+def _sign_messages_chunk(messages: list[SignableMessage]) -> list[SignatureRSV]:
+    return _sign_with_signer(_get_pool_signer(), messages)
+
+
+def _sign_messages_chunk_with_key(
+    private_key: str, backend: SignerBackend, messages: list[SignableMessage]
+) -> list[SignatureRSV]:
+    return _sign_with_signer(_get_worker_signer(private_key, backend), messages)
+
+
+def _sign_digest(digest: bytes) -> SignatureRSV:
+    return _get_pool_signer().sign_digest(digest)
+
+
+def sign_digest_with_key(
+    private_key: str, backend: SignerBackend, digest: bytes
+) -> SignatureRSV:
+    """Sign one digest with this process's cached signer; picklable for executors."""
+    return _get_worker_signer(private_key, backend).sign_digest(digest)
+
+
+def _is_pool_of(executor: Executor, private_key: str, backend: SignerBackend) -> bool:
+    info = _executor_info.get(executor)
+    return info is not None and info[:2] == (private_key, backend)
+
+
+def get_sign_digest_fn(
+    executor: Executor, private_key: str, backend: SignerBackend | str
+) -> Callable[[bytes], SignatureRSV]:
+    """
+    Return a picklable function signing one digest with `private_key` on `executor`.
+
+    Pools created by this module for that key sign with their worker signer, and
+    the key is only sent along to other executors.
+    """
+    backend = SignerBackend(backend)
+    if _is_pool_of(executor, private_key, backend):
+        return _sign_digest
+    return partial(sign_digest_with_key, private_key, backend)
+
+
+def create_signing_executor(
+    private_key: str,
+    max_workers: int | None = None,
+    signer_backend: SignerBackend | str = SignerBackend.ETH_ACCOUNT,
+) -> ProcessPoolExecutor:
+    """
+    Return a new process pool whose workers sign with `private_key`.
+
+    The key is sent to every worker once, when it starts. `max_workers` defaults
+    to the number of CPUs. The caller owns the pool and shuts it down.
+    """
+    backend = SignerBackend(signer_backend)
+    workers = max_workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(private_key, backend)
+    )
+    _executor_info[executor] = (private_key, backend, workers)
+    return executor
+
+
+def get_signing_executor(
+    private_key: str,
+    max_workers: int | None = None,
+    signer_backend: SignerBackend | str = SignerBackend.ETH_ACCOUNT,
+) -> ProcessPoolExecutor:
+    """
+    Return the shared signing process pool of `private_key`, creating it on first use.
+
+    `max_workers` only takes effect when the pool is created; it defaults to
+    the number of CPUs.
+    """
+    key = (private_key, SignerBackend(signer_backend))
+    with _executor_lock:
+        executor = _executors.get(key)
+        if executor is None:
+            executor = create_signing_executor(private_key, max_workers, key[1])
+            _executors[key] = executor
+        return executor
+
+
+def shutdown_signing_executor() -> None:
+    """Shut down the shared signing process pools, if any were started."""
+    with _executor_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=True)
+
+
+atexit.register(shutdown_signing_executor)
+
+
+def sign_messages_batch(
+    private_key: str,
+    messages: list[SignableMessage],
+    executor: Executor | None = None,
+    chunk_size: int | None = None,
+    signer_backend: SignerBackend | str = SignerBackend.ETH_ACCOUNT,
+) -> list[SignatureRSV]:
+    """
+    Sign `messages` with `private_key` on `executor` and return (r, s, v) per message.
+
+    Results keep the order of `messages`. Messages are split into one chunk per
+    worker by default to amortize inter-process overhead. When `executor` is None
+    the shared pool from `get_signing_executor(private_key)` is used. Executors not
+    created by this module receive the key with every chunk, and are assumed to
+    have one worker per CPU.
+    """
+    if not messages:
+        return []
+    backend = SignerBackend(signer_backend)
+    executor = executor or get_signing_executor(private_key, signer_backend=backend)
+    info = _executor_info.get(executor)
+    workers = info[2] if info else os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = math.ceil(len(messages) / workers)
+    chunks = [messages[i : i + chunk_size] for i in range(0, len(messages), chunk_size)]
+    if _is_pool_of(executor, private_key, backend):
+        sign_chunk: Any = _sign_messages_chunk
+    else:
+        sign_chunk = partial(_sign_messages_chunk_with_key, private_key, backend)
+    signatures: list[SignatureRSV] = []
+    for chunk_signatures in executor.map(sign_chunk, chunks):
+        signatures.extend(chunk_signatures)
+    return signatures
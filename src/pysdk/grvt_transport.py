@@ -0,0 +1,105 @@
+"""
+HTTP transport settings shared by the REST clients.
+
+One `TransportConfig` sizes the connection pool, keep-alive and timeouts of a
+client's `aiohttp.ClientSession` or `requests.Session`. A client uses a single
+session for the edge, trade-data and market-data hosts, so the settings apply
+to each of them; per-host limits are per host.
+"""
+
+import socket
+from dataclasses import dataclass
+
+import aiohttp
+import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+from urllib3.connection import HTTPConnection
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    # aiohttp: connections open at once, in total and to one host (0: no limit)
+    limit: int = 100
+    limit_per_host: int = 0
+    # aiohttp: seconds an idle connection is kept open for reuse
+    keepalive_timeout: float = 30.0
+    # aiohttp: seconds resolved addresses are cached; None caches them forever
+    dns_cache_ttl: int | None = 300
+    # requests: disable Nagle's algorithm. aiohttp always does.
+    tcp_nodelay: bool = True
+    # Seconds to connect, and to wait for data once connected
+    connect_timeout: float = 5.0
+    read_timeout: float = 5.0
+    # requests: hosts with a pool, and connections kept in each pool. Without
+    # pool_block, connections past pool_maxsize are opened and then discarded.
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    # Connections opened to each host by warm_up_connections()
+    warm_up_connections_per_host: int = 2
+    # After warm-up, probe each host once the client has been idle this long, so
+    # pooled connections are not closed. Keep it below keepalive_timeout and the
+    # idle timeout of the server; None sends no probes.
+    keep_alive_probe_secs: float | None = None
+
+
+DEFAULT_TRANSPORT_CONFIG = TransportConfig()
+
+
+def get_aiohttp_timeout(config: TransportConfig) -> aiohttp.ClientTimeout:
+    return aiohttp.ClientTimeout(
+        total=None, sock_connect=config.connect_timeout, sock_read=config.read_timeout
+    )
+
+
+def get_requests_timeout(config: TransportConfig) -> tuple[float, float]:
+    return (config.connect_timeout, config.read_timeout)
+
+
+def create_aiohttp_session(
+    config: TransportConfig = DEFAULT_TRANSPORT_CONFIG,
+) -> aiohttp.ClientSession:
+    """JSON session with a connector sized by `config`; call in a coroutine."""
+    connector = aiohttp.TCPConnector(
+        limit=config.limit,
+        limit_per_host=config.limit_per_host,
+        keepalive_timeout=config.keepalive_timeout,
+        ttl_dns_cache=config.dns_cache_ttl,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={"Content-Type": "application/json"},
+        timeout=get_aiohttp_timeout(config),
+    )
+
+
+class _TransportAdapter(HTTPAdapter):
+    def __init__(self, config: TransportConfig):
+        self._socket_options = list(HTTPConnection.default_socket_options)
+        if not config.tcp_nodelay:
+            self._socket_options = [
+                option
+                for option in self._socket_options
+                if option[:2] != (socket.IPPROTO_TCP, socket.TCP_NODELAY)
+            ]
+        super().__init__(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+        )
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+def create_requests_session(
+    config: TransportConfig = DEFAULT_TRANSPORT_CONFIG,
+) -> requests.Session:
+    """JSON session whose connection pools are sized by `config`."""
+    session = requests.Session()
+    adapter = _TransportAdapter(config)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Content-Type": "application/json"})
+    return session
@@ -0,0 +1,309 @@
+"""
+Connection pre-warming, idle keep-alive probes and request latency histograms.
+
+The first request to a host pays for DNS, TCP and TLS setup, as does the first
+one after the server closed an idle connection. `warm_up_async` and
+`warm_up_sync` open several pooled connections to each host up front, and the
+keep-alive prober sends a cheap HEAD request to each host whenever the client
+has been idle for a while, so the connections stay open. Clients record every
+request in a `LatencyRecorder`, split before and after warm-up, to verify that
+the first orders are as fast as the steady state.
+"""
+
+import asyncio
+import bisect
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+import requests  # type: ignore
+
+# Upper bounds of the histogram buckets: 1/8 ms doubling up to 64 s
+LATENCY_BUCKET_BOUNDS_MS: tuple[float, ...] = tuple(0.125 * 2**i for i in range(20))
+BEFORE_WARM_UP = "before_warm_up"
+AFTER_WARM_UP = "after_warm_up"
+
+
+class LatencyHistogram:
+    """Latencies counted in buckets doubling in width; percentiles are bucket bounds."""
+
+    def __init__(self) -> None:
+        # The last bucket counts latencies over the last bound
+        self.buckets = [0] * (len(LATENCY_BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_secs: float) -> None:
+        latency_ms = latency_secs * 1000
+        self.buckets[bisect.bisect_left(LATENCY_BUCKET_BOUNDS_MS, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def percentile_ms(self, pct: float) -> float:
+        """Upper bound of the bucket holding the `pct` percentile, 0 if empty."""
+        if not self.count:
+            return 0.0
+        rank = pct / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                if index == len(LATENCY_BUCKET_BOUNDS_MS):
+                    return self.max_ms
+                return min(LATENCY_BUCKET_BOUNDS_MS[index], self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile_ms(50),
+            "p90_ms": self.percentile_ms(90),
+            "p99_ms": self.percentile_ms(99),
+            "max_ms": self.max_ms,
+            "buckets": {
+                f"<={bound:g}ms": bucket_count
+                for bound, bucket_count in zip(LATENCY_BUCKET_BOUNDS_MS, self.buckets)
+                if bucket_count
+            }
+            | ({"overflow": self.buckets[-1]} if self.buckets[-1] else {}),
+        }
+
+
+class LatencyRecorder:
+    """
+    Request latencies of one client.
+
+    They are kept in a histogram before warm-up and another after it. Thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self.histograms = {
+            BEFORE_WARM_UP: LatencyHistogram(),
+            AFTER_WARM_UP: LatencyHistogram(),
+        }
+        self.warm = False
+        self.last_request_time = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, latency_secs: float) -> None:
+        with self._lock:
+            self.histograms[AFTER_WARM_UP if self.warm else BEFORE_WARM_UP].record(
+                latency_secs
+            )
+            self.last_request_time = time.monotonic()
+
+    def mark_warm(self) -> None:
+        self.warm = True
+
+    def touch(self) -> None:
+        """Note activity other than a request, e.g. a keep-alive probe."""
+        self.last_request_time = time.monotonic()
+
+    def idle_secs(self) -> float:
+        return time.monotonic() - self.last_request_time
+
+    def to_dict(self) -> dict[str, dict]:
+        with self._lock:
+            return {name: hist.to_dict() for name, hist in self.histograms.items()}
+
+
+async def _probe_async(
+    session: aiohttp.ClientSession, url: str, logger: logging.Logger
+) -> bool:
+    try:
+        # Releasing the response returns the connection to the pool
+        async with session.head(url) as resp:
+            logger.debug(f"probe {url} {resp.status=}")
+        return True
+    except Exception as err:
+        logger.warning(f"probe {url} failed: {err!r}")
+        return False
+
+
+async def warm_up_async(
+    session: aiohttp.ClientSession,
+    urls: Iterable[str],
+    connections_per_host: int,
+    logger: logging.Logger | None = None,
+) -> int:
+    """
+    Open `connections_per_host` pooled connections to the host of each url at once.
+
+    Returns the number of successful probes.
+    """
+    logger = logger or logging.getLogger(__name__)
+    results = await asyncio.gather(
+        *[
+            _probe_async(session, url, logger)
+            for url in urls
+            for _ in range(connections_per_host)
+        ]
+    )
+    return sum(results)
+
+
+def _probe_sync(
+    session: requests.Session,
+    url: str,
+    timeout: tuple[float, float],
+    barrier: threading.Barrier,
+    logger: logging.Logger,
+) -> bool:
+    resp = None
+    try:
+        resp = session.head(url, timeout=timeout, stream=True)
+        logger.debug(f"probe {url} {resp.status_code=}")
+        return True
+    except Exception as err:
+        logger.warning(f"probe {url} failed: {err!r}")
+        return False
+    finally:
+        # The connection is held until every probe has one, else a fast probe
+        # could return it to the pool before a slow one starts and reuses it
+        try:
+            barrier.wait(sum(timeout))
+        except threading.BrokenBarrierError:
+            pass
+        if resp is not None:
+            # Once the empty body is read, closing releases the connection to the pool
+            _ = resp.content
+            resp.close()
+
+
+def warm_up_sync(
+    session: requests.Session,
+    urls: Iterable[str],
+    connections_per_host: int,
+    timeout: tuple[float, float],
+    logger: logging.Logger | None = None,
+) -> int:
+    """
+    Open `connections_per_host` pooled connections to the host of each url.
+
+    Each probe runs in its own thread, and holds its connection until every probe
+    has one. Connections beyond the pool size of the session are closed. Returns
+    the number of successful probes.
+    """
+    logger = logger or logging.getLogger(__name__)
+    probes = [url for url in urls for _ in range(connections_per_host)]
+    if not probes:
+        return 0
+    barrier = threading.Barrier(len(probes))
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        results = executor.map(
+            lambda url: _probe_sync(session, url, timeout, barrier, logger), probes
+        )
+        return sum(results)
+
+
+class AsyncKeepAlive:
+    """
+    Task probing every url once the client has been idle for `interval_secs`.
+
+    This keeps the server from closing its pooled connections.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        urls: list[str],
+        connections_per_host: int,
+        interval_secs: float,
+        recorder: LatencyRecorder,
+        logger: logging.Logger | None = None,
+    ):
+        self._session = session
+        self._urls = urls
+        self._connections_per_host = connections_per_host
+        self.interval_secs = interval_secs
+        self._recorder = recorder
+        self._logger = logger or logging.getLogger(__name__)
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def ensure_started(self) -> None:
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(max(0.0, self.interval_secs - self._recorder.idle_secs()))
+            if self._recorder.idle_secs() >= self.interval_secs:
+                await warm_up_async(
+                    self._session, self._urls, self._connections_per_host, self._logger
+                )
+                self._recorder.touch()
+
+
+class SyncKeepAlive:
+    """Daemon thread doing what `AsyncKeepAlive` does, for a `requests.Session`."""
+
+    def __init__(
+        self,
+        session: requests.Session,
+        urls: list[str],
+        connections_per_host: int,
+        interval_secs: float,
+        timeout: tuple[float, float],
+        recorder: LatencyRecorder,
+        logger: logging.Logger | None = None,
+    ):
+        self._session = session
+        self._urls = urls
+        self._connections_per_host = connections_per_host
+        self.interval_secs = interval_secs
+        self._timeout = timeout
+        self._recorder = recorder
+        self._logger = logger or logging.getLogger(__name__)
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def ensure_started(self) -> None:
+        with self._lock:
+            if self.running:
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="grvt-keep-alive", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopped.set()
+            thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(
+            max(0.0, self.interval_secs - self._recorder.idle_secs())
+        ):
+            if self._recorder.idle_secs() >= self.interval_secs:
+                warm_up_sync(
+                    self._session,
+                    self._urls,
+                    self._connections_per_host,
+                    self._timeout,
+                    self._logger,
+                )
+                self._recorder.touch()
@@ -0,0 +1,90 @@
+"""
+Event-loop stalls while signing an order burst, per AsyncSigner executor mode.
+
+A ticker coroutine sleeps 1 ms in a loop while the burst is signed; its worst
+oversleep is how long a market data reader would have been held up.
+
+Run with: python -m tests.benchmarks.bench_async_signing --orders 200
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from pysdk import grvt_ccxt_utils
+from pysdk.grvt_async_signing import AsyncSigner
+from pysdk.grvt_ccxt_env import CHAIN_IDS, GrvtEnv
+from pysdk.grvt_signer import get_available_signer_backends
+from pysdk.grvt_signing_context import SigningContext
+
+PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+INSTRUMENTS = {"BTC_USDT_Perp": {"instrument_hash": "0x030501", "base_decimals": 9}}
+
+
+async def run_burst(signer: AsyncSigner, orders: list) -> tuple[float, float]:
+    done = False
+    max_lag = 0.0
+
+    async def ticker() -> None:
+        nonlocal max_lag
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            max_lag = max(max_lag, time.perf_counter() - start - 0.001)
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(
+        *[
+            grvt_ccxt_utils.get_order_payload_async(
+                order, GrvtEnv.TESTNET, INSTRUMENTS, signer
+            )
+            for order in orders
+        ]
+    )
+    elapsed = time.perf_counter() - start
+    done = True
+    await ticker_task
+    return elapsed, max_lag
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=200)
+    args = parser.parse_args()
+
+    sys.stdout.write(
+        f"{'backend':>12} {'executor':>9} {'orders/sec':>11} {'max lag ms':>11}"
+        f" {'loop signing ms':>16} {'max loop lag ms':>16}\n"
+    )
+    for backend in get_available_signer_backends():
+        context = SigningContext.from_key(
+            PRIVATE_KEY, CHAIN_IDS[GrvtEnv.TESTNET.value], backend
+        )
+        for executor in ["inline", "thread", "process"]:
+            orders = [
+                grvt_ccxt_utils.get_grvt_order(
+                    sub_account_id="8289849667772468",
+                    symbol="BTC_USDT_Perp",
+                    order_type="limit",
+                    side="buy",
+                    amount="0.01",
+                    limit_price=str(60_000 + i),
+                )
+                for i in range(args.orders)
+            ]
+            signer = AsyncSigner(context, executor)  # type: ignore[arg-type]
+            elapsed, max_lag = asyncio.run(run_burst(signer, orders))
+            signer.close()
+            metrics = signer.metrics
+            sys.stdout.write(
+                f"{backend.value:>12} {executor:>9} {args.orders / elapsed:11.0f}"
+                f" {max_lag * 1e3:11.2f} {metrics.loop_signing_secs * 1e3:16.2f}"
+                f" {metrics.max_loop_lag_secs * 1e3:16.3f}\n"
+            )
+
+
+if __name__ == "__main__":
+    main()
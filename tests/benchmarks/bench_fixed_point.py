@@ -0,0 +1,42 @@
+"""
+Per-value cost of scaling prices: Decimal math versus grvt_fixed_point.
+
+Run with: python -m tests.benchmarks.bench_fixed_point --values 100000
+"""
+
+import argparse
+import sys
+import time
+from decimal import Decimal
+
+from pysdk.grvt_fixed_point import to_scaled_int, to_scaled_ints
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--values", type=int, default=100_000)
+    args = parser.parse_args()
+
+    prices = [f"{60_000 + i % 5_000}.{i % 10}" for i in range(args.values)]
+    results = {}
+
+    start = time.perf_counter()
+    want = [int(Decimal(price) * Decimal(10**9)) for price in prices]
+    results["int(Decimal(v) * Decimal(10**9))"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    got = [to_scaled_int(price, 9) for price in prices]
+    results["to_scaled_int"] = time.perf_counter() - start
+    assert got == want
+
+    start = time.perf_counter()
+    got = to_scaled_ints(prices, 9)
+    results["to_scaled_ints"] = time.perf_counter() - start
+    assert got == want
+
+    for name, elapsed in results.items():
+        sys.stdout.write(f"{name:<34} {elapsed / args.values * 1e9:8.0f} ns/value\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Time to download a long trade history from a local server.
+
+The server answers each page after a simulated network latency. The history is
+downloaded through one cursor chain, and with the time windows of
+download_history fetched concurrently.
+
+Run with: python -m tests.benchmarks.bench_history_download --trades 50000
+"""
+
+import argparse
+import asyncio
+import bisect
+import logging
+import sys
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pysdk.grvt_raw_async import GrvtRawAsync
+from pysdk.grvt_raw_base import GrvtApiConfig
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_types import ApiTradeHistoryRequest
+
+from .bench_history_iteration import trade_page
+
+SECOND = 1_000_000_000
+
+
+async def run(count: int, limit: int, latency_ms: float, concurrency: list[int]) -> None:
+    # One trade a second, newest first; a trade every 0.1 s in the last tenth
+    trades = trade_page(0, 1, count)["result"]
+    event_time = count * SECOND
+    for index, trade in enumerate(trades):
+        event_time -= SECOND // 10 if index < count // 10 else SECOND
+        trade["event_time"] = str(event_time)
+    times = [-int(trade["event_time"]) for trade in trades]
+    requests = 0
+
+    async def handler(request: web.Request) -> web.Response:
+        nonlocal requests
+        requests += 1
+        body = await request.json()
+        first = bisect.bisect_left(times, -int(body.get("end_time") or 2**63))
+        last = bisect.bisect_right(times, -int(body.get("start_time") or 0))
+        offset = first + int(body.get("cursor") or 0)
+        end = min(offset + body["limit"], last)
+        await asyncio.sleep(latency_ms / 1000)
+        return web.json_response(
+            {"result": trades[offset:end], "next": str(end - first) if end < last else ""}
+        )
+
+    app = web.Application()
+    app.router.add_post("/full/v1/trade_history", handler)
+    server = TestServer(app)
+    await server.start_server()
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.INFO)
+    api = GrvtRawAsync(
+        GrvtApiConfig(
+            env=GrvtEnv.TESTNET,
+            trading_account_id=None,
+            private_key=None,
+            api_key=None,
+            logger=logger,
+        )
+    )
+    api.md_rpc = str(server.make_url("")).rstrip("/")
+    req = ApiTradeHistoryRequest("BTC_USDT_Perp", limit=limit)
+    start_time, end_time = -times[-1], -times[0]
+
+    sys.stdout.write(f"{'case':<24} {'trades':>7} {'requests':>9} {'total ms':>9}\n")
+    start = time.perf_counter()
+    chain = [trade async for trade in api.iter_history(api.trade_history_v1, req)]
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    sys.stdout.write(
+        f"{'one cursor chain':<24} {len(chain):7} {requests:9} {elapsed_ms:9.1f}\n"
+    )
+    for max_concurrency in concurrency:
+        requests = 0
+        start = time.perf_counter()
+        downloaded = await api.download_history(
+            api.trade_history_v1, req, start_time, end_time, max_concurrency
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        assert [t.trade_id for t in downloaded] == [t.trade_id for t in chain]
+        name = f"download_history x{max_concurrency}"
+        sys.stdout.write(
+            f"{name:<24} {len(downloaded):7} {requests:9} {elapsed_ms:9.1f}\n"
+        )
+    await api.close()
+    await server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trades", type=int, default=50_000)
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[2, 4, 8, 16])
+    args = parser.parse_args()
+    asyncio.run(run(args.trades, args.limit, args.latency_ms, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Time to stream a paginated fill history through a consumer of every page.
+
+The consumer spends some time on each page. The cursors are followed by hand,
+and with the iterators of grvt_history, which fetch the next page while the
+current one is processed. The local server answers each page after a simulated
+network latency.
+
+Run with: python -m tests.benchmarks.bench_history_iteration --pages 20
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pysdk.grvt_raw_async import GrvtRawAsync
+from pysdk.grvt_raw_base import GrvtApiConfig
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_types import ApiTradeHistoryRequest, ApiTradeHistoryResponse
+
+
+def trade_page(index: int, pages: int, size: int) -> dict:
+    return {
+        "result": [
+            {
+                "event_time": str(1730800479321350000 - index * size - i),
+                "instrument": "BTC_USDT_Perp",
+                "is_taker_buyer": i % 2 == 0,
+                "size": "0.013",
+                "price": f"{64000 + i * 0.1:.1f}",
+                "mark_price": "64001.2",
+                "index_price": "64000.9",
+                "interest_rate": "0.0003",
+                "forward_price": "64002.1",
+                "trade_id": f"{2000000 + index * size + i}-1",
+                "venue": "ORDERBOOK",
+                "is_rpi": False,
+            }
+            for i in range(size)
+        ],
+        "next": str(index + 1) if index + 1 < pages else "",
+    }
+
+
+async def run(pages: int, size: int, latency_ms: float, work_ms: float) -> None:
+    bodies = {str(index): trade_page(index, pages, size) for index in range(pages)}
+
+    async def handler(request: web.Request) -> web.Response:
+        cursor = (await request.json()).get("cursor") or "0"
+        await asyncio.sleep(latency_ms / 1000)
+        return web.json_response(bodies[cursor])
+
+    app = web.Application()
+    app.router.add_post("/full/v1/trade_history", handler)
+    server = TestServer(app)
+    await server.start_server()
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.INFO)
+    api = GrvtRawAsync(
+        GrvtApiConfig(
+            env=GrvtEnv.TESTNET,
+            trading_account_id=None,
+            private_key=None,
+            api_key=None,
+            logger=logger,
+        )
+    )
+    api.md_rpc = str(server.make_url("")).rstrip("/")
+    req = ApiTradeHistoryRequest("BTC_USDT_Perp", limit=size)
+
+    async def process(page: ApiTradeHistoryResponse) -> None:
+        # Stands for storing or aggregating the page
+        await asyncio.sleep(work_ms / 1000)
+
+    async def by_hand() -> None:
+        page_req = req
+        while True:
+            page = await api.trade_history_v1(page_req)
+            await process(page)
+            if not page.next:
+                return
+            page_req = ApiTradeHistoryRequest(
+                "BTC_USDT_Perp", limit=size, cursor=page.next
+            )
+
+    async def prefetched() -> None:
+        async for page in api.iter_history_pages(api.trade_history_v1, req):
+            await process(page)
+
+    sys.stdout.write(f"{'case':<14} {'total ms':>9} {'ms/page':>8}\n")
+    for name, call in {"by hand": by_hand, "iter_history": prefetched}.items():
+        start = time.perf_counter()
+        await call()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        sys.stdout.write(f"{name:<14} {elapsed_ms:9.1f} {elapsed_ms / pages:8.1f}\n")
+    await api.close()
+    await server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=30)
+    parser.add_argument("--work-ms", type=float, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.pages, args.page_size, args.latency_ms, args.work_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Encode and decode speed of each installed JSON backend on typical payloads.
+
+The payloads are a 200-level order book, a 1000-fill history page and a create
+order request.
+
+The json rows are what every client used before this codec.
+
+Run with: python -m tests.benchmarks.bench_json_codec --iterations 200
+"""
+
+import argparse
+import json
+import sys
+
+from pysdk.grvt_json import JsonCodec, get_available_json_backends
+from pysdk.grvt_raw_types import ApiCreateOrderRequest, OrderLeg
+
+from ..pysdk.test_grvt_eip712 import make_order
+from .bench_signing_suite import measure
+
+
+def order_book(depth: int) -> dict:
+    def levels(sign: int) -> list[dict]:
+        return [
+            {
+                "price": f"{64000 + sign * (i + 1) * 0.5:.1f}",
+                "size": f"{0.001 * (i + 1):.3f}",
+                "num_orders": i % 7 + 1,
+            }
+            for i in range(depth)
+        ]
+
+    return {
+        "result": {
+            "event_time": "1730800479321350000",
+            "instrument": "BTC_USDT_Perp",
+            "bids": levels(-1),
+            "asks": levels(1),
+        }
+    }
+
+
+def fill_history(count: int) -> dict:
+    return {
+        "result": [
+            {
+                "event_time": str(1730800479321350000 + i),
+                "sub_account_id": "8289849667772468",
+                "instrument": "BTC_USDT_Perp",
+                "is_buyer": i % 2 == 0,
+                "is_taker": i % 3 == 0,
+                "size": "0.013",
+                "price": f"{64000 + i * 0.1:.1f}",
+                "mark_price": "64001.2",
+                "index_price": "64000.9",
+                "interest_rate": "0.0003",
+                "forward_price": "64002.1",
+                "realized_pnl": "-1.25",
+                "fee": "0.41",
+                "fee_rate": "0.0005",
+                "trade_id": f"{2000000 + i}-1",
+                "order_id": f"0x{i:064x}",
+                "venue": "ORDERBOOK",
+                "client_order_id": str(i),
+                "signer": "0x0c1f4c8ee7acd9ea19b91bbb343cbaf6efd58ce1",
+                "broker": "UNSPECIFIED",
+                "is_rpi": False,
+            }
+            for i in range(count)
+        ],
+        "next": "eyJjdXJzb3IiOiAxMjN9",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    args = parser.parse_args()
+
+    order_request = ApiCreateOrderRequest(
+        order=make_order([OrderLeg("BTC_USDT_Perp", "1.013", False, "68900.5")])
+    )
+    payloads = {
+        "book_200": order_book(200),
+        "fills_1000": fill_history(1000),
+    }
+    sys.stdout.write(
+        f"{'case':<28} {'backend':<8} {'ops/sec':>9} {'p50 us':>9} {'p99 us':>9}\n"
+    )
+    for backend in get_available_json_backends():
+        codec = JsonCodec(backend)
+        cases = {"dumps/create_order": lambda codec=codec: codec.dumps(order_request)}
+        for name, payload in payloads.items():
+            data = json.dumps(payload).encode()
+            cases[f"loads/{name}"] = lambda codec=codec, data=data: codec.loads(data)
+            cases[f"dumpb/{name}"] = lambda codec=codec, payload=payload: codec.dumpb(
+                payload
+            )
+        for name, call in cases.items():
+            result = measure(call, args.iterations, args.warmup)
+            sys.stdout.write(
+                f"{name:<28} {backend.value:<8} {result['ops_per_sec']:9.0f}"
+                f" {result['p50_us']:9.1f} {result['p99_us']:9.1f}\n"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Cost of firing an order: signing on demand versus taking it from a pre-signed ladder.
+
+Run with: python -m tests.benchmarks.bench_order_template --levels 200
+"""
+
+import argparse
+import copy
+import sys
+import time
+
+from pysdk.grvt_order_template import OrderTemplate, PresignedOrderLadder
+from pysdk.grvt_raw_base import GrvtApiConfig
+from pysdk.grvt_raw_env import CHAIN_IDS, GrvtEnv
+from pysdk.grvt_raw_signing import sign_order
+from pysdk.grvt_signing_context import SigningContext
+
+from ..pysdk.test_grvt_eip712 import INSTRUMENTS, ORDERS
+
+PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--levels", type=int, default=200)
+    args = parser.parse_args()
+
+    chain_id = CHAIN_IDS[GrvtEnv.TESTNET]
+    config = GrvtApiConfig(
+        env=GrvtEnv.TESTNET,
+        private_key=PRIVATE_KEY,
+        trading_account_id="8289849667772468",
+        api_key=None,
+        logger=None,
+    )
+    context = SigningContext.from_key(PRIVATE_KEY, chain_id)
+    template = OrderTemplate(ORDERS[0], INSTRUMENTS, chain_id)
+    levels = [[("0.1", str(68_000 + i))] for i in range(args.levels)]
+    orders = [
+        template.new_order(legs, i, 1730800479321350000) for i, legs in enumerate(levels)
+    ]
+
+    start = time.perf_counter()
+    for order in copy.deepcopy(orders):
+        sign_order(order, config, context.account, INSTRUMENTS, context)
+    sign_on_demand = (time.perf_counter() - start) / args.levels
+
+    start = time.perf_counter()
+    for order in orders:
+        template.get_signable_message(order)
+    template_hash = (time.perf_counter() - start) / args.levels
+
+    ladder = PresignedOrderLadder(template, context)
+    start = time.perf_counter()
+    ladder.presign(levels)
+    presign = (time.perf_counter() - start) / args.levels
+
+    start = time.perf_counter()
+    for legs in levels:
+        ladder.take(legs)
+    take = (time.perf_counter() - start) / args.levels
+
+    sys.stdout.write(
+        f"sign_order on demand:       {sign_on_demand * 1e6:10.1f} us/order\n"
+        f"template hash only:         {template_hash * 1e6:10.1f} us/order\n"
+        f"ladder presign (ahead):     {presign * 1e6:10.1f} us/order\n"
+        f"ladder take (at fire time): {take * 1e6:10.1f} us/order\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Memory of large histories of the slotted grvt_raw_types dataclasses.
+
+They are compared against plain dataclasses with the same fields, where every
+instance has a __dict__.
+
+Run with: python -m tests.benchmarks.bench_raw_types_memory --count 100000
+"""
+
+import argparse
+import dataclasses
+import gc
+import itertools
+import sys
+import tracemalloc
+import typing
+from typing import Any
+
+from pysdk import grvt_raw_types as types
+from pysdk.grvt_raw_decoder import from_dict
+
+from ..pysdk.test_grvt_raw_decoder import make_data
+
+TYPES = [
+    types.Fill,
+    types.Trade,
+    types.Order,
+    types.OrderLeg,
+    types.OrderbookLevel,
+    types.Candlestick,
+    types.Positions,
+    types.FundingPayment,
+]
+
+
+@typing.no_type_check
+def get_plain(cls: type, plain: dict[type, type]) -> type:
+    """Copy of `cls` without slots, whose nested dataclasses are copies too."""
+    if cls not in plain:
+        fields = [
+            (field.name, field.type, dataclasses.field(default=field.default))
+            for field in dataclasses.fields(cls)
+        ]
+        plain[cls] = dataclasses.make_dataclass(f"Plain{cls.__name__}", fields)
+    return plain[cls]
+
+
+def rebuild(value: Any, get_class: typing.Callable[[type], type]) -> Any:
+    """Copy of `value` whose dataclasses are instances of `get_class(type)`."""
+    if isinstance(value, list):
+        return [rebuild(item, get_class) for item in value]
+    if dataclasses.is_dataclass(value):
+        return get_class(type(value))(
+            **{
+                field.name: rebuild(getattr(value, field.name), get_class)
+                for field in dataclasses.fields(value)
+            }
+        )
+    return value
+
+
+def measure_bytes(build: typing.Callable[[], list]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    values = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del values
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    plain: dict[type, type] = {}
+    sys.stdout.write(f"{'type':<16} {'plain MiB':>10} {'slotted MiB':>12} {'saved':>7}\n")
+    for cls in TYPES:
+        sample = from_dict(cls, make_data(cls, itertools.count(), False))
+        # Both copies share the field values, so only the objects are compared
+        plain_bytes = measure_bytes(
+            lambda sample=sample: [
+                rebuild(sample, lambda data_class: get_plain(data_class, plain))
+                for _ in range(args.count)
+            ]
+        )
+        slotted_bytes = measure_bytes(
+            lambda sample=sample: [
+                rebuild(sample, lambda data_class: data_class) for _ in range(args.count)
+            ]
+        )
+        sys.stdout.write(
+            f"{cls.__name__:<16} {plain_bytes / 2**20:10.1f}"
+            f" {slotted_bytes / 2**20:12.1f} {1 - slotted_bytes / plain_bytes:7.0%}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Time to encode create order and cancel all orders requests to JSON bytes.
+
+Compares `DataclassJSONEncoder`, as the clients did before, the codec of each
+installed backend alone, and the compiled encoders of grvt_raw_encoder followed
+by that codec, as the clients do now.
+
+Run with: python -m tests.benchmarks.bench_request_encoding --iterations 2000
+"""
+
+import argparse
+import json
+import sys
+from collections.abc import Callable
+
+from pysdk.grvt_json import JsonCodec, get_available_json_backends
+from pysdk.grvt_raw_base import DataclassJSONEncoder
+from pysdk.grvt_raw_encoder import to_dict
+from pysdk.grvt_raw_types import ApiCancelAllOrdersRequest, ApiCreateOrderRequest, Kind
+
+from ..pysdk.test_grvt_eip712 import ORDERS
+from .bench_signing_suite import measure
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=200)
+    args = parser.parse_args()
+
+    payloads = {
+        "create_order": ApiCreateOrderRequest(order=ORDERS[0]),
+        "create_order_2_legs": ApiCreateOrderRequest(order=ORDERS[2]),
+        "cancel_all_orders": ApiCancelAllOrdersRequest(
+            sub_account_id="8289849667772468",
+            kind=[Kind.PERPETUAL, Kind.FUTURE],
+            base=["BTC", "ETH", "SOL"],
+            quote=["USDT"],
+        ),
+    }
+    sys.stdout.write(
+        f"{'case':<22} {'encoder':<16} {'bytes':>6} {'p50 us':>8} {'p99 us':>8}\n"
+    )
+    for name, request in payloads.items():
+        cases: dict[str, Callable[[], bytes]] = {
+            "DataclassJSON": lambda request=request: json.dumps(
+                request, cls=DataclassJSONEncoder
+            ).encode(),
+        }
+        for backend in get_available_json_backends():
+            codec = JsonCodec(backend)
+            cases[backend.value] = lambda codec=codec, request=request: codec.dumpb(
+                request
+            )
+            cases[f"compiled+{backend.value}"] = lambda codec=codec, request=request: (
+                codec.dumpb(to_dict(request))
+            )
+        for encoder, call in cases.items():
+            result = measure(call, args.iterations, args.warmup)
+            sys.stdout.write(
+                f"{name:<22} {encoder:<16} {len(call()):6}"
+                f" {result['p50_us']:8.1f} {result['p99_us']:8.1f}\n"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Time to build the raw response dataclasses from parsed JSON.
+
+Compares dacite with the compiled decoders of grvt_raw_decoder, for large
+history pages and order books.
+
+Run with: python -m tests.benchmarks.bench_response_decoding --iterations 50
+"""
+
+import argparse
+import sys
+from enum import Enum
+
+from dacite import Config
+from dacite import from_dict as dacite_from_dict
+
+from pysdk import grvt_raw_types as types
+from pysdk.grvt_raw_decoder import from_dict
+
+from .bench_json_codec import fill_history, order_book
+from .bench_signing_suite import measure
+
+
+def order_history(count: int) -> dict:
+    return {
+        "result": [
+            {
+                "order_id": f"0x{i:064x}",
+                "sub_account_id": "8289849667772468",
+                "is_market": False,
+                "time_in_force": "GOOD_TILL_TIME",
+                "post_only": False,
+                "reduce_only": False,
+                "legs": [
+                    {
+                        "instrument": "BTC_USDT_Perp",
+                        "size": "0.013",
+                        "limit_price": f"{64000 + i * 0.1:.1f}",
+                        "is_buying_asset": i % 2 == 0,
+                    }
+                ],
+                "signature": {
+                    "signer": "0x0c1f4c8ee7acd9ea19b91bbb343cbaf6efd58ce1",
+                    "r": "0x" + "1" * 64,
+                    "s": "0x" + "2" * 64,
+                    "v": 27,
+                    "expiration": "1730800479321350000",
+                    "nonce": i,
+                },
+                "metadata": {"client_order_id": str(i), "create_time": str(i)},
+                "state": {
+                    "status": "FILLED",
+                    "reject_reason": "UNSPECIFIED",
+                    "book_size": ["0"],
+                    "traded_size": ["0.013"],
+                    "update_time": "1730800479321350000",
+                    "avg_fill_price": ["64000.1"],
+                },
+            }
+            for i in range(count)
+        ],
+        "next": "eyJjdXJzb3IiOiAxMjN9",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    args = parser.parse_args()
+
+    payloads = {
+        "fills_1000": (types.ApiFillHistoryResponse, fill_history(1000)),
+        "orders_1000": (types.ApiOrderHistoryResponse, order_history(1000)),
+        "book_200": (types.ApiOrderbookLevelsResponse, order_book(200)),
+    }
+    config = Config(cast=[Enum])
+    sys.stdout.write(
+        f"{'case':<14} {'dacite ms':>10} {'compiled ms':>12} {'speedup':>8}\n"
+    )
+    for name, (cls, data) in payloads.items():
+        assert from_dict(cls, data) == dacite_from_dict(cls, data, config)
+        dacite = measure(
+            lambda cls=cls, data=data: dacite_from_dict(cls, data, config),
+            args.iterations,
+            args.warmup,
+        )
+        compiled = measure(
+            lambda cls=cls, data=data: from_dict(cls, data), args.iterations, args.warmup
+        )
+        sys.stdout.write(
+            f"{name:<14} {dacite['mean_us'] / 1000:10.2f}"
+            f" {compiled['mean_us'] / 1000:12.3f}"
+            f" {dacite['mean_us'] / compiled['mean_us']:7.0f}x\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Latency and peak memory of reading a large fill history response.
+
+Compares the way the clients did it before (decode the body to text, then parse
+it) with the way they do now (parse the body bytes once), with aiohttp and
+requests against a local server.
+
+Run with: python -m tests.benchmarks.bench_response_parsing --fills 5000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import aiohttp
+import requests  # type: ignore
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pysdk.grvt_json import json_loads
+from pysdk.grvt_raw_async import GrvtRawAsync
+from pysdk.grvt_raw_base import GrvtApiConfig
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_sync import GrvtRawSync
+
+from .bench_json_codec import fill_history
+from .bench_signing_suite import percentile
+
+
+def get_config() -> GrvtApiConfig:
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.INFO)
+    return GrvtApiConfig(
+        env=GrvtEnv.TESTNET,
+        trading_account_id="8289849667772468",
+        private_key=None,
+        api_key=None,
+        logger=logger,
+    )
+
+
+def print_result(name: str, latencies_ms: list[float], peak_bytes: int) -> None:
+    latencies_ms.sort()
+    sys.stdout.write(
+        f"{name:<30} {statistics.fmean(latencies_ms):8.2f} "
+        f"{percentile(latencies_ms, 50):8.2f} {percentile(latencies_ms, 99):8.2f} "
+        f"{peak_bytes / 2**20:9.1f}\n"
+    )
+
+
+async def measure_async(
+    call: Callable[[], Awaitable[object]], iterations: int
+) -> tuple[list[float], int]:
+    await call()
+    latencies_ms = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await call()
+        latencies_ms.append((time.perf_counter() - start) * 1000)
+    # Traced separately, as tracing slows every allocation down
+    tracemalloc.start()
+    await call()
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return latencies_ms, peak_bytes
+
+
+def measure_sync(call: Callable[[], object], iterations: int) -> tuple[list[float], int]:
+    call()
+    latencies_ms = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        latencies_ms.append((time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    call()
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return latencies_ms, peak_bytes
+
+
+async def run_aiohttp(body: bytes, iterations: int) -> None:
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_post("/full/v1/fill_history", handler)
+    server = TestServer(app)
+    await server.start_server()
+    url = str(server.make_url("/full/v1/fill_history"))
+    session = aiohttp.ClientSession()
+    api = GrvtRawAsync(get_config())
+
+    async def text_then_json() -> object:
+        async with session.post(url, data="{}") as resp:
+            await resp.text()
+            return await resp.json(loads=json_loads, content_type="application/json")
+
+    async def read_once() -> object:
+        async with session.post(url, data="{}") as resp:
+            return json_loads(await resp.read())
+
+    cases: dict[str, Callable[[], Awaitable[object]]] = {
+        "aiohttp text() + json()": text_then_json,
+        "aiohttp read() + loads": read_once,
+        "GrvtRawAsync._post": lambda: api._post(False, url, {}),
+    }
+    for name, call in cases.items():
+        print_result(name, *await measure_async(call, iterations))
+    await api.close()
+    await session.close()
+    await server.close()
+
+
+def run_requests(body: bytes, iterations: int) -> None:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/full/v1/fill_history"
+    session = requests.Session()
+    api = GrvtRawSync(get_config())
+
+    def text_then_loads() -> object:
+        resp = session.post(url, data="{}")
+        return json_loads(resp.text)
+
+    cases: dict[str, Callable[[], object]] = {
+        "requests .text + loads": text_then_loads,
+        "requests .content + loads": lambda: json_loads(
+            session.post(url, data="{}").content
+        ),
+        "GrvtRawSync._post": lambda: api._post(False, url, {}),
+    }
+    for name, call in cases.items():
+        print_result(name, *measure_sync(call, iterations))
+    api.close()
+    session.close()
+    server.shutdown()
+    server.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fills", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    body = json.dumps(fill_history(args.fills)).encode()
+    sys.stdout.write(
+        f"Response of {args.fills} fills, {len(body) / 2**20:.1f} MiB\n"
+        f"{'case':<30} {'mean ms':>8} {'p50 ms':>8} {'p99 ms':>8} {'peak MiB':>9}\n"
+    )
+    asyncio.run(run_aiohttp(body, args.iterations))
+    run_requests(body, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
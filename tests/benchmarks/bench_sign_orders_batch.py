@@ -0,0 +1,84 @@
+"""
+Scaling benchmark for `sign_orders_batch`.
+
+Signs a ladder of orders serially with `sign_order`, then with `sign_orders_batch`
+on process pools of increasing size, and prints throughput and speedup.
+
+Run with: python -m tests.benchmarks.bench_sign_orders_batch --orders 200
+"""
+
+import argparse
+import copy
+import logging
+import os
+import sys
+import time
+
+from eth_account import Account
+
+from pysdk.grvt_raw_base import GrvtApiConfig
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_signing import sign_order, sign_orders_batch
+from pysdk.grvt_raw_types import OrderLeg
+from pysdk.grvt_signing_pool import create_signing_executor
+
+from ..pysdk.test_grvt_eip712 import INSTRUMENTS, make_order
+
+PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+
+
+def get_ladder(num_orders: int) -> list:
+    return [
+        make_order(
+            [OrderLeg("BTC_USDT_Perp", "0.01", i % 2 == 0, str(60_000 + i))],
+            post_only=True,
+        )
+        for i in range(num_orders)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=200)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    config = GrvtApiConfig(
+        env=GrvtEnv.TESTNET,
+        trading_account_id="8289849667772468",
+        private_key=PRIVATE_KEY,
+        api_key=None,
+        logger=logging.getLogger(__name__),
+    )
+    account = Account.from_key(PRIVATE_KEY)
+    ladder = get_ladder(args.orders)
+
+    start = time.perf_counter()
+    for order in copy.deepcopy(ladder):
+        sign_order(order, config, account, INSTRUMENTS)
+    serial_secs = time.perf_counter() - start
+    sys.stdout.write(f"{'workers':>8} {'secs':>8} {'orders/s':>10} {'speedup':>8}\n")
+    serial_rate = args.orders / serial_secs
+    sys.stdout.write(f"{'serial':>8} {serial_secs:8.3f} {serial_rate:10.1f} {1.0:8.2f}\n")
+
+    worker_counts = [
+        2**i for i in range(args.max_workers.bit_length()) if 2**i < args.max_workers
+    ]
+    for workers in [*worker_counts, args.max_workers]:
+        with create_signing_executor(PRIVATE_KEY, workers) as executor:
+            # Warm up the pool so process start-up is not measured
+            sign_orders_batch(
+                copy.deepcopy(ladder[:workers]), config, INSTRUMENTS, executor
+            )
+            orders = copy.deepcopy(ladder)
+            start = time.perf_counter()
+            sign_orders_batch(orders, config, INSTRUMENTS, executor)
+            secs = time.perf_counter() - start
+        sys.stdout.write(
+            f"{workers:>8} {secs:8.3f} {args.orders / secs:10.1f}"
+            f" {serial_secs / secs:8.2f}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
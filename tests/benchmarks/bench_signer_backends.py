@@ -0,0 +1,40 @@
+"""
+Per-digest signing cost of each available secp256k1 signer backend.
+
+Note that eth_keys itself switches to coincurve when it is installed, so the
+eth_account numbers are only pure Python in an environment without coincurve.
+
+Run with: python -m tests.benchmarks.bench_signer_backends --digests 2000
+"""
+
+import argparse
+import sys
+import time
+
+from eth_utils import keccak
+
+from pysdk.grvt_signer import get_available_signer_backends, get_signer
+
+PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--digests", type=int, default=2000)
+    args = parser.parse_args()
+
+    digests = [keccak(i.to_bytes(8, byteorder="big")) for i in range(args.digests)]
+    sys.stdout.write(f"{'backend':>12} {'us/sign':>10} {'signs/sec':>12}\n")
+    for backend in get_available_signer_backends():
+        signer = get_signer(PRIVATE_KEY, backend)
+        start = time.perf_counter()
+        for digest in digests:
+            signer.sign_digest(digest)
+        per_sign = (time.perf_counter() - start) / args.digests
+        sys.stdout.write(
+            f"{backend.value:>12} {per_sign * 1e6:10.1f} {1 / per_sign:12.0f}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
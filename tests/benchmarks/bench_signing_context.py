@@ -0,0 +1,61 @@
+"""
+Per-order cost of deriving the key on every sign versus reusing a SigningContext.
+
+Run with: python -m tests.benchmarks.bench_signing_context --orders 200
+"""
+
+import argparse
+import copy
+import sys
+import time
+
+from pysdk import grvt_ccxt_utils
+from pysdk.grvt_ccxt_env import CHAIN_IDS, GrvtEnv
+from pysdk.grvt_signing_context import SigningContext
+
+PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+INSTRUMENTS = {"BTC_USDT_Perp": {"instrument_hash": "0x030501", "base_decimals": 9}}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=200)
+    args = parser.parse_args()
+
+    orders = [
+        grvt_ccxt_utils.get_grvt_order(
+            sub_account_id="8289849667772468",
+            symbol="BTC_USDT_Perp",
+            order_type="limit",
+            side="buy",
+            amount="0.01",
+            limit_price=str(60_000 + i),
+        )
+        for i in range(args.orders)
+    ]
+
+    start = time.perf_counter()
+    for order in copy.deepcopy(orders):
+        grvt_ccxt_utils.get_order_payload(
+            order, PRIVATE_KEY, GrvtEnv.TESTNET, INSTRUMENTS
+        )
+    without_context = (time.perf_counter() - start) / args.orders
+
+    context = SigningContext.from_key(PRIVATE_KEY, CHAIN_IDS[GrvtEnv.TESTNET.value])
+    start = time.perf_counter()
+    for order in copy.deepcopy(orders):
+        grvt_ccxt_utils.get_order_payload(
+            order, PRIVATE_KEY, GrvtEnv.TESTNET, INSTRUMENTS, signing_context=context
+        )
+    with_context = (time.perf_counter() - start) / args.orders
+
+    saving_us = (without_context - with_context) * 1e6
+    sys.stdout.write(
+        f"get_order_payload without context: {without_context * 1e6:10.1f} us/order\n"
+        f"get_order_payload with context:    {with_context * 1e6:10.1f} us/order\n"
+        f"saving per order:                  {saving_us:10.1f} us\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
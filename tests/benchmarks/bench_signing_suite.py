@@ -0,0 +1,261 @@
+"""
+Throughput and latency percentiles of every signing entry point.
+
+Covers 1-leg and multi-leg orders, and saves the results to JSON so regressions
+are visible across releases.
+
+Runs offline with the fixed keys of test_grvt_raw_signing.py.
+
+Run with: python -m tests.benchmarks.bench_signing_suite --iterations 500 \
+    --output bench_signing.json [--baseline previous.json]
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from importlib.metadata import PackageNotFoundError, version
+
+from pysdk import grvt_ccxt_utils
+from pysdk.grvt_ccxt_env import GrvtEnv as GrvtCcxtEnv
+from pysdk.grvt_fixed_types import Transfer, TransferType
+from pysdk.grvt_raw_base import GrvtApiConfig
+from pysdk.grvt_raw_env import CHAIN_IDS, GrvtEnv
+from pysdk.grvt_raw_signing import sign_order, sign_transfer, sign_withdrawal
+from pysdk.grvt_raw_types import Order, OrderLeg, Signature, Withdrawal
+from pysdk.grvt_signer import SignerBackend, get_available_signer_backends
+from pysdk.grvt_signing_context import SigningContext
+
+from ..pysdk.test_grvt_eip712 import INSTRUMENTS, make_order
+
+PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+MAIN_ACCOUNT_ID = "0x0c1f4c8ee7acd9ea19b91bbb343cbaf6efd58ce1"
+SUB_ACCOUNT_ID = "8289849667772468"
+EXPIRY = 1730800479321350000
+NONCE = 828700936
+BUILDER = "0xAbC1230001230001230001230001230001230001"
+
+CCXT_INSTRUMENTS = {
+    name: {"instrument_hash": inst.instrument_hash, "base_decimals": inst.base_decimals}
+    for name, inst in INSTRUMENTS.items()
+}
+
+# (instrument, size, is_buying_asset, limit_price) of each leg
+LEGS = {
+    "1leg": [("BTC_USDT_Perp", "1.013", False, "68900.5")],
+    "2leg": [
+        ("BTC_USDT_Perp", "1.123123123", True, "68900.777123479"),
+        ("ETH_USDT_Perp", "12.5", False, "3100.25"),
+    ],
+    "4leg": [
+        ("BTC_USDT_Perp", "1.123123123", True, "68900.777123479"),
+        ("ETH_USDT_Perp", "12.5", False, "3100.25"),
+        ("BTC_USDT_Perp", "0.5", False, "69000"),
+        ("ETH_USDT_Perp", "3", True, "3000.5"),
+    ],
+}
+
+
+def raw_order(legs_name: str, with_builder: bool) -> Order:
+    order = make_order([OrderLeg(*leg) for leg in LEGS[legs_name]])
+    if with_builder:
+        order.builder = BUILDER
+        order.builder_fee = "0.001"
+    return order
+
+
+def ccxt_order(legs_name: str) -> grvt_ccxt_utils.GrvtOrder:
+    order = grvt_ccxt_utils.get_grvt_order(
+        sub_account_id=SUB_ACCOUNT_ID,
+        symbol="BTC_USDT_Perp",
+        order_type="limit",
+        side="buy",
+        amount="1",
+        limit_price="1",
+        params={"client_order_id": 1, "nonce": NONCE, "expiration": EXPIRY},
+    )
+    order.legs = [
+        grvt_ccxt_utils.GrvtOrderLeg(
+            instrument=instrument,
+            size=size,
+            is_buying_asset=is_buying_asset,
+            limit_price=limit_price,
+        )
+        for instrument, size, is_buying_asset, limit_price in LEGS[legs_name]
+    ]
+    return order
+
+
+def transfer() -> Transfer:
+    return Transfer(
+        from_account_id=MAIN_ACCOUNT_ID,
+        from_sub_account_id="0",
+        to_account_id=MAIN_ACCOUNT_ID,
+        to_sub_account_id=SUB_ACCOUNT_ID,
+        currency="USDT",
+        num_tokens="1.5",
+        signature=Signature(
+            signer="", r="", s="", v=0, expiration=str(EXPIRY), nonce=NONCE
+        ),
+        transfer_type=TransferType.STANDARD,
+        transfer_metadata="",
+    )
+
+
+def withdrawal() -> Withdrawal:
+    return Withdrawal(
+        from_account_id=MAIN_ACCOUNT_ID,
+        to_eth_address="0xed3FF6F4E84a64556e8F7d149dC3533f0c7D9c49",
+        currency="USDT",
+        num_tokens="25.5",
+        signature=Signature(
+            signer="", r="", s="", v=0, expiration=str(EXPIRY), nonce=NONCE
+        ),
+    )
+
+
+def get_cases(backend: SignerBackend) -> dict[str, Callable[[], object]]:
+    chain_id = CHAIN_IDS[GrvtEnv.TESTNET]
+    config = GrvtApiConfig(
+        env=GrvtEnv.TESTNET,
+        private_key=PRIVATE_KEY,
+        trading_account_id=SUB_ACCOUNT_ID,
+        api_key=None,
+        logger=None,
+        signer_backend=backend,
+    )
+    context = SigningContext.from_key(PRIVATE_KEY, chain_id, backend)
+    account = context.account
+    cases: dict[str, Callable[[], object]] = {}
+    for legs_name in LEGS:
+        for with_builder in [False, True]:
+            order = raw_order(legs_name, with_builder)
+            suffix = "_builder" if with_builder else ""
+            cases[f"sign_order/{legs_name}{suffix}"] = lambda order=order: sign_order(
+                order, config, account, INSTRUMENTS, context
+            )
+        order = ccxt_order(legs_name)
+        cases[f"get_order_payload/{legs_name}"] = lambda order=order: (
+            grvt_ccxt_utils.get_order_payload(
+                order, PRIVATE_KEY, GrvtCcxtEnv.TESTNET, CCXT_INSTRUMENTS, context
+            )
+        )
+        cases[f"get_order_rpc_payload/{legs_name}"] = lambda order=order: (
+            grvt_ccxt_utils.get_order_rpc_payload(
+                order,
+                PRIVATE_KEY,
+                GrvtCcxtEnv.TESTNET,
+                CCXT_INSTRUMENTS,
+                signing_context=context,
+            )
+        )
+    cases["sign_transfer"] = lambda payload=transfer(): sign_transfer(
+        payload, config, account, chain_id, signing_context=context
+    )
+    cases["sign_withdrawal"] = lambda payload=withdrawal(): sign_withdrawal(
+        payload, config, account, chain_id, signing_context=context
+    )
+    ccxt_context = SigningContext.from_key(
+        PRIVATE_KEY, grvt_ccxt_utils.CHAIN_IDS[GrvtCcxtEnv.TESTNET.value], backend
+    )
+    cases["sign_derisk_mm_ratio_request"] = lambda: (
+        grvt_ccxt_utils.sign_derisk_mm_ratio_request(
+            GrvtCcxtEnv.TESTNET, int(SUB_ACCOUNT_ID), "2.0", PRIVATE_KEY, ccxt_context
+        )
+    )
+    return cases
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    index = min(len(sorted_values) - 1, round(pct / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def measure(call: Callable[[], object], iterations: int, warmup: int) -> dict[str, float]:
+    for _ in range(warmup):
+        call()
+    latencies_us = []
+    perf_counter_ns = time.perf_counter_ns
+    start = perf_counter_ns()
+    for _ in range(iterations):
+        call_start = perf_counter_ns()
+        call()
+        latencies_us.append((perf_counter_ns() - call_start) / 1_000)
+    elapsed_secs = (perf_counter_ns() - start) / 1e9
+    latencies_us.sort()
+    return {
+        "ops_per_sec": iterations / elapsed_secs,
+        "mean_us": statistics.fmean(latencies_us),
+        "p50_us": percentile(latencies_us, 50),
+        "p90_us": percentile(latencies_us, 90),
+        "p99_us": percentile(latencies_us, 99),
+        "max_us": latencies_us[-1],
+    }
+
+
+def get_pysdk_version() -> str:
+    try:
+        return version("grvt-pysdk")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument(
+        "--backend",
+        choices=[backend.value for backend in get_available_signer_backends()],
+        default=SignerBackend.ETH_ACCOUNT.value,
+    )
+    parser.add_argument(
+        "--filter", default="", help="only run cases containing this text"
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="JSON file of an earlier run to compare with")
+    args = parser.parse_args()
+
+    baseline: dict[str, dict[str, float]] = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    results = {}
+    header = f"{'case':<38} {'ops/sec':>9} {'p50 us':>8} {'p90 us':>8} {'p99 us':>8}"
+    sys.stdout.write(header + (f" {'vs base':>8}" if baseline else "") + "\n")
+    for name, call in get_cases(SignerBackend(args.backend)).items():
+        if args.filter not in name:
+            continue
+        result = measure(call, args.iterations, args.warmup)
+        results[name] = result
+        line = (
+            f"{name:<38} {result['ops_per_sec']:9.0f} {result['p50_us']:8.1f}"
+            f" {result['p90_us']:8.1f} {result['p99_us']:8.1f}"
+        )
+        if name in baseline:
+            change = result["ops_per_sec"] / baseline[name]["ops_per_sec"] - 1
+            line += f" {change:+8.1%}"
+        sys.stdout.write(line + "\n")
+
+    if args.output:
+        report = {
+            "benchmark": "signing_suite",
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "pysdk_version": get_pysdk_version(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "signer_backend": args.backend,
+            "iterations": args.iterations,
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        sys.stdout.write(f"Saved results to {args.output}\n")
+
+
+if __name__ == "__main__":
+    main()
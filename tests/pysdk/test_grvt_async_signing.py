@@ -0,0 +1,141 @@
+import asyncio
+import copy
+import dataclasses
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pysdk import grvt_ccxt_utils
+from pysdk.grvt_async_signing import AsyncSigner
+from pysdk.grvt_ccxt_env import GrvtEnv as GrvtCcxtEnv
+from pysdk.grvt_signer import Signer
+from pysdk.grvt_signing_context import SigningContext
+
+from .test_grvt_eip712 import INSTRUMENTS
+
+# Setup logger
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+
+CCXT_INSTRUMENTS = {
+    name: {"instrument_hash": inst.instrument_hash, "base_decimals": inst.base_decimals}
+    for name, inst in INSTRUMENTS.items()
+}
+
+
+def make_orders(count: int) -> list[grvt_ccxt_utils.GrvtOrder]:
+    return [
+        grvt_ccxt_utils.get_grvt_order(
+            sub_account_id="8289849667772468",
+            symbol="BTC_USDT_Perp",
+            order_type="limit",
+            side="buy",
+            amount="0.01",
+            limit_price=str(60_000 + i),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("executor", ["inline", "thread", "process", "custom"])
+def test_async_payloads_match_sync(executor: str) -> None:
+    context = SigningContext.from_key(PRIVATE_KEY, 326)
+    orders = make_orders(4)
+    want = [
+        grvt_ccxt_utils.get_order_rpc_payload(
+            order,
+            PRIVATE_KEY,
+            GrvtCcxtEnv.TESTNET,
+            CCXT_INSTRUMENTS,
+            signing_context=context,
+        )
+        for order in copy.deepcopy(orders)
+    ]
+
+    async def sign_all(signer: AsyncSigner) -> list[dict]:
+        return await asyncio.gather(
+            *[
+                grvt_ccxt_utils.get_order_rpc_payload_async(
+                    order, GrvtCcxtEnv.TESTNET, CCXT_INSTRUMENTS, signer
+                )
+                for order in copy.deepcopy(orders)
+            ]
+        )
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        signer = AsyncSigner(context, pool if executor == "custom" else executor)
+        got = asyncio.run(sign_all(signer))
+        signer.close()
+    assert got == want
+    assert signer.metrics.signed == len(orders)
+    assert signer.metrics.in_flight == 0
+    assert signer.metrics.max_loop_signing_secs > 0
+
+
+def test_async_signer_bounds_in_flight() -> None:
+    context = SigningContext.from_key(PRIVATE_KEY, 326)
+    messages = [
+        grvt_ccxt_utils.get_signable_message(order, GrvtCcxtEnv.TESTNET, CCXT_INSTRUMENTS)
+        for order in make_orders(12)
+    ]
+
+    async def sign_all(signer: AsyncSigner) -> list:
+        return await asyncio.gather(*[signer.sign(message) for message in messages])
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        signer = AsyncSigner(context, pool, max_in_flight=2)
+        signatures = asyncio.run(sign_all(signer))
+    assert signatures == [context.sign_message(message) for message in messages]
+    assert signer.metrics.peak_in_flight == 2
+    assert signer.metrics.queue_wait_secs > 0
+
+
+class HeldSigner(Signer):
+    """Signs with `signer` once `release` is set."""
+
+    def __init__(self, signer: Signer, release: threading.Event):
+        self.backend = signer.backend
+        self.signer = signer
+        self.release = release
+
+    def sign_digest(self, digest: bytes):
+        assert self.release.wait(5)
+        return self.signer.sign_digest(digest)
+
+
+def test_async_signer_measures_loop_lag() -> None:
+    context = SigningContext.from_key(PRIVATE_KEY, 326)
+    release = threading.Event()
+    held = dataclasses.replace(context, signer=HeldSigner(context.signer, release))
+    message = grvt_ccxt_utils.get_signable_message(
+        make_orders(1)[0], GrvtCcxtEnv.TESTNET, CCXT_INSTRUMENTS
+    )
+
+    async def sign_while_loop_is_held(signer: AsyncSigner) -> tuple:
+        task = asyncio.ensure_future(signer.sign(message))
+        await asyncio.sleep(0.01)
+        # Stands for a signing thread holding the GIL
+        time.sleep(0.05)
+        release.set()
+        return await task
+
+    signer = AsyncSigner(held, "thread")
+    assert asyncio.run(sign_while_loop_is_held(signer)) == context.sign_message(message)
+    signer.close()
+    # Only the submission ran on the loop, but the heartbeat saw it held
+    assert signer.metrics.max_loop_signing_secs < 0.04
+    assert signer.metrics.max_loop_lag_secs >= 0.04
+
+
+def test_async_signer_rejects_bad_arguments() -> None:
+    context = SigningContext.from_key(PRIVATE_KEY, 326)
+    with pytest.raises(ValueError, match="Unknown signing executor"):
+        AsyncSigner(context, "fiber")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="max_in_flight"):
+        AsyncSigner(context, "thread", max_in_flight=0)
@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from pysdk.grvt_auth import (
+    COOKIE_REFRESH_RETRY_SECS,
+    AsyncCookieRefresher,
+    AsyncSingleFlight,
+    RequestAuth,
+    SyncCookieRefresher,
+)
+from pysdk.grvt_raw_async import GrvtRawAsync
+from pysdk.grvt_raw_base import GrvtApiConfig, GrvtCookie
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_sync import GrvtRawSync
+
+# Setup logger
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+def test_single_flight_shares_one_call() -> None:
+    async def run() -> None:
+        flight = AsyncSingleFlight()
+        calls = 0
+
+        async def login() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*[flight.run(login) for _ in range(10)])
+        assert results == [1] * 10
+        assert not flight.in_flight
+
+        # A cancelled caller does not cancel the login of the others
+        first = asyncio.ensure_future(flight.run(login))
+        second = asyncio.ensure_future(flight.run(login))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == 2
+        assert await flight.run(login) == 3
+
+    asyncio.run(run())
+
+
+def test_refresher_delay() -> None:
+    now = 1_000_000.0
+    expiry: float | None = None
+    refresher = AsyncCookieRefresher(
+        lambda: asyncio.sleep(0), lambda: expiry, refresh_ahead_secs=60
+    )
+    assert refresher.get_delay_secs(now) == 0
+    expiry = now + 3600
+    assert refresher.get_delay_secs(now) == 3540
+    # Short lived cookies are renewed half way
+    expiry = now + 80
+    assert refresher.get_delay_secs(now) == 40
+    expiry = now + 4
+    assert refresher.get_delay_secs(now) == 0
+
+
+def test_refresher_renews_before_expiry() -> None:
+    async def run() -> None:
+        expiry = time.time() + 0.2
+        renewed = asyncio.Event()
+
+        async def refresh() -> None:
+            nonlocal expiry
+            expiry = time.time() + 3600
+            renewed.set()
+
+        refresher = AsyncCookieRefresher(
+            refresh, lambda: expiry, refresh_ahead_secs=60, logger=logger
+        )
+        # Below the 5 second margin, so renewed right away
+        refresher.ensure_started()
+        await asyncio.wait_for(renewed.wait(), timeout=1)
+        assert expiry > time.time() + 3000
+        assert refresher.running
+        refresher.stop()
+        assert not refresher.running
+
+    asyncio.run(run())
+
+
+def get_config() -> GrvtApiConfig:
+    return GrvtApiConfig(
+        env=GrvtEnv.TESTNET,
+        trading_account_id="8289849667772468",
+        private_key=None,
+        api_key="not-needed",
+        logger=logger,
+    )
+
+
+def make_cookie(lifetime_secs: float, account_id: str | None = None) -> GrvtCookie:
+    return GrvtCookie(
+        gravity=f"cookie-{time.time()}",
+        expires=datetime.fromtimestamp(time.time() + lifetime_secs),
+        grvt_account_id=account_id,
+    )
+
+
+def test_raw_async_logs_in_once() -> None:
+    async def run() -> None:
+        api = GrvtRawAsync(get_config())
+        logins = 0
+
+        async def get_cookie(path: str, api_key: str) -> GrvtCookie:
+            nonlocal logins
+            logins += 1
+            await asyncio.sleep(0.01)
+            return make_cookie(3600)
+
+        api._get_cookie = get_cookie  # type: ignore[method-assign]
+        await asyncio.gather(*[api._refresh_cookie() for _ in range(20)])
+        assert logins == 1
+        assert api._cookie_refresher is not None and api._cookie_refresher.running
+        assert api._cookie_refresher.get_delay_secs() > COOKIE_REFRESH_RETRY_SECS
+
+        await api._refresh_cookie(force=True)
+        assert logins == 2
+        await api.close()
+        assert not api._cookie_refresher.running
+
+    asyncio.run(run())
+
+
+def test_sync_refresher_renews_before_expiry() -> None:
+    expiry = time.time() + 0.2
+    renewed = threading.Event()
+
+    def refresh() -> None:
+        nonlocal expiry
+        expiry = time.time() + 3600
+        renewed.set()
+
+    refresher = SyncCookieRefresher(refresh, lambda: expiry, 60, logger)
+    refresher.ensure_started()
+    assert renewed.wait(timeout=1)
+    assert refresher.running
+    refresher.stop()
+    assert not refresher.running
+
+
+def test_raw_sync_shared_by_threads_logs_in_once() -> None:
+    api = GrvtRawSync(get_config())
+    logins = 0
+    lock = threading.Lock()
+
+    def get_cookie(path: str, api_key: str) -> GrvtCookie:
+        nonlocal logins
+        with lock:
+            logins += 1
+        time.sleep(0.01)
+        return make_cookie(3600, account_id=str(logins))
+
+    api._get_cookie = get_cookie  # type: ignore[method-assign]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda _: api._refresh_cookie(), range(64)))
+    assert logins == 1
+    assert api._request_auth == RequestAuth(
+        cookies={"gravity": api._cookie.gravity}, headers={"X-Grvt-Account-Id": "1"}
+    )
+    # The session itself is left untouched
+    assert "X-Grvt-Account-Id" not in api._session.headers
+    refresher = api._auth.refresher
+    assert refresher is not None and refresher.running
+    assert refresher.get_delay_secs() > COOKIE_REFRESH_RETRY_SECS
+
+    api._refresh_cookie(force=True)
+    assert logins == 2
+    assert api._request_auth.headers == {"X-Grvt-Account-Id": "2"}
+    api.close()
+    assert not refresher.running
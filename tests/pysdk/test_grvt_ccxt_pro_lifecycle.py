@@ -0,0 +1,74 @@
+import asyncio
+import logging
+
+import pytest
+
+from pysdk import grvt_ccxt_pro
+from pysdk.grvt_ccxt_env import GrvtEnv
+from pysdk.grvt_ccxt_pro import GrvtCcxtPro
+
+# Setup logger
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class OfflineCcxtPro(GrvtCcxtPro):
+    """Records the start-up steps instead of sending requests."""
+
+    def __init__(self, *args, **kwargs):
+        self.steps: list[str] = []
+        self.fail_markets = False
+        super().__init__(*args, **kwargs)
+
+    async def refresh_cookie(self, force: bool = False) -> dict | None:
+        self.steps.append("login")
+        await asyncio.sleep(0.01)
+        self._cookie = {"gravity": "cookie", "expires": 2e9, "X-Grvt-Account-Id": None}
+        self.steps.append("login done")
+        return self._cookie
+
+    async def load_markets(self) -> dict | None:
+        self.steps.append("markets")
+        await asyncio.sleep(0.01)
+        if self.fail_markets:
+            raise ConnectionError("market data unavailable")
+        self.markets = {"BTC_USDT_Perp": {}}
+        return self.markets
+
+    async def warm_up_connections(self) -> None:
+        self.steps.append("warm up")
+
+
+def test_create_does_not_block_and_closes_session(monkeypatch) -> None:
+    def blocking_login(*args, **kwargs):
+        raise AssertionError("blocking login inside the event loop")
+
+    monkeypatch.setattr(grvt_ccxt_pro, "get_cookie_with_expiration", blocking_login)
+
+    async def run() -> None:
+        api = await OfflineCcxtPro.create(GrvtEnv.TESTNET, logger, {"api_key": "key"})
+        # Started concurrently: everything began before the login finished
+        assert api.steps.index("login done") > api.steps.index("warm up")
+        assert api.markets and api._cookie
+        async with api as same:
+            assert same is api
+        assert len(api.steps) == 4
+        assert api._session.closed
+
+        async with OfflineCcxtPro(GrvtEnv.TESTNET, logger, login_on_init=False) as api:
+            assert not api._session.closed and api.markets
+        assert api._session.closed
+
+    asyncio.run(run())
+
+
+def test_failed_start_closes_session() -> None:
+    async def run() -> None:
+        api = OfflineCcxtPro(GrvtEnv.TESTNET, logger, login_on_init=False)
+        api.fail_markets = True
+        with pytest.raises(ConnectionError):
+            await api.start()
+        assert api._session.closed
+
+    asyncio.run(run())
@@ -0,0 +1,87 @@
+import logging
+import os
+import stat
+import time
+from datetime import datetime
+
+from pysdk.grvt_cookie_cache import CookieCache
+from pysdk.grvt_raw_base import GrvtApiConfig, GrvtCookie
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_sync import GrvtRawSync
+
+# Setup logger
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+API_KEY = "not-a-real-api-key"
+
+
+def test_store_and_load(tmp_path) -> None:
+    directory = tmp_path / "cookies"
+    cache = CookieCache(directory)
+    assert cache.load("testnet", API_KEY) is None
+    expires = time.time() + 3600
+    cookie = {"gravity": "abc", "expires": expires, "X-Grvt-Account-Id": "acc"}
+    cache.store("testnet", API_KEY, cookie)
+    assert cache.load("testnet", API_KEY) == cookie
+    # Keyed by environment and API key
+    assert cache.load("prod", API_KEY) is None
+    assert cache.load("testnet", API_KEY + "2") is None
+    # Only cookies outliving the current one are returned
+    assert cache.load("testnet", API_KEY, newer_than=expires) is None
+    assert cache.load("testnet", API_KEY, newer_than=expires - 1) == cookie
+
+    path = cache.get_path("testnet", API_KEY)
+    assert API_KEY not in path.name
+    assert os.listdir(directory) == [path.name]
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+
+    # Expiring cookies and unreadable files are ignored
+    cache.store("testnet", API_KEY, {**cookie, "expires": time.time() + 1})
+    assert cache.load("testnet", API_KEY) is None
+    path.write_text("{not json")
+    assert cache.load("testnet", API_KEY) is None
+    cache.delete("testnet", API_KEY)
+    cache.delete("testnet", API_KEY)
+    assert not path.exists()
+
+
+def test_raw_clients_share_cached_cookie(tmp_path) -> None:
+    config = GrvtApiConfig(
+        env=GrvtEnv.TESTNET,
+        trading_account_id="8289849667772468",
+        private_key=None,
+        api_key=API_KEY,
+        logger=logger,
+        cookie_refresh_ahead_secs=None,
+        cookie_cache_dir=str(tmp_path),
+    )
+    logins = 0
+
+    def get_cookie(path: str, api_key: str) -> GrvtCookie:
+        nonlocal logins
+        logins += 1
+        return GrvtCookie(
+            gravity=f"cookie-{logins}",
+            expires=datetime.fromtimestamp(time.time() + 3600),
+            grvt_account_id="acc",
+        )
+
+    clients = [GrvtRawSync(config) for _ in range(3)]
+    for api in clients:
+        api._get_cookie = get_cookie  # type: ignore[method-assign]
+        api._refresh_cookie()
+        assert api._cookie is not None and api._cookie.gravity == "cookie-1"
+        assert api._request_auth.headers == {"X-Grvt-Account-Id": "acc"}
+    assert logins == 1
+
+    # A forced refresh does not reuse the cookie it replaces
+    clients[0]._refresh_cookie(force=True)
+    assert logins == 2
+    clients[1]._refresh_cookie(force=True)
+    assert clients[1]._cookie is not None and clients[1]._cookie.gravity == "cookie-2"
+    assert logins == 2
+    for api in clients:
+        api.close()
@@ -0,0 +1,297 @@
+import copy
+import logging
+from decimal import Decimal
+
+import pytest
+from eth_account.messages import encode_typed_data
+
+from pysdk import grvt_ccxt_utils
+from pysdk.grvt_ccxt_env import GrvtEnv as GrvtCcxtEnv
+from pysdk.grvt_eip712 import (
+    encode_EIP712_type,
+    get_EIP712_domain_separator,
+    get_EIP712_signable_message,
+)
+from pysdk.grvt_fixed_point import FixedPointError
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_signing import (
+    CHAIN_IDS,
+    EIP712_ORDER_HASHER,
+    EIP712_ORDER_MESSAGE_TYPE,
+    EIP712_ORDER_WITH_BUILDER_FEE_HASHER,
+    EIP712_ORDER_WITH_BUILDER_FEE_MESSAGE_TYPE,
+    EIP712_TRANSFER_HASHER,
+    EIP712_TRANSFER_MESSAGE_TYPE,
+    EIP712_WITHDRAWAL_HASHER,
+    EIP712_WITHDRAWAL_MESSAGE_TYPE,
+    build_EIP712_order_message_data,
+    build_EIP712_order_with_builder_fee_message_data,
+    get_EIP712_domain_data,
+)
+from pysdk.grvt_raw_types import (
+    Instrument,
+    InstrumentSettlementPeriod,
+    Kind,
+    Order,
+    OrderLeg,
+    OrderMetadata,
+    Signature,
+    TimeInForce,
+)
+
+# Setup logger
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+INSTRUMENTS = {
+    "BTC_USDT_Perp": Instrument(
+        instrument="BTC_USDT_Perp",
+        instrument_hash="0x030501",
+        base="BTC",
+        quote="USDT",
+        kind=Kind.PERPETUAL,
+        venues=[],
+        settlement_period=InstrumentSettlementPeriod.DAILY,
+        tick_size="0.000000001",
+        min_size="0.000000001",
+        create_time="123",
+        base_decimals=9,
+        quote_decimals=9,
+        max_position_size="1000000",
+    ),
+    "ETH_USDT_Perp": Instrument(
+        instrument="ETH_USDT_Perp",
+        instrument_hash="0x030401",
+        base="ETH",
+        quote="USDT",
+        kind=Kind.PERPETUAL,
+        venues=[],
+        settlement_period=InstrumentSettlementPeriod.DAILY,
+        tick_size="0.01",
+        min_size="0.01",
+        create_time="123",
+        base_decimals=9,
+        quote_decimals=9,
+        max_position_size="1000000",
+    ),
+}
+
+
+def make_order(legs: list[OrderLeg], **kwargs) -> Order:
+    return Order(
+        metadata=OrderMetadata(client_order_id="1", create_time="1730800479321350000"),
+        sub_account_id="8289849667772468",
+        time_in_force=kwargs.pop("time_in_force", TimeInForce.GOOD_TILL_TIME),
+        legs=legs,
+        signature=Signature(
+            signer="", r="", s="", v=0, expiration=1730800479321350000, nonce=828700936
+        ),
+        **kwargs,
+    )
+
+
+ORDERS = [
+    make_order(
+        [OrderLeg("BTC_USDT_Perp", "1.013", False, "68900.5")],
+        post_only=False,
+        is_market=False,
+        reduce_only=False,
+    ),
+    make_order(
+        [OrderLeg("BTC_USDT_Perp", "0.000000001", True, "0.000000001")],
+        time_in_force=TimeInForce.IMMEDIATE_OR_CANCEL,
+        post_only=True,
+        reduce_only=True,
+    ),
+    make_order(
+        [
+            OrderLeg("BTC_USDT_Perp", "1.123123123", True, "68900.777123479"),
+            OrderLeg("ETH_USDT_Perp", "12.5", False, "3100.25"),
+        ],
+        time_in_force=TimeInForce.FILL_OR_KILL,
+        is_market=True,
+    ),
+]
+
+
+@pytest.mark.parametrize("env", list(GrvtEnv))
+@pytest.mark.parametrize("order", ORDERS)
+def test_order_signable_message_parity(env: GrvtEnv, order: Order) -> None:
+    message_data = build_EIP712_order_message_data(order, INSTRUMENTS)
+    want = encode_typed_data(
+        get_EIP712_domain_data(env, CHAIN_IDS[env]),
+        EIP712_ORDER_MESSAGE_TYPE,
+        message_data,
+    )
+    got = get_EIP712_signable_message(CHAIN_IDS[env], EIP712_ORDER_HASHER, message_data)
+    assert got == want
+
+
+@pytest.mark.parametrize("builder_fee", ["0", "0.0001", "0.001", "1.0"])
+@pytest.mark.parametrize("order", ORDERS)
+def test_order_with_builder_fee_signable_message_parity(
+    order: Order, builder_fee: str
+) -> None:
+    order = copy.deepcopy(order)
+    order.builder = "0xAbC1230001230001230001230001230001230001"
+    order.builder_fee = builder_fee
+    message_data = build_EIP712_order_with_builder_fee_message_data(order, INSTRUMENTS)
+    chain_id = CHAIN_IDS[GrvtEnv.TESTNET]
+    want = encode_typed_data(
+        get_EIP712_domain_data(GrvtEnv.TESTNET, chain_id),
+        EIP712_ORDER_WITH_BUILDER_FEE_MESSAGE_TYPE,
+        message_data,
+    )
+    got = get_EIP712_signable_message(
+        chain_id, EIP712_ORDER_WITH_BUILDER_FEE_HASHER, message_data
+    )
+    assert got == want
+
+
+@pytest.mark.parametrize("env", list(GrvtCcxtEnv))
+def test_ccxt_signable_message_parity(env: GrvtCcxtEnv) -> None:
+    instruments = {
+        name: {
+            "instrument_hash": inst.instrument_hash,
+            "base_decimals": inst.base_decimals,
+            "tick_size": inst.tick_size,
+            "min_size": inst.min_size,
+        }
+        for name, inst in INSTRUMENTS.items()
+    }
+    order = grvt_ccxt_utils.get_grvt_order(
+        sub_account_id="8289849667772468",
+        symbol="BTC_USDT_Perp",
+        order_type="limit",
+        side="buy",
+        amount=Decimal("0.013"),
+        limit_price="64170.7",
+        params={"post_only": True, "time_in_force": "GOOD_TILL_TIME"},
+    )
+    order.legs.append(
+        grvt_ccxt_utils.GrvtOrderLeg(
+            "ETH_USDT_Perp", Decimal("2"), False, Decimal("3100.1")
+        )
+    )
+    got = grvt_ccxt_utils.get_signable_message(order, env, instruments)
+    legs = [
+        {
+            "assetID": instruments[leg.instrument]["instrument_hash"],
+            "contractSize": int(leg.size * 10**9),
+            "limitPrice": int(leg.limit_price * 10**9),
+            "isBuyingContract": leg.is_buying_asset,
+        }
+        for leg in order.legs
+    ]
+    message_data = {
+        "subAccountID": order.sub_account_id,
+        "isMarket": False,
+        "timeInForce": 1,
+        "postOnly": True,
+        "reduceOnly": False,
+        "legs": legs,
+        "nonce": order.signature.nonce,
+        "expiration": order.signature.expiration,
+    }
+    want = encode_typed_data(
+        grvt_ccxt_utils.get_EIP712_domain_data(env),
+        grvt_ccxt_utils.EIP712_ORDER_MESSAGE_TYPE,
+        message_data,
+    )
+    assert got == want
+
+
+def test_transfer_and_withdrawal_struct_hash_parity() -> None:
+    transfer = {
+        "fromAccount": "0x0c1f4c8ee7acd9ea19b91bbb343cbaf6efd58ce1",
+        "fromSubAccount": "0",
+        "toAccount": "0x0c1f4c8ee7acd9ea19b91bbb343cbaf6efd58ce1",
+        "toSubAccount": "8289849667772468",
+        "tokenCurrency": 3,
+        "numTokens": 1_000_000,
+        "nonce": 828700936,
+        "expiration": "1730800479321350000",
+    }
+    withdrawal = {
+        "fromAccount": "0x0c1f4c8ee7acd9ea19b91bbb343cbaf6efd58ce1",
+        "toEthAddress": "0xAbC1230001230001230001230001230001230001",
+        "tokenCurrency": 3,
+        "numTokens": 2_500_000,
+        "nonce": 1,
+        "expiration": 1730800479321350000,
+    }
+    for types, hasher, message_data in [
+        (EIP712_TRANSFER_MESSAGE_TYPE, EIP712_TRANSFER_HASHER, transfer),
+        (EIP712_WITHDRAWAL_MESSAGE_TYPE, EIP712_WITHDRAWAL_HASHER, withdrawal),
+    ]:
+        want = encode_typed_data(
+            get_EIP712_domain_data(GrvtEnv.PROD, 1), types, message_data
+        )
+        assert get_EIP712_signable_message(1, hasher, message_data) == want
+
+
+def test_type_string_and_domain_separator() -> None:
+    assert encode_EIP712_type("Order", EIP712_ORDER_MESSAGE_TYPE) == (
+        "Order(uint64 subAccountID,bool isMarket,uint8 timeInForce,bool postOnly,"
+        "bool reduceOnly,OrderLeg[] legs,uint32 nonce,int64 expiration)"
+        "OrderLeg(uint256 assetID,uint64 contractSize,uint64 limitPrice,"
+        "bool isBuyingContract)"
+    )
+    # Matches the EIP-191 header of the TESTNET vectors in
+    # test_grvt_raw_signing_intermediate_steps
+    assert (
+        get_EIP712_domain_separator(326).hex()
+        == "1254f97f8495f704630a238cbcd898a4b8ab20d77bb93e17049d3445f4f81f16"
+    )
+
+
+@pytest.mark.parametrize(
+    "size, limit_price, match",
+    [
+        ("1.0000000001", "3100.25", "more than 9 decimal places"),
+        ("1", "3100.2500000001", "more than 9 decimal places"),
+        ("1", "3100.255", "tick_size 0.01"),
+        ("0.005", "3100.25", "min_size 0.01"),
+        ("0", "3100.25", "positive"),
+    ],
+)
+def test_order_builders_reject_invalid_legs(size: str, limit_price: str, match: str):
+    order = make_order([OrderLeg("ETH_USDT_Perp", size, False, limit_price)])
+    with pytest.raises(FixedPointError, match=match):
+        build_EIP712_order_message_data(order, INSTRUMENTS)
+    market = INSTRUMENTS["ETH_USDT_Perp"]
+    instruments = {
+        "ETH_USDT_Perp": {
+            "instrument_hash": market.instrument_hash,
+            "base_decimals": market.base_decimals,
+            "tick_size": market.tick_size,
+            "min_size": market.min_size,
+        }
+    }
+    ccxt_order = grvt_ccxt_utils.get_grvt_order(
+        sub_account_id="8289849667772468",
+        symbol="ETH_USDT_Perp",
+        order_type="limit",
+        side="buy",
+        amount=Decimal(size),
+        limit_price=limit_price,
+    )
+    # get_grvt_order rounds to 9 decimal places, so only the instrument checks remain
+    if "decimal places" not in match:
+        with pytest.raises(FixedPointError, match=match):
+            grvt_ccxt_utils.get_signable_message(
+                ccxt_order, GrvtCcxtEnv.TESTNET, instruments
+            )
+
+
+def test_out_of_range_values_raise() -> None:
+    order = make_order([OrderLeg("BTC_USDT_Perp", "1", False, "68900.5")])
+    message_data = build_EIP712_order_message_data(order, INSTRUMENTS)
+    message_data["legs"][0]["contractSize"] = -1
+    with pytest.raises(ValueError, match="contractSize"):
+        EIP712_ORDER_HASHER.hash_struct(message_data)
+    message_data["legs"][0]["contractSize"] = 1
+    message_data["nonce"] = 2**32
+    with pytest.raises(ValueError, match="nonce"):
+        EIP712_ORDER_HASHER.hash_struct(message_data)
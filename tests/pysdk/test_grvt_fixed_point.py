@@ -0,0 +1,121 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from pysdk.grvt_fixed_point import (
+    FixedPointError,
+    InstrumentScaler,
+    from_scaled_int,
+    get_instrument_scaler,
+    round_decimal,
+    to_scaled_int,
+    to_scaled_ints,
+)
+
+from .test_grvt_eip712 import INSTRUMENTS
+
+
+@pytest.mark.parametrize(
+    "value, decimals, want",
+    [
+        ("1.013", 9, 1_013_000_000),
+        ("68900.777123479", 9, 68_900_777_123_479),
+        ("0.000000001", 9, 1),
+        ("-3.5", 6, -3_500_000),
+        ("+.5", 1, 5),
+        ("7.", 2, 700),
+        (" 12 ", 0, 12),
+        ("1e-9", 9, 1),
+        ("1.5E+3", 0, 1500),
+        (42, 3, 42_000),
+        (Decimal("1.013"), 9, 1_013_000_000),
+        (Decimal("1E+2"), 2, 10_000),
+        (0.1, 9, 100_000_000),
+        (1.013, 9, 1_013_000_000),
+        (1e-9, 9, 1),
+    ],
+)
+def test_to_scaled_int(value, decimals: int, want: int) -> None:
+    assert to_scaled_int(value, decimals) == want
+    assert to_scaled_ints([value, value], decimals) == [want, want]
+
+
+def test_precision_loss_and_invalid_values_raise() -> None:
+    with pytest.raises(FixedPointError, match="more than 9 decimal places"):
+        to_scaled_int("1.0000000001", 9, name="size")
+    with pytest.raises(FixedPointError, match="more than 9 decimal places"):
+        to_scaled_ints(["1", "1.0000000001"], 9)
+    for value in [
+        "",
+        "abc",
+        "1.2.3",
+        "1,5",
+        "1_000",
+        "1_000.5",
+        "1e1_0",
+        "nan",
+        Decimal("Infinity"),
+        float("nan"),
+        True,
+    ]:
+        with pytest.raises(FixedPointError):
+            to_scaled_int(value, 9)  # type: ignore[arg-type]
+        with pytest.raises(FixedPointError):
+            to_scaled_ints([value], 9)  # type: ignore[list-item]
+    # Trailing zeros beyond the precision are not a loss
+    assert to_scaled_int("1.5000000000000", 9) == 1_500_000_000
+
+
+def test_truncate_and_half_even_match_decimal() -> None:
+    rng = random.Random(7)
+    for _ in range(5000):
+        decimals = rng.randint(0, 12)
+        sign = rng.choice(["", "-"])
+        frac_len = rng.randint(1, 15)
+        frac = rng.randint(0, 10**frac_len - 1)
+        value = f"{sign}{rng.randint(0, 10**6)}.{frac:0{frac_len}d}"
+        multiplier = Decimal(10**decimals)
+        assert to_scaled_int(value, decimals, "truncate") == int(
+            Decimal(value) * multiplier
+        )
+        want = round(Decimal(value), decimals)
+        assert round_decimal(value, decimals) == want
+        assert str(round_decimal(value, decimals)) == str(want)
+
+
+def test_from_scaled_int() -> None:
+    assert from_scaled_int(1_013_000_000, 9) == "1.013"
+    assert from_scaled_int(-1, 9) == "-0.000000001"
+    assert from_scaled_int(5_000, 3) == "5"
+    for value in ["0.5", "123.000123", "-7.25"]:
+        assert from_scaled_int(to_scaled_int(value, 9), 9) == value
+
+
+def test_instrument_scaler_validates_tick_and_min_size() -> None:
+    scaler = InstrumentScaler.from_instrument(INSTRUMENTS["ETH_USDT_Perp"])
+    assert scaler is InstrumentScaler.from_instrument(INSTRUMENTS["ETH_USDT_Perp"])
+    assert scaler.size("12.5") == 12_500_000_000
+    assert scaler.price("3100.25") == 3_100_250_000_000
+    assert scaler.sizes(["0.01", "1", 2]) == [10_000_000, 1_000_000_000, 2_000_000_000]
+    assert scaler.prices(["3100.25", "3100.3"]) == [3_100_250_000_000, 3_100_300_000_000]
+    with pytest.raises(FixedPointError, match="tick_size 0.01"):
+        scaler.price("3100.255")
+    with pytest.raises(FixedPointError, match="tick_size"):
+        scaler.prices(["3100.25", "3100.251"])
+    with pytest.raises(FixedPointError, match="min_size 0.01"):
+        scaler.size("0.001")
+    with pytest.raises(FixedPointError, match="'0.001' is below"):
+        scaler.sizes(["1", "0.001"])
+    with pytest.raises(FixedPointError, match="positive"):
+        scaler.size("-1")
+    with pytest.raises(FixedPointError, match="more than 9 decimal places"):
+        scaler.size("1.0000000001")
+    assert scaler.price("3100.255", validate=False) == 3_100_255_000_000
+
+    # Without tick_size and min_size, only precision and sign are checked
+    scaler = get_instrument_scaler("BTC_USDT_Perp", 6)
+    assert scaler.size("0.000001") == 1
+    assert scaler.price("64170.123456789") == 64_170_123_456_789
+    with pytest.raises(FixedPointError, match="more than 6 decimal places"):
+        scaler.size("0.0000001")
@@ -0,0 +1,358 @@
+import asyncio
+import bisect
+import logging
+import threading
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pysdk.grvt_history import (
+    GrvtHistoryError,
+    aiter_items,
+    download_history,
+    iter_items,
+    iter_pages,
+)
+from pysdk.grvt_raw_async import GrvtRawAsync
+from pysdk.grvt_raw_base import GrvtApiConfig, GrvtError
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_types import (
+    ApiDepositHistoryRequest,
+    ApiTradeHistoryRequest,
+    Fill,
+    Trade,
+)
+
+from .test_grvt_raw_decoder import make_data
+
+# Setup logger
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+PAGE_SIZE = 3
+
+
+def make_pages(count: int, item_class: type = Fill) -> dict[str | None, dict]:
+    """Pages of items by cursor, newest first, event times counting down to 1."""
+    pages: dict[str | None, dict] = {}
+    event_time = count * PAGE_SIZE
+    for index in range(count):
+        result = []
+        for _ in range(PAGE_SIZE):
+            item = make_data(item_class, iter(range(1000)), False)
+            item["event_time"] = str(event_time)
+            result.append(item)
+            event_time -= 1
+        cursor = f"c{index + 1}" if index + 1 < count else ""
+        pages[f"c{index}" if index else None] = {"result": result, "next": cursor}
+    return pages
+
+
+def test_iter_pages_prefetches_next_page() -> None:
+    pages = make_pages(3)
+    fetched = []
+    page_fetched = threading.Event()
+
+    def fetch(cursor: str | None) -> dict:
+        fetched.append(cursor)
+        page_fetched.set()
+        return pages[cursor]
+
+    results = []
+    for page in iter_pages(fetch):
+        # The next page is requested while this one is processed
+        if page["next"]:
+            assert page_fetched.wait(5)
+            assert fetched[-1] == page["next"]
+        page_fetched.clear()
+        results.append(page)
+    assert results == list(pages.values())
+    assert fetched == list(pages)
+
+
+def test_iter_pages_memory_bound() -> None:
+    pages = make_pages(3)
+    fetched = []
+
+    def fetch(cursor: str | None) -> dict:
+        fetched.append(cursor)
+        return pages[cursor]
+
+    # Two pages do not fit in the bound: a page is only fetched once the last is used
+    for count, page in enumerate(iter_pages(fetch, max_buffered_items=PAGE_SIZE)):
+        assert len(fetched) == count + 1
+        assert page is pages[fetched[-1]]
+    assert fetched == list(pages)
+
+
+def test_iter_pages_close_waits_for_prefetch() -> None:
+    pages = make_pages(3)
+    started = threading.Event()
+    finished = []
+
+    def fetch(cursor: str | None) -> dict:
+        if cursor is not None:
+            started.set()
+            time.sleep(0.2)
+            finished.append(cursor)
+        return pages[cursor]
+
+    results = iter_pages(fetch)
+    assert next(results) is pages[None]
+    assert started.wait(5)
+    results.close()
+    assert finished == ["c1"]
+    assert not [t for t in threading.enumerate() if t.name.startswith("grvt-history")]
+
+
+def test_iter_items_stop_time() -> None:
+    pages = make_pages(4)
+    fetched = []
+
+    def fetch(cursor: str | None) -> dict:
+        fetched.append(cursor)
+        return pages[cursor]
+
+    items = list(iter_items(fetch, stop_time=7))
+    assert [int(item["event_time"]) for item in items] == list(range(12, 6, -1))
+    # The page holding the stop time is the last one fetched
+    assert fetched == [None, "c1", "c2"]
+    assert len(list(iter_items(fetch))) == 4 * PAGE_SIZE
+
+
+def test_iter_items_raises_page_errors() -> None:
+    pages = make_pages(2)
+    error = GrvtError(code=1000, message="Unauthorized", status=401)
+
+    def fetch(cursor: str | None) -> dict | GrvtError:
+        return pages[cursor] if cursor is None else error
+
+    items = iter_items(fetch)
+    assert len([next(items) for _ in range(PAGE_SIZE)]) == PAGE_SIZE
+    with pytest.raises(GrvtHistoryError) as err:
+        next(items)
+    assert err.value.error == error
+
+    with pytest.raises(GrvtHistoryError):
+        list(iter_items(lambda cursor: {"code": 1000, "message": "", "status": 401}))
+
+
+def test_aiter_items_cancels_prefetch() -> None:
+    pages = make_pages(3)
+    cancelled = []
+
+    async def fetch(cursor: str | None) -> dict:
+        if cursor is not None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(cursor)
+                raise
+        return pages[cursor]
+
+    async def run() -> list:
+        items = aiter_items(fetch)
+        first = await items.__anext__()
+        await asyncio.sleep(0)
+        await items.aclose()
+        # The prefetch task is done once the generator is closed
+        assert cancelled == ["c1"]
+        return first
+
+    assert asyncio.run(run()) == pages[None]["result"][0]
+    assert cancelled == ["c1"]
+
+
+def test_raw_client_iter_history() -> None:
+    pages = make_pages(3, Trade)
+    cursors = []
+
+    async def handler(request: web.Request) -> web.Response:
+        body = await request.json()
+        cursors.append(body.get("cursor"))
+        return web.json_response(pages[body.get("cursor")])
+
+    async def run() -> None:
+        app = web.Application()
+        app.router.add_post("/full/v1/trade_history", handler)
+        server = TestServer(app)
+        await server.start_server()
+        api = GrvtRawAsync(
+            GrvtApiConfig(
+                env=GrvtEnv.TESTNET,
+                trading_account_id=None,
+                private_key=None,
+                api_key=None,
+                logger=logger,
+            )
+        )
+        api.md_rpc = str(server.make_url("")).rstrip("/")
+        try:
+            req = ApiTradeHistoryRequest("BTC_USDT_Perp", limit=PAGE_SIZE)
+            pages_read = [
+                page async for page in api.iter_history_pages(api.trade_history_v1, req)
+            ]
+            trades = [item async for item in api.iter_history(api.trade_history_v1, req)]
+            dicts = [
+                item
+                async for item in api.iter_history(
+                    api.trade_history_v1, req, stop_time=5, decode="dict"
+                )
+            ]
+            with pytest.raises(ValueError):
+                api.iter_history(api.trade_history_v1, req, decode="raw")
+        finally:
+            await api.close()
+            await server.close()
+
+        assert [page.next for page in pages_read] == ["c1", "c2", ""]
+        assert len(trades) == 3 * PAGE_SIZE
+        assert all(isinstance(trade, Trade) for trade in trades)
+        assert [item["event_time"] for item in dicts] == [str(t) for t in range(9, 4, -1)]
+
+    asyncio.run(run())
+    assert cursors == [None, "c1", "c2"] * 2 + [None, "c1"]
+
+
+def make_history(times: list[int]) -> list[dict]:
+    """Trades at `times`, newest first."""
+    trade = make_data(Trade, iter(range(1000)), False)
+    return [
+        {**trade, "event_time": str(event_time), "trade_id": f"{index}-1"}
+        for index, event_time in enumerate(sorted(times, reverse=True))
+    ]
+
+
+def get_window_page(history: list[dict], body: dict) -> dict:
+    """Page of `history` for a request with a time window, as the API pages it."""
+    times = [-int(item["event_time"]) for item in history]
+    first = bisect.bisect_left(times, -int(body["end_time"]))
+    last = bisect.bisect_right(times, -int(body["start_time"]))
+    offset = first + int(body.get("cursor") or 0)
+    end = min(offset + body["limit"], last)
+    next_cursor = str(end - first) if end < last else ""
+    return {"result": history[offset:end], "next": next_cursor}
+
+
+SECOND = 1_000_000_000
+
+
+def test_download_history_windows() -> None:
+    # One item a minute, then one a second from 10000 s to 20000 s
+    times = [i * 60 * SECOND for i in range(10000 // 60)]
+    times += [i * SECOND for i in range(10000, 20001)]
+    history = make_history(times)
+    end_time = 20000 * SECOND
+    in_flight = []
+    max_in_flight = []
+    windows = []
+    lock = threading.Lock()
+
+    def get_fetch(start: int, end: int):
+        windows.append((start, end))
+
+        def fetch(cursor: str | None) -> dict:
+            with lock:
+                in_flight.append(1)
+                max_in_flight.append(len(in_flight))
+            body = {"start_time": start, "end_time": end, "limit": 100}
+            page = get_window_page(history, {**body, "cursor": cursor})
+            with lock:
+                in_flight.pop()
+            return page
+
+        return fetch
+
+    items = download_history(
+        get_fetch,
+        0,
+        end_time,
+        ("event_time",),
+        ("trade_id", "event_time"),
+        max_concurrency=4,
+        target_window_items=500,
+    )
+    # Items on a boundary are returned by both windows, and kept once
+    assert windows[0] == (18750 * SECOND, end_time)
+    assert items == history
+    assert max(max_in_flight) <= 4
+    # Windows cover the range, newest first, sharing their boundaries
+    starts = [start for start, _ in windows]
+    assert sorted(starts + [end_time]) == sorted({0, *(end for _, end in windows)})
+    # They shrink where the data is dense, and grow where it is sparse
+    sizes = [end - start for start, end in windows]
+    assert min(sizes) < 1250 * SECOND < max(sizes)
+    assert len(windows) < 30
+
+    def one_item(start: int, end: int):
+        return lambda cursor: {"result": history[:1], "next": ""}
+
+    fields = (("event_time",), ("trade_id", "event_time"))
+    assert download_history(one_item, 5, 5, *fields) == history[:1]
+    with pytest.raises(ValueError):
+        download_history(one_item, 5, 4, *fields)
+
+
+def test_raw_client_download_history() -> None:
+    history = make_history([i * SECOND for i in range(5000)])
+
+    async def handler(request: web.Request) -> web.Response:
+        body = await request.json()
+        if body.get("limit") is None:
+            return web.json_response({"code": 1000, "message": "", "status": 400})
+        return web.json_response(get_window_page(history, body))
+
+    async def run() -> tuple[list, list]:
+        app = web.Application()
+        app.router.add_post("/full/v1/trade_history", handler)
+        server = TestServer(app)
+        await server.start_server()
+        api = GrvtRawAsync(
+            GrvtApiConfig(
+                env=GrvtEnv.TESTNET,
+                trading_account_id=None,
+                private_key=None,
+                api_key=None,
+                logger=logger,
+            )
+        )
+        api.md_rpc = str(server.make_url("")).rstrip("/")
+        try:
+            req = ApiTradeHistoryRequest("BTC_USDT_Perp", limit=100)
+            trades = await api.download_history(
+                api.trade_history_v1, req, 0, 4999 * SECOND, max_concurrency=3
+            )
+            dicts = await api.download_history(
+                api.trade_history_v1,
+                req,
+                1000 * SECOND,
+                2000 * SECOND,
+                window_ns=300 * SECOND,
+                decode="dict",
+            )
+            with pytest.raises(GrvtHistoryError):
+                await api.download_history(
+                    api.trade_history_v1, ApiTradeHistoryRequest(""), 0, 1
+                )
+            with pytest.raises(ValueError):
+                await api.download_history(api.trade_history_v1, req, 0, 1, decode="raw")
+            # Items of requests without key fields cannot be deduplicated
+            with pytest.raises(ValueError):
+                await api.download_history(
+                    api.deposit_history_v1,
+                    ApiDepositHistoryRequest(currency=["USDT"]),
+                    0,
+                    1,
+                )
+        finally:
+            await api.close()
+            await server.close()
+        return trades, dicts
+
+    trades, dicts = asyncio.run(run())
+    assert [trade.trade_id for trade in trades] == [item["trade_id"] for item in history]
+    assert all(isinstance(trade, Trade) for trade in trades)
+    assert dicts == history[2999:4000]
@@ -0,0 +1,201 @@
+import copy
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from pysdk import grvt_id_allocator
+from pysdk.grvt_ccxt_utils import get_grvt_order
+from pysdk.grvt_id_allocator import (
+    CLIENT_ORDER_ID_MAX,
+    CLIENT_ORDER_ID_MIN,
+    NONCE_MAX,
+    BaseIdAllocator,
+    IdAllocator,
+    SharedIdAllocator,
+    get_id_allocator,
+    set_id_allocator,
+)
+from pysdk.grvt_raw_base import GrvtApiConfig
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_signing import sign_order
+from pysdk.grvt_signing_context import SigningContext
+
+from .test_grvt_eip712 import INSTRUMENTS, ORDERS
+
+PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+NUM_IDS = 2_000
+
+
+def allocate_ids(allocator=None) -> tuple[list[int], list[int]]:
+    allocator = allocator or get_id_allocator()
+    client_order_ids = [allocator.next_client_order_id() for _ in range(NUM_IDS)]
+    nonces = [allocator.next_nonce() for _ in range(NUM_IDS)]
+    return client_order_ids, nonces
+
+
+def check_ids(client_order_ids: list[int], nonces: list[int]) -> None:
+    assert len(set(client_order_ids)) == len(client_order_ids)
+    assert len(set(nonces)) == len(nonces)
+    assert all(CLIENT_ORDER_ID_MIN <= i <= CLIENT_ORDER_ID_MAX for i in client_order_ids)
+    assert all(1 <= n <= NONCE_MAX for n in nonces)
+
+
+@pytest.mark.parametrize(
+    "make_allocator",
+    [IdAllocator, lambda: IdAllocator(0, lock_dir=None), lambda: SharedIdAllocator(7)],
+)
+def test_ids_unique_across_threads(make_allocator) -> None:
+    allocator = make_allocator()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(allocate_ids, [allocator] * 8))
+    check_ids(
+        [i for ids, _ in results for i in ids],
+        [n for _, nonces in results for n in nonces],
+    )
+
+
+def test_partitioned_ids_unique_across_processes() -> None:
+    # Every pool worker has its own pid, hence its own default partition
+    get_id_allocator()
+    with ProcessPoolExecutor(
+        max_workers=4, mp_context=multiprocessing.get_context("fork")
+    ) as executor:
+        results = [executor.submit(allocate_ids) for _ in range(4)]
+        results = [future.result() for future in results]
+    results.append(allocate_ids())
+    check_ids(
+        [i for ids, _ in results for i in ids],
+        [n for _, nonces in results for n in nonces],
+    )
+
+
+def test_shared_ids_unique_across_processes() -> None:
+    allocator = SharedIdAllocator(block_size=64)
+    parent_ids = allocate_ids(allocator)
+    with ProcessPoolExecutor(
+        max_workers=4,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=set_id_allocator,
+        initargs=(allocator,),
+    ) as executor:
+        results = [executor.submit(allocate_ids) for _ in range(4)]
+        results = [future.result() for future in results]
+    results.append(parent_ids)
+    check_ids(
+        [i for ids, _ in results for i in ids],
+        [n for _, nonces in results for n in nonces],
+    )
+
+
+def test_default_allocator_is_replaced_after_fork() -> None:
+    parent = get_id_allocator()
+    reader, writer = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        child = get_id_allocator()
+        os.write(
+            writer,
+            b"1" if child is not parent and child.partition == os.getpid() else b"0",
+        )
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(reader, 1) == b"1"
+    os.close(reader)
+    os.close(writer)
+
+
+def test_explicit_partition_aliased_in_child_raises(tmp_path) -> None:
+    explicit = IdAllocator(3, lock_dir=tmp_path)
+    default = IdAllocator(lock_dir=tmp_path)
+    reader, writer = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            explicit.next_nonce()
+            raised = False
+        except RuntimeError:
+            raised = True
+        default.next_nonce()
+        moved = default.nonce_partition not in (explicit.nonce_partition, 0)
+        os.write(writer, b"1" if raised and moved else b"0")
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(reader, 1) == b"1"
+    os.close(reader)
+    os.close(writer)
+    # The parent keeps its partitions
+    assert (explicit.nonce_partition, default.nonce_partition) == (3, 0)
+    explicit.next_nonce()
+
+
+def test_partition_range(tmp_path) -> None:
+    allocator = IdAllocator(2**23 - 1, lock_dir=tmp_path)
+    assert allocator.next_client_order_id() <= CLIENT_ORDER_ID_MAX
+    with pytest.raises(ValueError, match="partition"):
+        IdAllocator(2**23)
+    with pytest.raises(ValueError, match="block_size"):
+        SharedIdAllocator(0)
+
+
+def test_nonce_partitions_are_registered(tmp_path) -> None:
+    first, second = IdAllocator(lock_dir=tmp_path), IdAllocator(lock_dir=tmp_path)
+    assert (first.nonce_partition, second.nonce_partition) == (0, 1)
+    assert first.next_nonce() >> 22 == 0
+    assert second.next_nonce() >> 22 == 1
+
+    # Partitions 1029 and 5 share the low 10 bits, hence their nonces
+    explicit = IdAllocator(5, lock_dir=tmp_path)
+    with pytest.raises(ValueError, match="Nonce partition 5 is held"):
+        IdAllocator(5 + 1024, lock_dir=tmp_path)
+    # A released partition can be taken again
+    del explicit
+    assert IdAllocator(5 + 1024, lock_dir=tmp_path).next_nonce() >> 22 == 5
+    # Unregistered partitions are the caller's to keep distinct
+    assert IdAllocator(5, lock_dir=None).nonce_partition == 5
+    with pytest.raises(ValueError, match="lock_dir"):
+        IdAllocator(lock_dir=None)
+    with pytest.raises(TypeError):
+        BaseIdAllocator()  # type: ignore[abstract]
+
+
+def test_orders_use_the_default_allocator() -> None:
+    allocator = SharedIdAllocator()
+    set_id_allocator(allocator)
+    try:
+        order = get_grvt_order(
+            sub_account_id="8289849667772468",
+            symbol="BTC_USDT_Perp",
+            order_type="limit",
+            side="buy",
+            amount=0.01,
+            limit_price=64000,
+            order_duration_secs=60,
+        )
+        assert CLIENT_ORDER_ID_MIN <= int(order.metadata.client_order_id)
+        assert 1 <= order.signature.nonce <= NONCE_MAX
+
+        config = GrvtApiConfig(
+            env=GrvtEnv.TESTNET,
+            private_key=PRIVATE_KEY,
+            trading_account_id="8289849667772468",
+            api_key="not-needed",
+            logger=None,
+        )
+        raw_order = copy.deepcopy(ORDERS[0])
+        raw_order.signature.nonce = 0
+        raw_order.metadata.client_order_id = ""
+        context = SigningContext.from_key(PRIVATE_KEY, 326)
+        sign_order(raw_order, config, context.account, INSTRUMENTS, context)
+        assert raw_order.signature.nonce != 0
+        assert int(raw_order.metadata.client_order_id) >= CLIENT_ORDER_ID_MIN
+        # Ids that are already set are kept
+        signed = sign_order(
+            copy.deepcopy(ORDERS[0]), config, context.account, INSTRUMENTS
+        )
+        assert signed.signature.nonce == ORDERS[0].signature.nonce
+        assert signed.metadata.client_order_id == ORDERS[0].metadata.client_order_id
+    finally:
+        set_id_allocator(None)
+    assert isinstance(grvt_id_allocator.get_id_allocator(), IdAllocator)
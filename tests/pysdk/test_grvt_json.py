@@ -0,0 +1,134 @@
+import asyncio
+import json
+import logging
+from decimal import Decimal
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pysdk import grvt_json
+from pysdk.grvt_ccxt_types import GrvtInstrumentKind
+from pysdk.grvt_json import JsonBackend, JsonCodec, get_available_json_backends
+from pysdk.grvt_raw_async import GrvtRawAsync
+from pysdk.grvt_raw_base import DataclassJSONEncoder, GrvtApiConfig
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_types import ApiGetOrderRequest, OrderLeg
+
+from .test_grvt_eip712 import ORDERS
+
+# Setup logger
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+BACKENDS = get_available_json_backends()
+
+
+@pytest.mark.parametrize("backend", BACKENDS, ids=lambda b: b.value)
+def test_json_codec_matches_stdlib(backend: JsonBackend) -> None:
+    codec = JsonCodec(backend)
+    for order in ORDERS:
+        expected = json.loads(json.dumps(order, cls=DataclassJSONEncoder))
+        assert json.loads(codec.dumps(order)) == expected
+        assert json.loads(codec.dumpb(order)) == expected
+
+    request = ApiGetOrderRequest(sub_account_id="8289849667772468", order_id="0x1")
+    assert json.loads(codec.dumps(request)) == json.loads(
+        json.dumps(request, cls=DataclassJSONEncoder)
+    )
+
+    payload = {
+        "kind": GrvtInstrumentKind.PERPETUAL,
+        "levels": [[1, "2.5"], [None, True]],
+    }
+    assert json.loads(codec.dumps(payload)) == {
+        "kind": "PERPETUAL",
+        "levels": [[1, "2.5"], [None, True]],
+    }
+
+    # Integers over 64 bits are encoded by the json module
+    nonce = 2**70 + 1
+    assert json.loads(codec.dumps({"nonce": nonce})) == {"nonce": nonce}
+
+    text = '{"result": [{"price": "64000.5", "num_orders": 3}], "next": ""}'
+    assert codec.loads(text) == codec.loads(text.encode()) == json.loads(text)
+
+
+@pytest.mark.parametrize("backend", BACKENDS, ids=lambda b: b.value)
+def test_json_codec_output_is_the_same_with_every_backend(backend: JsonBackend) -> None:
+    codec = JsonCodec(backend)
+    payload = {
+        "order": ORDERS[2],
+        "kind": GrvtInstrumentKind.PERPETUAL,
+        "prices": [Decimal("64000.50"), Decimal("1E+2"), Decimal("-0.000001")],
+        "ratio": 0.25,
+        "cursor": None,
+    }
+    expected = JsonCodec(JsonBackend.JSON).dumpb(payload)
+    assert codec.dumpb(payload) == expected
+    assert codec.dumps(payload) == expected.decode()
+    assert b'"prices":["64000.50","1E+2","-0.000001"]' in expected
+
+    for value in (float("nan"), float("inf"), float("-inf")):
+        leg = OrderLeg("BTC_USDT_Perp", "1", True, value)  # type: ignore
+        for obj in (value, {"a": None, "b": [value]}, (None, value), leg):
+            with pytest.raises(ValueError):
+                codec.dumpb(obj)
+            with pytest.raises(ValueError):
+                codec.dumps(obj)
+
+
+def test_json_codec_selection(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GRVT_JSON_BACKEND", "json")
+    assert JsonCodec().backend == JsonBackend.JSON
+    monkeypatch.delenv("GRVT_JSON_BACKEND")
+    assert JsonCodec().backend == BACKENDS[0]
+
+    for backend in JsonBackend:
+        if backend not in BACKENDS:
+            with pytest.raises(ImportError):
+                JsonCodec(backend)
+
+    default_codec = grvt_json.get_json_codec()
+    try:
+        grvt_json.set_json_codec(JsonCodec("json"))
+        assert grvt_json.get_json_codec().backend == JsonBackend.JSON
+        assert grvt_json.json_loads(grvt_json.json_dumpb({"a": 1})) == {"a": 1}
+    finally:
+        grvt_json.set_json_codec(default_codec)
+
+
+def test_raw_async_post_parses_body_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def text(self) -> str:
+        raise AssertionError("the body is parsed from bytes")
+
+    monkeypatch.setattr(aiohttp.ClientResponse, "text", text)
+
+    async def run() -> None:
+        async def handler(request: web.Request) -> web.Response:
+            status = 200 if request.path == "/ok" else 400
+            return web.json_response({"result": [{"price": "1.5"}]}, status=status)
+
+        app = web.Application()
+        app.router.add_post("/ok", handler)
+        app.router.add_post("/error", handler)
+        server = TestServer(app)
+        await server.start_server()
+        api = GrvtRawAsync(
+            GrvtApiConfig(
+                env=GrvtEnv.TESTNET,
+                trading_account_id="8289849667772468",
+                private_key=None,
+                api_key=None,
+                logger=logger,
+            )
+        )
+        expected = {"result": [{"price": "1.5"}]}
+        assert await api._post(False, str(server.make_url("/ok")), {}) == expected
+        assert await api._post(False, str(server.make_url("/error")), {}) == expected
+        await api.close()
+        await server.close()
+
+    asyncio.run(run())
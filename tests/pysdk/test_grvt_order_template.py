@@ -0,0 +1,122 @@
+import copy
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pysdk import grvt_order_template
+from pysdk.grvt_fixed_point import FixedPointError
+from pysdk.grvt_order_template import OrderTemplate, PresignedOrderLadder
+from pysdk.grvt_raw_base import GrvtApiConfig
+from pysdk.grvt_raw_env import CHAIN_IDS, GrvtEnv
+from pysdk.grvt_raw_signing import _get_order_signable_message, sign_order
+from pysdk.grvt_raw_types import Order
+from pysdk.grvt_signing_context import SigningContext
+
+from .test_grvt_eip712 import INSTRUMENTS, ORDERS
+
+# Setup logger
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+CHAIN_ID = CHAIN_IDS[GrvtEnv.TESTNET]
+
+
+def with_builder(order: Order) -> Order:
+    order = copy.deepcopy(order)
+    order.builder = "0xAbC1230001230001230001230001230001230001"
+    order.builder_fee = "0.001"
+    return order
+
+
+@pytest.mark.parametrize("prototype", [*ORDERS, *[with_builder(o) for o in ORDERS]])
+def test_template_signable_message_parity(prototype: Order) -> None:
+    template = OrderTemplate(prototype, INSTRUMENTS, CHAIN_ID)
+    for i, (size, price) in enumerate([("0.5", "100.25"), ("12.000000001", "68900.5")]):
+        legs = [(size, price)] * template.num_legs
+        order = template.new_order(legs, nonce=i, expiration=1730800479321350000 + i)
+        want = _get_order_signable_message(order, CHAIN_ID, INSTRUMENTS)
+        assert template.get_signable_message(order) == want
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_presigned_ladder_matches_sign_order(use_executor: bool) -> None:
+    config = GrvtApiConfig(
+        env=GrvtEnv.TESTNET,
+        private_key=PRIVATE_KEY,
+        trading_account_id="8289849667772468",
+        api_key="not-needed",
+        logger=logger,
+    )
+    context = SigningContext.from_key(PRIVATE_KEY, CHAIN_ID)
+    template = OrderTemplate(ORDERS[0], INSTRUMENTS, CHAIN_ID)
+    levels = [[("0.1", str(68_000 + i))] for i in range(5)]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ladder = PresignedOrderLadder(
+            template, context, executor=executor if use_executor else None
+        )
+        assert ladder.presign(levels, copies=2) == 10
+    assert len(ladder) == 10
+
+    first = ladder.take([("0.1", "68002")])
+    second = ladder.take([("0.100", "68002.0")])
+    assert first is not None and second is not None
+    assert first is not second
+    for order in [first, second]:
+        want = sign_order(copy.deepcopy(order), config, context.account, INSTRUMENTS)
+        assert order.signature == want.signature
+        assert order.legs[0].limit_price == "68002"
+    assert ladder.take([("0.1", "68002")]) is None
+    assert ladder.take([("0.1", "1")]) is None
+    assert len(ladder) == 8
+
+
+def test_presigned_ladder_assigns_distinct_client_order_ids() -> None:
+    context = SigningContext.from_key(PRIVATE_KEY, CHAIN_ID)
+    template = OrderTemplate(ORDERS[0], INSTRUMENTS, CHAIN_ID)
+    ladder = PresignedOrderLadder(template, context)
+    levels = [[("0.1", "68000")], [("0.1", "68001")]]
+    assert ladder.presign(levels, copies=3) == 6
+
+    orders = [ladder.take(legs) for legs in levels for _ in range(3)]
+    client_order_ids = {order.metadata.client_order_id for order in orders if order}
+    assert len(client_order_ids) == 6
+    assert ORDERS[0].metadata.client_order_id not in client_order_ids
+    assert all(2**63 <= int(coid) < 2**64 for coid in client_order_ids)
+
+
+def test_presigned_ladder_evicts_expired(monkeypatch: pytest.MonkeyPatch) -> None:
+    now_ns = 1_730_800_000_000_000_000
+    monkeypatch.setattr(grvt_order_template.time, "time_ns", lambda: now_ns)
+    context = SigningContext.from_key(PRIVATE_KEY, CHAIN_ID)
+    template = OrderTemplate(ORDERS[0], INSTRUMENTS, CHAIN_ID)
+    ladder = PresignedOrderLadder(template, context, ttl_secs=10, min_remaining_secs=2)
+    ladder.presign([[("1", "100")], [("1", "101")]])
+    assert ladder.take([("1", "100")]) is not None
+
+    # Still 2.5 seconds left: usable
+    now_ns += 7_500_000_000
+    ladder.presign([[("1", "102")]])
+    assert len(ladder) == 2
+    # Orders from the first batch have 1.5 seconds left and are evicted on take
+    now_ns += 1_000_000_000
+    assert ladder.take([("1", "101")]) is None
+    assert len(ladder) == 1
+    assert ladder.take([("1", "102")]) is not None
+
+
+def test_ladder_rejects_bad_arguments() -> None:
+    context = SigningContext.from_key(PRIVATE_KEY, CHAIN_ID)
+    template = OrderTemplate(ORDERS[2], INSTRUMENTS, CHAIN_ID)
+    with pytest.raises(ValueError, match="Expected 2 legs"):
+        template.scale_legs([("1", "1")])
+    with pytest.raises(FixedPointError, match="tick_size 0.01"):
+        template.scale_legs([("1", "68900.5"), ("12.5", "3100.255")])
+    with pytest.raises(FixedPointError, match="more than 9 decimal places"):
+        template.scale_legs([("1.0000000001", "68900.5"), ("12.5", "3100.25")])
+    with pytest.raises(ValueError, match="ttl_secs"):
+        PresignedOrderLadder(template, context, ttl_secs=1, min_remaining_secs=5)
+    with pytest.raises(ValueError, match="chain id"):
+        PresignedOrderLadder(template, SigningContext.from_key(PRIVATE_KEY, 1))
@@ -0,0 +1,200 @@
+import asyncio
+import copy
+import dataclasses
+import inspect
+import itertools
+import pickle
+import typing
+from enum import Enum
+from typing import Any
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from dacite import Config, DaciteError
+from dacite import from_dict as dacite_from_dict
+
+from pysdk import grvt_raw_types as types
+from pysdk.grvt_json import json_loads
+from pysdk.grvt_raw_async import GrvtRawAsync
+from pysdk.grvt_raw_base import GrvtApiConfig, GrvtError
+from pysdk.grvt_raw_decoder import DecodeMode, LazyResponse, from_dict, get_decoder
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_types import ApiOrderbookLevelsRequest
+
+RESPONSE_TYPES = [
+    cls
+    for name, cls in inspect.getmembers(types, dataclasses.is_dataclass)
+    if name.endswith("Response")
+]
+
+
+def make_value(type_: Any, counter: itertools.count, omit_optional: bool) -> Any:
+    """JSON-like value of `type_`, as the API would send it."""
+    n = next(counter)
+    if type_ is Any:
+        return {"any": [n]}
+    if type_ is bool:
+        return n % 2 == 0
+    if type_ is int:
+        return n
+    if type_ is str:
+        return str(n)
+    if isinstance(type_, type) and issubclass(type_, Enum):
+        members = list(type_)
+        return members[n % len(members)].value
+    if dataclasses.is_dataclass(type_):
+        return make_data(type_, counter, omit_optional)
+    if typing.get_origin(type_) is list:
+        (item_type,) = typing.get_args(type_)
+        return [make_value(item_type, counter, omit_optional) for _ in range(2)]
+    args = [arg for arg in typing.get_args(type_) if arg is not type(None)]
+    return make_value(args[0], counter, omit_optional)
+
+
+def make_data(cls: type, counter: itertools.count, omit_optional: bool) -> dict:
+    hints = typing.get_type_hints(cls)
+    data = {}
+    for field in dataclasses.fields(cls):
+        is_optional = type(None) in typing.get_args(hints[field.name])
+        if is_optional and omit_optional:
+            continue
+        if is_optional and next(counter) % 3 == 0:
+            data[field.name] = None
+        else:
+            data[field.name] = make_value(hints[field.name], counter, omit_optional)
+    return data
+
+
+def dacite_decode(cls: type, data: Any) -> Any:
+    return dacite_from_dict(cls, data, Config(cast=[Enum]))
+
+
+@pytest.mark.parametrize("cls", RESPONSE_TYPES, ids=lambda cls: cls.__name__)
+@pytest.mark.parametrize("omit_optional", [False, True])
+def test_decoder_parity(cls: type, omit_optional: bool) -> None:
+    data = make_data(cls, itertools.count(), omit_optional)
+    expected = dacite_decode(cls, data)
+    # The compiled decoder alone decodes well formed responses
+    assert get_decoder(cls)(data) == expected
+    assert from_dict(cls, data) == expected
+
+    lazy = LazyResponse(cls, data)
+    for field in dataclasses.fields(cls):
+        assert getattr(lazy, field.name) == getattr(expected, field.name)
+    assert lazy.to_dataclass() == expected
+
+
+def assert_same_error(cls: type, data: Any) -> None:
+    with pytest.raises(Exception) as expected:
+        dacite_decode(cls, data)
+    with pytest.raises(type(expected.value)) as actual:
+        from_dict(cls, data)
+    assert str(actual.value) == str(expected.value)
+
+
+def test_decoder_errors_match_dacite() -> None:
+    data = make_data(types.ApiFillHistoryResponse, itertools.count(), False)
+    fill = data["result"][1]
+    invalid = [
+        ("is_buyer", "true"),
+        ("price", 64000.5),
+        ("venue", "NOT_A_VENUE"),
+        ("broker", 1),
+    ]
+    for key, value in invalid:
+        bad_fill = fill | {key: value}
+        assert_same_error(
+            types.ApiFillHistoryResponse,
+            data | {"result": [data["result"][0], bad_fill]},
+        )
+
+    missing = dict(fill)
+    del missing["price"]
+    with pytest.raises(DaciteError, match="result.price"):
+        from_dict(types.ApiFillHistoryResponse, data | {"result": [missing]})
+    assert_same_error(types.ApiFillHistoryResponse, data | {"result": {"a": 1}})
+    assert_same_error(types.ApiFillHistoryResponse, data | {"next": None})
+
+
+@dataclasses.dataclass
+class MultiUnion:
+    value: int | str | None = None
+
+
+def test_multi_type_unions_are_decoded_by_dacite() -> None:
+    for data in [{"value": 1}, {"value": "1"}, {"value": None}, {}]:
+        assert from_dict(MultiUnion, data) == dacite_decode(MultiUnion, data)
+    assert_same_error(MultiUnion, {"value": 1.5})
+
+
+def test_lazy_response_decodes_on_access() -> None:
+    data = make_data(types.ApiFillHistoryResponse, itertools.count(), False)
+    data["result"][0]["venue"] = "NOT_A_VENUE"
+    lazy = LazyResponse(types.ApiFillHistoryResponse, data)
+    # Fields that are not read are not decoded
+    assert lazy.next == data["next"]
+    with pytest.raises(ValueError):
+        _ = lazy.result
+    with pytest.raises(AttributeError):
+        _ = lazy.undeclared
+
+
+def test_lazy_response_copy_and_pickle() -> None:
+    data = make_data(types.ApiFillHistoryResponse, itertools.count(), False)
+    lazy = LazyResponse(types.ApiFillHistoryResponse, data)
+    for clone in (copy.copy(lazy), copy.deepcopy(lazy), pickle.loads(pickle.dumps(lazy))):
+        assert clone == lazy
+        assert clone.result == lazy.result
+
+
+def test_raw_client_decode_modes() -> None:
+    book = make_data(types.ApiOrderbookLevelsResponse, itertools.count(), False)
+    error = {"code": 1000, "message": "You need to authenticate", "status": 401}
+
+    async def run() -> None:
+        async def handler(request: web.Request) -> web.Response:
+            instrument = (await request.json())["instrument"]
+            if instrument == "BTC_USDT_Perp":
+                return web.json_response(book)
+            if instrument == "SOL_USDT_Perp":
+                return web.json_response(error)
+            return web.json_response(error, status=401)
+
+        app = web.Application()
+        app.router.add_post("/full/v1/book", handler)
+        server = TestServer(app)
+        await server.start_server()
+        api = GrvtRawAsync(
+            GrvtApiConfig(
+                env=GrvtEnv.TESTNET,
+                trading_account_id="8289849667772468",
+                private_key=None,
+                api_key=None,
+                logger=None,
+                decode=DecodeMode.DICT,
+            )
+        )
+        api.md_rpc = str(server.make_url("")).rstrip("/")
+        req = ApiOrderbookLevelsRequest(instrument="BTC_USDT_Perp", depth=10)
+
+        assert await api.orderbook_levels_v1(req) == book
+        resp = await api.orderbook_levels_v1(req, decode="lazy")
+        assert resp == LazyResponse(types.ApiOrderbookLevelsResponse, book)
+        raw = await api.orderbook_levels_v1(req, decode=DecodeMode.RAW)
+        assert isinstance(raw, bytes) and json_loads(raw) == book
+        expected = from_dict(types.ApiOrderbookLevelsResponse, book)
+        resp = await api.orderbook_levels_v1(req, decode=DecodeMode.DATACLASS)
+        assert resp == expected
+
+        req.instrument = "ETH_USDT_Perp"
+        for mode in DecodeMode:
+            assert await api.orderbook_levels_v1(req, decode=mode) == GrvtError(**error)
+        # Errors sent with a 2xx status are reported in every mode, raw included
+        req.instrument = "SOL_USDT_Perp"
+        for mode in DecodeMode:
+            assert await api.orderbook_levels_v1(req, decode=mode) == GrvtError(**error)
+        await api.close()
+        await server.close()
+
+    asyncio.run(run())
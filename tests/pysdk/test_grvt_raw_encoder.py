@@ -0,0 +1,160 @@
+import asyncio
+import dataclasses
+import inspect
+import itertools
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pysdk import grvt_raw_types as types
+from pysdk.grvt_raw_async import GrvtRawAsync
+from pysdk.grvt_raw_base import DataclassJSONEncoder, GrvtApiConfig
+from pysdk.grvt_raw_decoder import from_dict
+from pysdk.grvt_raw_encoder import encode_value, to_dict
+from pysdk.grvt_raw_env import GrvtEnv
+
+from .test_grvt_eip712 import ORDERS
+from .test_grvt_raw_decoder import MultiUnion, make_data
+
+DATACLASS_TYPES = [cls for _, cls in inspect.getmembers(types, dataclasses.is_dataclass)]
+
+
+@pytest.mark.parametrize("cls", DATACLASS_TYPES, ids=lambda cls: cls.__name__)
+def test_encoder_matches_dataclass_json_encoder(cls: type) -> None:
+    # make_data only sets optional fields to None
+    value = from_dict(cls, make_data(cls, itertools.count(), False))
+    expected = json.loads(json.dumps(value, cls=DataclassJSONEncoder))
+    assert to_dict(value) == expected
+    assert json.dumps(to_dict(value)) == json.dumps(value, cls=DataclassJSONEncoder)
+
+
+TRANSFER = types.ApiTransferRequest(
+    from_account_id="0xc73c0c2538fd9b833d20933ccc88fdaa74fcb0d0",
+    from_sub_account_id="8289849667772468",
+    to_account_id="0xc73c0c2538fd9b833d20933ccc88fdaa74fcb0d0",
+    to_sub_account_id="0",
+    currency="USDT",
+    num_tokens="1.5",
+    signature=types.Signature(
+        signer="0xc73c0c2538fd9b833d20933ccc88fdaa74fcb0d0",
+        r="0x01",
+        s="0x02",
+        v=27,
+        expiration="1730800479321350000",
+        nonce=828700936,
+    ),
+    transfer_type=types.TransferType.STANDARD,
+    transfer_metadata="",
+)
+
+
+def test_encoded_bytes_are_pinned() -> None:
+    order = types.ApiCreateOrderRequest(order=ORDERS[0])
+    assert json.dumps(to_dict(order)).encode() == (
+        b'{"order": {"sub_account_id": "8289849667772468", '
+        b'"time_in_force": "GOOD_TILL_TIME", "legs": [{"instrument": "BTC_USDT_Perp", '
+        b'"size": "1.013", "is_buying_asset": false, "limit_price": "68900.5"}], '
+        b'"signature": {"signer": "", "r": "", "s": "", "v": 0, '
+        b'"expiration": 1730800479321350000, "nonce": 828700936}, '
+        b'"metadata": {"client_order_id": "1", "create_time": "1730800479321350000", '
+        b'"trigger": null, "broker": null}, "order_id": null, "is_market": false, '
+        b'"post_only": false, "reduce_only": false, "builder": null, '
+        b'"builder_fee": null, "state": null}}'
+    )
+    assert json.dumps(to_dict(TRANSFER)).encode() == (
+        b'{"from_account_id": "0xc73c0c2538fd9b833d20933ccc88fdaa74fcb0d0", '
+        b'"from_sub_account_id": "8289849667772468", '
+        b'"to_account_id": "0xc73c0c2538fd9b833d20933ccc88fdaa74fcb0d0", '
+        b'"to_sub_account_id": "0", "currency": "USDT", "num_tokens": "1.5", '
+        b'"signature": {"signer": "0xc73c0c2538fd9b833d20933ccc88fdaa74fcb0d0", '
+        b'"r": "0x01", "s": "0x02", "v": 27, "expiration": "1730800479321350000", '
+        b'"nonce": 828700936}, "transfer_type": "STANDARD", "transfer_metadata": ""}'
+    )
+    for request in (order, TRANSFER):
+        baseline = json.dumps(request, cls=DataclassJSONEncoder)
+        assert json.dumps(to_dict(request)) == baseline
+
+
+def test_encoder_values() -> None:
+    order = ORDERS[0]
+    encoded = to_dict(types.ApiCreateOrderRequest(order=order))["order"]
+    assert encoded["order_id"] is None
+    assert encoded["state"] is None
+    assert encoded["time_in_force"] == "GOOD_TILL_TIME"
+    assert encoded["legs"] == [dataclasses.asdict(leg) for leg in order.legs]
+    assert to_dict(types.ApiCreateOrderRequest(order=order)) == {"order": encoded}
+
+    # Every field is sent, None as null
+    assert to_dict(types.OrderLeg(None, "1", True, None)) == {  # type: ignore
+        "instrument": None,
+        "size": "1",
+        "is_buying_asset": True,
+        "limit_price": None,
+    }
+    # Values not matching the type hints are encoded by their type
+    cancel = types.ApiCancelAllOrdersRequest(
+        sub_account_id="1",
+        kind=["PERPETUAL", types.Kind.FUTURE],  # type: ignore
+        base=("BTC", "ETH"),  # type: ignore
+    )
+    assert to_dict(cancel) == {
+        "sub_account_id": "1",
+        "kind": ["PERPETUAL", "FUTURE"],
+        "base": ["BTC", "ETH"],
+        "quote": None,
+    }
+    request = types.ApiCreateOrderRequest(order={"legs": [order.legs[0]]})  # type: ignore
+    assert to_dict(request) == {"order": {"legs": [encoded["legs"][0]]}}
+    assert to_dict({"kind": types.Kind.PERPETUAL}) == {"kind": types.Kind.PERPETUAL}
+    assert encode_value({"kind": (types.Kind.PERPETUAL,)}) == {"kind": ["PERPETUAL"]}
+
+
+def test_multi_type_unions_are_encoded_by_their_type() -> None:
+    # Optional like in the decoders: None is sent as null, else encoded as is
+    assert to_dict(MultiUnion()) == {"value": None}
+    assert to_dict(MultiUnion(1)) == {"value": 1}
+    assert to_dict(MultiUnion(types.Kind.FUTURE)) == {"value": "FUTURE"}  # type: ignore
+
+
+def test_raw_client_sends_encoded_requests() -> None:
+    bodies = []
+
+    async def handler(request: web.Request) -> web.Response:
+        bodies.append(await request.json())
+        return web.json_response({"result": {"ack": True}})
+
+    async def run() -> None:
+        app = web.Application()
+        app.router.add_post("/full/v1/cancel_all_orders", handler)
+        server = TestServer(app)
+        await server.start_server()
+        api = GrvtRawAsync(
+            GrvtApiConfig(
+                env=GrvtEnv.TESTNET,
+                trading_account_id=None,
+                private_key=None,
+                api_key=None,
+                logger=None,
+            )
+        )
+        api.td_rpc = str(server.make_url("")).rstrip("/")
+        try:
+            req = types.ApiCancelAllOrdersRequest("1", kind=[types.Kind.PERPETUAL])
+            resp = await api._call(
+                False,
+                api.td_rpc + "/full/v1/cancel_all_orders",
+                req,
+                types.AckResponse,
+                None,
+            )
+            assert resp == types.AckResponse(types.Ack(True))
+        finally:
+            await api.close()
+            await server.close()
+
+    asyncio.run(run())
+    assert bodies == [
+        {"sub_account_id": "1", "kind": ["PERPETUAL"], "base": None, "quote": None}
+    ]
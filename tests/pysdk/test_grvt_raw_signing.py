@@ -5,9 +5,10 @@ from pprint import pprint
 import pytest
 from eth_account import Account
 
+from pysdk.grvt_fixed_point import FixedPointError
 from pysdk.grvt_fixed_types import Transfer
 from pysdk.grvt_raw_base import GrvtApiConfig
-from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_env import CHAIN_IDS, GrvtEnv
 from pysdk.grvt_raw_signing import (
     ZERO_ADDRESS,
     _has_builder,
@@ -26,6 +27,8 @@ from pysdk.grvt_raw_types import (
     TimeInForce,
     TransferType,
 )
+from pysdk.grvt_signer import get_available_signer_backends
+from pysdk.grvt_signing_context import SigningContext
 
 # Setup logger
 logging.basicConfig()
@@ -33,6 +36,14 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
+def get_signing_contexts(private_key: str) -> list[SigningContext | None]:
+    """None signs with the eth_account Account, then one context per signer backend."""
+    return [None] + [
+        SigningContext.from_key(private_key, CHAIN_IDS[GrvtEnv.TESTNET], backend)
+        for backend in get_available_signer_backends()
+    ]
+
+
 def test_sign_order_table():
     private_key = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
     sub_account_id = "8289849667772468"
@@ -97,7 +108,7 @@ def test_sign_order_table():
             "want_error": None,
         },
         {
-            "name": "test decimal precision 3, round down",
+            "name": "test decimal precision 3, digits beyond precision raise",
             "order": Order(
                 metadata=OrderMetadata(
                     client_order_id="1", create_time="1730800479321350000"
@@ -119,13 +130,10 @@ def test_sign_order_table():
                     signer="", r="", s="", v=0, expiration=expiry, nonce=nonce
                 ),
             ),
-            "want_r": "0x365ec79d299c8bcd5f2acff89faf741a90ca02a4b8a6b1b1a5d4f3d16130f9f0",
-            "want_s": "0x465129bca7855f008ea5bc22fe3ee630e4a8e3b9b99c1745631deef29957048a",
-            "want_v": 28,
-            "want_error": None,
+            "want_error": FixedPointError,
         },
         {
-            "name": "test decimal precision 4, round down",
+            "name": "test decimal precision 4, digits beyond precision raise",
             "order": Order(
                 metadata=OrderMetadata(
                     client_order_id="1", create_time="1730800479321350000"
@@ -147,10 +155,7 @@ def test_sign_order_table():
                     signer="", r="", s="", v=0, expiration=expiry, nonce=nonce
                 ),
             ),
-            "want_r": "0x365ec79d299c8bcd5f2acff89faf741a90ca02a4b8a6b1b1a5d4f3d16130f9f0",
-            "want_s": "0x465129bca7855f008ea5bc22fe3ee630e4a8e3b9b99c1745631deef29957048a",
-            "want_v": 28,
-            "want_error": None,
+            "want_error": FixedPointError,
         },
         # {
         #     "name": "no private key",
@@ -190,7 +195,7 @@ def test_sign_order_table():
             kind=Kind.PERPETUAL,
             venues=[],
             settlement_period=InstrumentSettlementPeriod.DAILY,
-            tick_size="0.00000001",
+            tick_size="0.000000001",
             min_size="0.00000001",
             create_time="123",
             base_decimals=9,
@@ -199,34 +204,41 @@ def test_sign_order_table():
         )
     }
 
-    for tc in test_cases:
-        config = GrvtApiConfig(
-            env=GrvtEnv.TESTNET,
-            private_key=private_key,
-            trading_account_id=sub_account_id,
-            api_key="not-needed",
-            logger=logger,
-        )
-
-        signed_order = sign_order(tc["order"], config, account, instruments)
-        pprint(signed_order)
-
-        # Verify signature fields are populated
-        assert signed_order.signature.signer == str(account.address)
+    for signing_context in get_signing_contexts(private_key):
+        for tc in test_cases:
+            config = GrvtApiConfig(
+                env=GrvtEnv.TESTNET,
+                private_key=private_key,
+                trading_account_id=sub_account_id,
+                api_key="not-needed",
+                logger=logger,
+            )
 
-        # Compare r, s, v values with expected values
-        if "want_r" in tc:
-            assert (
-                signed_order.signature.r == tc["want_r"]
-            ), f"Test '{tc['name']}' failed: r value mismatch"
-        if "want_s" in tc:
-            assert (
-                signed_order.signature.s == tc["want_s"]
-            ), f"Test '{tc['name']}' failed: s value mismatch"
-        if "want_v" in tc:
-            assert (
-                signed_order.signature.v == tc["want_v"]
-            ), f"Test '{tc['name']}' failed: v value mismatch"
+            if tc["want_error"] is not None:
+                with pytest.raises(tc["want_error"]):
+                    sign_order(tc["order"], config, account, instruments, signing_context)
+                continue
+            signed_order = sign_order(
+                tc["order"], config, account, instruments, signing_context
+            )
+            pprint(signed_order)
+
+            # Verify signature fields are populated
+            assert signed_order.signature.signer == str(account.address)
+
+            # Compare r, s, v values with expected values
+            if "want_r" in tc:
+                assert (
+                    signed_order.signature.r == tc["want_r"]
+                ), f"Test '{tc['name']}' failed: r value mismatch"
+            if "want_s" in tc:
+                assert (
+                    signed_order.signature.s == tc["want_s"]
+                ), f"Test '{tc['name']}' failed: s value mismatch"
+            if "want_v" in tc:
+                assert (
+                    signed_order.signature.v == tc["want_v"]
+                ), f"Test '{tc['name']}' failed: v value mismatch"
 
 
 def test_sign_transfer_table():
@@ -369,26 +381,29 @@ def test_sign_transfer_table():
         logger=logger,
     )
 
-    for tc in test_cases:
-        signed = sign_transfer(tc["transfer"], config, account, chainId)
-        pprint(signed)
-
-        # Verify signature fields are populated
-        assert signed.signature.signer == str(account.address)
-
-        # Compare r, s, v values with expected values
-        if "want_r" in tc:
-            assert (
-                signed.signature.r == tc["want_r"]
-            ), f"Test '{tc['name']}' failed: r value mismatch"
-        if "want_s" in tc:
-            assert (
-                signed.signature.s == tc["want_s"]
-            ), f"Test '{tc['name']}' failed: s value mismatch"
-        if "want_v" in tc:
-            assert (
-                signed.signature.v == tc["want_v"]
-            ), f"Test '{tc['name']}' failed: v value mismatch"
+    for signing_context in get_signing_contexts(private_key):
+        for tc in test_cases:
+            signed = sign_transfer(
+                tc["transfer"], config, account, chainId, signing_context=signing_context
+            )
+            pprint(signed)
+
+            # Verify signature fields are populated
+            assert signed.signature.signer == str(account.address)
+
+            # Compare r, s, v values with expected values
+            if "want_r" in tc:
+                assert (
+                    signed.signature.r == tc["want_r"]
+                ), f"Test '{tc['name']}' failed: r value mismatch"
+            if "want_s" in tc:
+                assert (
+                    signed.signature.s == tc["want_s"]
+                ), f"Test '{tc['name']}' failed: s value mismatch"
+            if "want_v" in tc:
+                assert (
+                    signed.signature.v == tc["want_v"]
+                ), f"Test '{tc['name']}' failed: v value mismatch"
 
 
 def test_sign_order_with_builder_fee_table():
@@ -447,7 +462,7 @@ def test_sign_order_with_builder_fee_table():
             kind=Kind.PERPETUAL,
             venues=[],
             settlement_period=InstrumentSettlementPeriod.DAILY,
-            tick_size="0.00000001",
+            tick_size="0.000000001",
             min_size="0.00000001",
             create_time="123",
             base_decimals=9,
@@ -456,51 +471,54 @@ def test_sign_order_with_builder_fee_table():
         )
     }
 
-    for tc in test_cases:
-        config = GrvtApiConfig(
-            env=GrvtEnv.TESTNET,
-            private_key=private_key,
-            trading_account_id=sub_account_id,
-            api_key="not-needed",
-            logger=logger,
-        )
+    for signing_context in get_signing_contexts(private_key):
+        for tc in test_cases:
+            config = GrvtApiConfig(
+                env=GrvtEnv.TESTNET,
+                private_key=private_key,
+                trading_account_id=sub_account_id,
+                api_key="not-needed",
+                logger=logger,
+            )
 
-        order = Order(
-            metadata=OrderMetadata(
-                client_order_id="1", create_time="1730800479321350000"
-            ),
-            sub_account_id=sub_account_id,
-            time_in_force=TimeInForce.GOOD_TILL_TIME,
-            post_only=False,
-            is_market=False,
-            reduce_only=False,
-            legs=[
-                OrderLeg(
-                    instrument="BTC_USDT_Perp",
-                    size="1.013",
-                    limit_price="68900.5",
-                    is_buying_asset=False,
-                )
-            ],
-            signature=Signature(
-                signer="", r="", s="", v=0, expiration=expiry, nonce=nonce
-            ),
-            builder=builder,
-            builder_fee=tc["builder_fee"],
-        )
+            order = Order(
+                metadata=OrderMetadata(
+                    client_order_id="1", create_time="1730800479321350000"
+                ),
+                sub_account_id=sub_account_id,
+                time_in_force=TimeInForce.GOOD_TILL_TIME,
+                post_only=False,
+                is_market=False,
+                reduce_only=False,
+                legs=[
+                    OrderLeg(
+                        instrument="BTC_USDT_Perp",
+                        size="1.013",
+                        limit_price="68900.5",
+                        is_buying_asset=False,
+                    )
+                ],
+                signature=Signature(
+                    signer="", r="", s="", v=0, expiration=expiry, nonce=nonce
+                ),
+                builder=builder,
+                builder_fee=tc["builder_fee"],
+            )
 
-        signed_order = sign_order(order, config, account, instruments)
+            signed_order = sign_order(
+                order, config, account, instruments, signing_context
+            )
 
-        assert signed_order.signature.signer == str(account.address)
-        assert (
-            signed_order.signature.r == tc["want_r"]
-        ), f"Test '{tc['name']}' failed: r value mismatch"
-        assert (
-            signed_order.signature.s == tc["want_s"]
-        ), f"Test '{tc['name']}' failed: s value mismatch"
-        assert (
-            signed_order.signature.v == tc["want_v"]
-        ), f"Test '{tc['name']}' failed: v value mismatch"
+            assert signed_order.signature.signer == str(account.address)
+            assert (
+                signed_order.signature.r == tc["want_r"]
+            ), f"Test '{tc['name']}' failed: r value mismatch"
+            assert (
+                signed_order.signature.s == tc["want_s"]
+            ), f"Test '{tc['name']}' failed: s value mismatch"
+            assert (
+                signed_order.signature.v == tc["want_v"]
+            ), f"Test '{tc['name']}' failed: v value mismatch"
 
 
 def test_sign_order_builder_detection():
@@ -527,7 +545,7 @@ def test_sign_order_builder_detection():
             kind=Kind.PERPETUAL,
             venues=[],
             settlement_period=InstrumentSettlementPeriod.DAILY,
-            tick_size="0.00000001",
+            tick_size="0.000000001",
             min_size="0.00000001",
             create_time="123",
             base_decimals=9,
@@ -616,7 +634,7 @@ def test_sign_order_builder_fee_none_raises():
             kind=Kind.PERPETUAL,
             venues=[],
             settlement_period=InstrumentSettlementPeriod.DAILY,
-            tick_size="0.00000001",
+            tick_size="0.000000001",
             min_size="0.00000001",
             create_time="123",
             base_decimals=9,
@@ -696,7 +714,7 @@ def test_builder_fee_encoding():
             kind=Kind.PERPETUAL,
             venues=[],
             settlement_period=InstrumentSettlementPeriod.DAILY,
-            tick_size="0.00000001",
+            tick_size="0.000000001",
             min_size="0.00000001",
             create_time="123",
             base_decimals=9,
@@ -2,9 +2,11 @@ import json
 import logging
 import traceback
 
+import pytest
 from eth_account import Account
 from eth_account.messages import encode_typed_data
 
+from pysdk.grvt_fixed_point import FixedPointError
 from pysdk.grvt_fixed_types import Transfer
 from pysdk.grvt_raw_base import GrvtApiConfig
 from pysdk.grvt_raw_env import GrvtEnv
@@ -178,7 +180,7 @@ def test_sign_order_table():
 }""",
         },
         {
-            "name": "test decimal precision 3, round down",
+            "name": "test decimal precision 3, digits beyond precision raise",
             "order": Order(
                 metadata=OrderMetadata(
                     client_order_id="1", create_time="1730800479321350000"
@@ -200,48 +202,10 @@ def test_sign_order_table():
                     signer="", r="", s="", v=0, expiration=expiry, nonce=nonce
                 ),
             ),
-            "expected_message_data_json": """
-{
-  "subAccountID": "8289849667772468",
-  "isMarket": false,
-  "timeInForce": 1,
-  "postOnly": false,
-  "reduceOnly": false,
-  "legs": [
-    {
-      "assetID": "0x030501",
-      "contractSize": 1123123123,
-      "limitPrice": 68900777123479,
-      "isBuyingContract": false
-    }
-  ],
-  "nonce": 828700936,
-  "expiration": 1730800479321350000
-}""",
-            "expected_domain_data_json": """
-{
-  "name": "GRVT Exchange",
-  "version": "0",
-  "chainId": 326
-}""",
-            "expected_signable_message": """
-{
-  "version": "01",
-  "header": "1254f97f8495f704630a238cbcd898a4b8ab20d77bb93e17049d3445f4f81f16",
-  "body": "e85ffec169d4ebd4b8057e5fbd31ed31d4511b2f2299bbce0adab6beb5fe2814"
-}""",
-            "digest_input": "0x19011254f97f8495f704630a238cbcd898a4b8ab20d77bb93e17049d3445f4f81f16e85ffec169d4ebd4b8057e5fbd31ed31d4511b2f2299bbce0adab6beb5fe2814",
-            "expected_signed_message": """
-{
-  "message_hash": "2d0a437f7d64523386974c2a729d69604f8e2a7f0684b7de923845d8b175ab69",
-  "r": 30067953785684815030293507105225786115862149795459199007947867478230986262090,
-  "s": 23299979093064779986156565292425191814752388247725004533191995996670719399433,
-  "v": 28,
-  "signature": "4279dbd734584fb07b016bce7d9f029e7f7f80e378dc65cddc06aa6b0c9e064a33835221a0fbcb700de3068169b45572a27756bff479f2887e8c89139e6f96091c"
-}""",
+            "want_error": FixedPointError,
         },
         {
-            "name": "test decimal precision 4, round down",
+            "name": "test decimal precision 4, digits beyond precision raise",
             "order": Order(
                 metadata=OrderMetadata(
                     client_order_id="1", create_time="1730800479321350000"
@@ -263,45 +227,7 @@ def test_sign_order_table():
                     signer="", r="", s="", v=0, expiration=expiry, nonce=nonce
                 ),
             ),
-            "expected_message_data_json": """
-{
-  "subAccountID": "8289849667772468",
-  "isMarket": false,
-  "timeInForce": 1,
-  "postOnly": false,
-  "reduceOnly": false,
-  "legs": [
-    {
-      "assetID": "0x030501",
-      "contractSize": 1123123123,
-      "limitPrice": 68900777123479,
-      "isBuyingContract": false
-    }
-  ],
-  "nonce": 828700936,
-  "expiration": 1730800479321350000
-}""",
-            "expected_domain_data_json": """
-{
-  "name": "GRVT Exchange",
-  "version": "0",
-  "chainId": 326
-}""",
-            "expected_signable_message": """
-{
-  "version": "01",
-  "header": "1254f97f8495f704630a238cbcd898a4b8ab20d77bb93e17049d3445f4f81f16",
-  "body": "e85ffec169d4ebd4b8057e5fbd31ed31d4511b2f2299bbce0adab6beb5fe2814"
-}""",
-            "digest_input": "0x19011254f97f8495f704630a238cbcd898a4b8ab20d77bb93e17049d3445f4f81f16e85ffec169d4ebd4b8057e5fbd31ed31d4511b2f2299bbce0adab6beb5fe2814",
-            "expected_signed_message": """
-{
-  "message_hash": "2d0a437f7d64523386974c2a729d69604f8e2a7f0684b7de923845d8b175ab69",
-  "r": 30067953785684815030293507105225786115862149795459199007947867478230986262090,
-  "s": 23299979093064779986156565292425191814752388247725004533191995996670719399433,
-  "v": 28,
-  "signature": "4279dbd734584fb07b016bce7d9f029e7f7f80e378dc65cddc06aa6b0c9e064a33835221a0fbcb700de3068169b45572a27756bff479f2887e8c89139e6f96091c"
-}""",
+            "want_error": FixedPointError,
         },
     ]
 
@@ -316,7 +242,7 @@ def test_sign_order_table():
             kind=Kind.PERPETUAL,
             venues=[],
             settlement_period=InstrumentSettlementPeriod.DAILY,
-            tick_size="0.00000001",
+            tick_size="0.000000001",
             min_size="0.00000001",
             create_time="123",
             base_decimals=9,
@@ -334,6 +260,13 @@ def test_sign_order_table():
             logger=logger,
         )
 
+        if "want_error" in tc:
+            with pytest.raises(tc["want_error"]):
+                build_EIP712_order_message_data(tc["order"], instruments)
+            with pytest.raises(tc["want_error"]):
+                sign_order(tc["order"], config, account, instruments)
+            continue
+
         # Get intermediate values
         message_data = build_EIP712_order_message_data(tc["order"], instruments)
         domain_data = get_EIP712_domain_data(config.env, 326)
@@ -520,7 +453,7 @@ def test_sign_order_with_builder_fee_table():
             kind=Kind.PERPETUAL,
             venues=[],
             settlement_period=InstrumentSettlementPeriod.DAILY,
-            tick_size="0.00000001",
+            tick_size="0.000000001",
             min_size="0.00000001",
             create_time="123",
             base_decimals=9,
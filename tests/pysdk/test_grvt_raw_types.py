@@ -0,0 +1,43 @@
+import copy
+import dataclasses
+import itertools
+import pickle
+
+import pytest
+
+from pysdk import grvt_raw_types as types
+from pysdk.grvt_raw_decoder import from_dict
+
+from .test_grvt_raw_decoder import make_data
+
+SLOTTED_TYPES = [
+    types.Candlestick,
+    types.Fill,
+    types.FundingPayment,
+    types.FundingRate,
+    types.Order,
+    types.OrderLeg,
+    types.OrderMetadata,
+    types.OrderState,
+    types.OrderbookLevel,
+    types.Positions,
+    types.Signature,
+    types.TPSLOrderMetadata,
+    types.Trade,
+    types.TriggerOrderMetadata,
+]
+
+
+@pytest.mark.parametrize("cls", SLOTTED_TYPES, ids=lambda cls: cls.__name__)
+def test_slotted_types_behave_like_dataclasses(cls: type) -> None:
+    value = from_dict(cls, make_data(cls, itertools.count(), False))
+    assert not hasattr(value, "__dict__")
+    assert pickle.loads(pickle.dumps(value)) == value
+    assert copy.deepcopy(value) == value
+    assert from_dict(cls, dataclasses.asdict(value)) == value
+    field = dataclasses.fields(cls)[0].name
+    clone = dataclasses.replace(value)
+    setattr(clone, field, None)
+    assert clone != value
+    with pytest.raises(AttributeError):
+        value.undeclared = 1
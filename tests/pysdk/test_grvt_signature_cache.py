@@ -0,0 +1,146 @@
+import asyncio
+import copy
+import logging
+
+import pytest
+
+from pysdk import grvt_ccxt_utils
+from pysdk.grvt_async_signing import AsyncSigner
+from pysdk.grvt_ccxt_env import GrvtEnv as GrvtCcxtEnv
+from pysdk.grvt_raw_base import GrvtApiConfig
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_signing import sign_order
+from pysdk.grvt_signature_cache import (
+    SignatureCache,
+    SignatureCacheKey,
+    get_signature_cache_key,
+)
+from pysdk.grvt_signing_context import SigningContext
+
+from .test_grvt_async_signing import CCXT_INSTRUMENTS
+from .test_grvt_eip712 import INSTRUMENTS, ORDERS
+
+# Setup logger
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+NOW_NS = 1_730_800_000_000_000_000
+
+
+def key(
+    nonce: int, expiration: int = NOW_NS + 1, content: str = "order"
+) -> SignatureCacheKey:
+    return SignatureCacheKey(nonce, expiration, content)
+
+
+def test_lru_expiration_and_ack_eviction() -> None:
+    cache = SignatureCache(maxsize=2)
+    cache.put(key(1), (1, 1, 27))
+    cache.put(key(2), (2, 2, 27))
+    assert cache.get(key(1), NOW_NS) == (1, 1, 27)
+    # Key 2 is least recently used
+    cache.put(key(3), (3, 3, 27))
+    assert cache.get(key(2), NOW_NS) is None
+    assert len(cache) == 2
+
+    assert cache.get(key(1), NOW_NS + 1) is None
+    assert len(cache) == 1
+
+    cache.put(key(4, content="other"), (4, 4, 28))
+    assert cache.evict(3, str(NOW_NS + 1)) == 1
+    assert cache.evict(3, NOW_NS + 1) == 0
+    assert cache.evict_expired(NOW_NS + 2) == 1
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 2)
+    with pytest.raises(ValueError, match="maxsize"):
+        SignatureCache(0)
+
+
+def test_evict_matches_string_and_int_nonces() -> None:
+    cache = SignatureCache()
+    for nonce in ["7", 8]:
+        message_data = {"nonce": nonce, "expiration": str(NOW_NS + 1), "legs": []}
+        cache.put(get_signature_cache_key(1, "0xabc", message_data), (1, 1, 27))
+    assert cache.evict(7, NOW_NS + 1) == 1
+    assert cache.evict("8", str(NOW_NS + 1)) == 1
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("use_context", [False, True])
+def test_sign_order_reuses_signature(use_context: bool) -> None:
+    config = GrvtApiConfig(
+        env=GrvtEnv.TESTNET,
+        private_key=PRIVATE_KEY,
+        trading_account_id="8289849667772468",
+        api_key="not-needed",
+        logger=logger,
+    )
+    context = SigningContext.from_key(PRIVATE_KEY, 326)
+    signing_context = context if use_context else None
+    cache = SignatureCache()
+    order = copy.deepcopy(ORDERS[1])
+    order.signature.expiration = str(2**62)
+    want = sign_order(copy.deepcopy(order), config, context.account, INSTRUMENTS)
+
+    for size in [order.legs[0].size, order.legs[0].size + "000"]:
+        retry = copy.deepcopy(order)
+        retry.legs[0].size = size
+        sign_order(retry, config, context.account, INSTRUMENTS, signing_context, cache)
+        assert retry.signature == want.signature
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # A different nonce is a different order
+    retry = copy.deepcopy(order)
+    retry.signature.nonce += 1
+    sign_order(retry, config, context.account, INSTRUMENTS, signing_context, cache)
+    assert retry.signature.r != want.signature.r
+    assert len(cache) == 2
+
+
+def test_ccxt_payloads_reuse_signature_until_ack() -> None:
+    context = SigningContext.from_key(PRIVATE_KEY, 326)
+    signer = AsyncSigner(context)
+    cache = SignatureCache()
+    order = grvt_ccxt_utils.get_grvt_order(
+        sub_account_id="8289849667772468",
+        symbol="BTC_USDT_Perp",
+        order_type="limit",
+        side="buy",
+        amount="0.01",
+        limit_price="60000",
+    )
+    first = grvt_ccxt_utils.get_order_payload(
+        copy.deepcopy(order),
+        PRIVATE_KEY,
+        GrvtCcxtEnv.TESTNET,
+        CCXT_INSTRUMENTS,
+        signing_context=context,
+        signature_cache=cache,
+    )
+    # Rebuilt from the same parameters, nonce and expiration
+    rebuilt = grvt_ccxt_utils.get_grvt_order(
+        sub_account_id="8289849667772468",
+        symbol="BTC_USDT_Perp",
+        order_type="limit",
+        side="buy",
+        amount="0.010",
+        limit_price="60000.0",
+        params={
+            "client_order_id": order.metadata.client_order_id,
+            "nonce": order.signature.nonce,
+            "expiration": order.signature.expiration,
+        },
+    )
+    retry = asyncio.run(
+        grvt_ccxt_utils.get_order_rpc_payload_async(
+            rebuilt, GrvtCcxtEnv.TESTNET, CCXT_INSTRUMENTS, signer, signature_cache=cache
+        )
+    )
+    assert retry["params"]["order"]["signature"] == first["order"]["signature"]
+    assert (cache.hits, cache.misses, signer.metrics.signed) == (1, 1, 0)
+
+    signature = first["order"]["signature"]
+    assert cache.evict(signature["nonce"], signature["expiration"]) == 1
+    assert len(cache) == 0
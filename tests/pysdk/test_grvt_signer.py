@@ -0,0 +1,124 @@
+import copy
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from eth_account import Account
+from eth_utils import keccak
+
+from pysdk import grvt_ccxt_utils, grvt_signer
+from pysdk.grvt_ccxt_env import GrvtEnv as GrvtCcxtEnv
+from pysdk.grvt_raw_base import GrvtApiConfig
+from pysdk.grvt_raw_env import CHAIN_IDS, GrvtEnv
+from pysdk.grvt_raw_signing import sign_order, sign_orders_batch
+from pysdk.grvt_signer import (
+    Signer,
+    SignerBackend,
+    get_available_signer_backends,
+    get_signer,
+    is_signer_backend_available,
+)
+from pysdk.grvt_signing_context import SigningContext
+
+from .test_grvt_eip712 import INSTRUMENTS, ORDERS
+
+# Setup logger
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+
+requires_secp256k1 = pytest.mark.skipif(
+    not is_signer_backend_available(SignerBackend.SECP256K1),
+    reason="coincurve is not installed",
+)
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        SignerBackend.ETH_ACCOUNT,
+        pytest.param(SignerBackend.SECP256K1, marks=requires_secp256k1),
+    ],
+)
+@pytest.mark.parametrize("private_key", [PRIVATE_KEY, "0x" + PRIVATE_KEY])
+def test_signer_matches_eth_account(backend: SignerBackend, private_key: str) -> None:
+    account = Account.from_key(private_key)
+    signer = get_signer(private_key, backend.value)
+    assert signer.backend == backend
+    for i in range(64):
+        digest = keccak(i.to_bytes(4, byteorder="big"))
+        signed = account.unsafe_sign_hash(digest)
+        assert signer.sign_digest(digest) == (signed.r, signed.s, signed.v)
+
+
+@requires_secp256k1
+def test_secp256k1_signing_context_and_batch() -> None:
+    config = GrvtApiConfig(
+        env=GrvtEnv.TESTNET,
+        private_key=PRIVATE_KEY,
+        trading_account_id="8289849667772468",
+        api_key="not-needed",
+        logger=logger,
+        signer_backend="secp256k1",
+    )
+    account = Account.from_key(PRIVATE_KEY)
+    context = SigningContext.from_key(
+        PRIVATE_KEY, CHAIN_IDS[GrvtEnv.TESTNET], config.signer_backend
+    )
+    assert context.signer_backend == SignerBackend.SECP256K1
+    want = [
+        sign_order(copy.deepcopy(order), config, account, INSTRUMENTS).signature
+        for order in ORDERS
+    ]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        signed = sign_orders_batch(
+            copy.deepcopy(ORDERS), config, INSTRUMENTS, executor, signing_context=context
+        )
+    assert [order.signature for order in signed] == want
+
+
+@requires_secp256k1
+def test_secp256k1_ccxt_payload() -> None:
+    instruments = {
+        name: {
+            "instrument_hash": inst.instrument_hash,
+            "base_decimals": inst.base_decimals,
+        }
+        for name, inst in INSTRUMENTS.items()
+    }
+    order = grvt_ccxt_utils.get_grvt_order(
+        sub_account_id="8289849667772468",
+        symbol="BTC_USDT_Perp",
+        order_type="limit",
+        side="sell",
+        amount="0.5",
+        limit_price="64170.7",
+    )
+    want = grvt_ccxt_utils.get_order_payload(
+        copy.deepcopy(order), PRIVATE_KEY, GrvtCcxtEnv.TESTNET, instruments
+    )
+    context = SigningContext.from_key(PRIVATE_KEY, 326, SignerBackend.SECP256K1)
+    got = grvt_ccxt_utils.get_order_payload(
+        copy.deepcopy(order),
+        PRIVATE_KEY,
+        GrvtCcxtEnv.TESTNET,
+        instruments,
+        signing_context=context,
+    )
+    assert got == want
+
+
+def test_signer_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        Signer()  # type: ignore[abstract]
+
+
+def test_secp256k1_without_coincurve_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(grvt_signer, "coincurve", None)
+    assert get_available_signer_backends() == [SignerBackend.ETH_ACCOUNT]
+    with pytest.raises(ImportError, match="coincurve"):
+        get_signer(PRIVATE_KEY, SignerBackend.SECP256K1)
+    with pytest.raises(ValueError):
+        get_signer(PRIVATE_KEY, "libsecp")
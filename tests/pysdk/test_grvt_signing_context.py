@@ -0,0 +1,109 @@
+import copy
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from eth_account import Account
+from eth_account.messages import encode_typed_data
+
+from pysdk import grvt_ccxt_utils
+from pysdk.grvt_ccxt_env import GrvtEnv as GrvtCcxtEnv
+from pysdk.grvt_raw_base import GrvtApiConfig
+from pysdk.grvt_raw_env import CHAIN_IDS, GrvtEnv
+from pysdk.grvt_raw_signing import get_EIP712_domain_data, sign_order, sign_orders_batch
+from pysdk.grvt_signing_context import SigningContext
+
+from .test_grvt_eip712 import INSTRUMENTS, ORDERS
+
+# Setup logger
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+
+
+def test_signing_context_fields() -> None:
+    account = Account.from_key(PRIVATE_KEY)
+    context = SigningContext.from_key(PRIVATE_KEY, CHAIN_IDS[GrvtEnv.TESTNET])
+    assert context.address == account.address
+    assert context.address_lower == account.address.lower()
+    assert context.chain_id == 326
+    assert context.domain == get_EIP712_domain_data(GrvtEnv.TESTNET, 326)
+    assert PRIVATE_KEY not in repr(context)
+
+
+def test_sign_order_with_signing_context() -> None:
+    config = GrvtApiConfig(
+        env=GrvtEnv.TESTNET,
+        private_key=PRIVATE_KEY,
+        trading_account_id="8289849667772468",
+        api_key="not-needed",
+        logger=logger,
+    )
+    account = Account.from_key(PRIVATE_KEY)
+    context = SigningContext.from_key(PRIVATE_KEY, CHAIN_IDS[GrvtEnv.TESTNET])
+    want = []
+    for order in ORDERS:
+        want.append(
+            sign_order(copy.deepcopy(order), config, account, INSTRUMENTS).signature
+        )
+        got = sign_order(copy.deepcopy(order), config, account, INSTRUMENTS, context)
+        assert got.signature == want[-1]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        signed = sign_orders_batch(
+            copy.deepcopy(ORDERS), config, INSTRUMENTS, executor, signing_context=context
+        )
+    assert [order.signature for order in signed] == want
+
+
+def test_ccxt_payloads_with_signing_context() -> None:
+    instruments = {
+        name: {
+            "instrument_hash": inst.instrument_hash,
+            "base_decimals": inst.base_decimals,
+        }
+        for name, inst in INSTRUMENTS.items()
+    }
+    context = SigningContext.from_key(PRIVATE_KEY, 326)
+    order = grvt_ccxt_utils.get_grvt_order(
+        sub_account_id="8289849667772468",
+        symbol="BTC_USDT_Perp",
+        order_type="limit",
+        side="buy",
+        amount="0.5",
+        limit_price="64170.7",
+    )
+    want = grvt_ccxt_utils.get_order_payload(
+        copy.deepcopy(order), PRIVATE_KEY, GrvtCcxtEnv.TESTNET, instruments
+    )
+    got = grvt_ccxt_utils.get_order_payload(
+        copy.deepcopy(order),
+        PRIVATE_KEY,
+        GrvtCcxtEnv.TESTNET,
+        instruments,
+        signing_context=context,
+    )
+    assert got == want
+
+
+def test_derisk_mm_ratio_signature_with_signing_context() -> None:
+    context = SigningContext.from_key(PRIVATE_KEY, 326)
+    signature = grvt_ccxt_utils.sign_derisk_mm_ratio_request(
+        GrvtCcxtEnv.TESTNET, 8289849667772468, "1.5", PRIVATE_KEY, signing_context=context
+    )
+    assert signature["signer"] == context.address_lower
+    message = encode_typed_data(
+        grvt_ccxt_utils.get_EIP712_domain_data(GrvtCcxtEnv.TESTNET),
+        grvt_ccxt_utils.EIP712_DERISK_MM_RATIO_MESSAGE_TYPE,
+        {
+            "subAccountID": 8289849667772468,
+            "deriskToMaintenanceMarginRatio": 1_500_000,
+            "nonce": signature["nonce"],
+            "expiration": int(signature["expiration"]),
+        },
+    )
+    recovered = Account.recover_message(
+        message,
+        vrs=(signature["v"], int(signature["r"], 16), int(signature["s"], 16)),
+    )
+    assert recovered == context.address
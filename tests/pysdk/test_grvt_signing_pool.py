@@ -0,0 +1,96 @@
+import copy
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from eth_account import Account
+
+from pysdk import grvt_ccxt_utils
+from pysdk.grvt_ccxt_env import GrvtEnv as GrvtCcxtEnv
+from pysdk.grvt_raw_base import GrvtApiConfig
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_signing import sign_order, sign_orders_batch
+from pysdk.grvt_signing_pool import create_signing_executor
+
+from .test_grvt_eip712 import INSTRUMENTS, ORDERS
+
+# Setup logger
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+
+
+def get_config() -> GrvtApiConfig:
+    return GrvtApiConfig(
+        env=GrvtEnv.TESTNET,
+        private_key=PRIVATE_KEY,
+        trading_account_id="8289849667772468",
+        api_key="not-needed",
+        logger=logger,
+    )
+
+
+def test_sign_orders_batch_matches_sign_order() -> None:
+    config = get_config()
+    account = Account.from_key(PRIVATE_KEY)
+    orders = copy.deepcopy(ORDERS)
+    orders[1].builder = "0xAbC1230001230001230001230001230001230001"
+    orders[1].builder_fee = "0.001"
+    want = [
+        sign_order(order, config, account, INSTRUMENTS).signature
+        for order in copy.deepcopy(orders)
+    ]
+
+    # Default shared process pool
+    signed = sign_orders_batch(copy.deepcopy(orders), config, INSTRUMENTS)
+    assert [order.signature for order in signed] == want
+
+    # Any executor may be used, results keep the input order
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        signed = sign_orders_batch(copy.deepcopy(orders), config, INSTRUMENTS, executor)
+    assert [order.signature for order in signed] == want
+
+    # A pool created for another key is sent the key of the call
+    other_key = "0x" + "11" * 32
+    with create_signing_executor(other_key, max_workers=2) as executor:
+        signed = sign_orders_batch(copy.deepcopy(orders), config, INSTRUMENTS, executor)
+    assert [order.signature for order in signed] == want
+
+    assert sign_orders_batch([], config, INSTRUMENTS) == []
+
+
+def test_get_order_payloads_batch_matches_get_order_payload() -> None:
+    instruments = {
+        name: {
+            "instrument_hash": inst.instrument_hash,
+            "base_decimals": inst.base_decimals,
+        }
+        for name, inst in INSTRUMENTS.items()
+    }
+    orders = [
+        grvt_ccxt_utils.get_grvt_order(
+            sub_account_id="8289849667772468",
+            symbol=symbol,
+            order_type="limit",
+            side=side,
+            amount=amount,
+            limit_price=price,
+        )
+        for symbol, side, amount, price in [
+            ("BTC_USDT_Perp", "buy", Decimal("0.013"), "64170.7"),
+            ("ETH_USDT_Perp", "sell", "1.5", 3100),
+            ("BTC_USDT_Perp", "sell", 2, "70000.1"),
+        ]
+    ]
+    want = [
+        grvt_ccxt_utils.get_order_payload(
+            order, PRIVATE_KEY, GrvtCcxtEnv.TESTNET, instruments
+        )
+        for order in copy.deepcopy(orders)
+    ]
+    got = grvt_ccxt_utils.get_order_payloads_batch(
+        orders, PRIVATE_KEY, GrvtCcxtEnv.TESTNET, instruments
+    )
+    assert got == want
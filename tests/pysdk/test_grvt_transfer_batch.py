@@ -0,0 +1,176 @@
+import asyncio
+import copy
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from pysdk import grvt_raw_types
+from pysdk.grvt_fixed_types import Transfer, TransferType
+from pysdk.grvt_raw_async import GrvtRawAsync
+from pysdk.grvt_raw_base import GrvtApiConfig, GrvtError
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_signing import (
+    sign_transfer,
+    sign_transfers_batch,
+    sign_withdrawal,
+    sign_withdrawals_batch,
+)
+from pysdk.grvt_raw_types import CurrencyDetail, Signature, Withdrawal
+from pysdk.grvt_signing_context import SigningContext
+
+# Setup logger
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+MAIN_ACCOUNT_ID = "0x0c1f4c8ee7acd9ea19b91bbb343cbaf6efd58ce1"
+EXPIRY = "1730800479321350000"
+CURRENCIES = {
+    "USDT": CurrencyDetail(
+        id=3, symbol="USDT", balance_decimals=6, quantity_multiplier="1"
+    ),
+    "ETH": CurrencyDetail(
+        id=4, symbol="ETH", balance_decimals=9, quantity_multiplier="1"
+    ),
+}
+
+
+def get_config() -> GrvtApiConfig:
+    return GrvtApiConfig(
+        env=GrvtEnv.TESTNET,
+        private_key=PRIVATE_KEY,
+        trading_account_id="8289849667772468",
+        api_key="not-needed",
+        logger=logger,
+    )
+
+
+def make_transfers(count: int) -> list[Transfer]:
+    return [
+        Transfer(
+            from_account_id=MAIN_ACCOUNT_ID,
+            from_sub_account_id="0",
+            to_account_id=MAIN_ACCOUNT_ID,
+            to_sub_account_id=str(8289849667772468 + i),
+            currency="ETH" if i % 3 == 0 else "USDT",
+            num_tokens=f"{i + 1}.123456789",
+            signature=Signature(signer="", r="", s="", v=0, expiration=EXPIRY, nonce=i),
+            transfer_type=TransferType.STANDARD,
+            transfer_metadata="",
+        )
+        for i in range(count)
+    ]
+
+
+def test_transfers_batch_matches_sign_transfer() -> None:
+    config = get_config()
+    context = SigningContext.from_key(PRIVATE_KEY, 1)
+    transfers = make_transfers(12)
+    want = [
+        sign_transfer(
+            copy.deepcopy(transfer),
+            config,
+            context.account,
+            chainId=1,
+            currencyId=CURRENCIES[transfer.currency].id,
+            decimals=CURRENCIES[transfer.currency].balance_decimals,
+        )
+        for transfer in transfers
+    ]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        signed = sign_transfers_batch(
+            transfers, config, CURRENCIES, executor, signing_context=context
+        )
+    assert signed is transfers
+    # Nonce 0 was filled in before signing, the others are kept
+    assert transfers[0].signature.nonce != 0
+    assert [t.signature for t in transfers[1:]] == [t.signature for t in want[1:]]
+
+    # USDT decimals match the single-payload default
+    usdt = transfers[1]
+    assert (
+        usdt.signature
+        == sign_transfer(
+            copy.deepcopy(usdt), config, context.account, chainId=1
+        ).signature
+    )
+
+
+def test_withdrawals_batch_matches_sign_withdrawal() -> None:
+    config = get_config()
+    context = SigningContext.from_key(PRIVATE_KEY, 1)
+    withdrawals = [
+        Withdrawal(
+            from_account_id=MAIN_ACCOUNT_ID,
+            to_eth_address="0xed3FF6F4E84a64556e8F7d149dC3533f0c7D9c49",
+            currency=currency,
+            num_tokens="25.5",
+            signature=Signature(
+                signer="", r="", s="", v=0, expiration=EXPIRY, nonce=7 + i
+            ),
+        )
+        for i, currency in enumerate(["USDT", "ETH"])
+    ]
+    want = [
+        sign_withdrawal(
+            copy.deepcopy(withdrawal),
+            config,
+            context.account,
+            chainId=1,
+            currencyId=CURRENCIES[withdrawal.currency].id,
+            decimals=CURRENCIES[withdrawal.currency].balance_decimals,
+        )
+        for withdrawal in withdrawals
+    ]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sign_withdrawals_batch(
+            withdrawals, config, CURRENCIES, executor, signing_context=context
+        )
+    assert [w.signature for w in withdrawals] == [w.signature for w in want]
+
+
+def test_submit_batch_bounds_concurrency_and_collects_results() -> None:
+    async def run() -> None:
+        api = GrvtRawAsync(get_config())
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def submit(req: int) -> grvt_raw_types.AckResponse | GrvtError:
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0.001 * (req % 4))
+            in_flight -= 1
+            if req == 3:
+                raise TimeoutError("no response")
+            if req == 5:
+                return GrvtError(code=1000, message="rejected", status=400)
+            return grvt_raw_types.AckResponse(grvt_raw_types.Ack(ack=True))
+
+        results = await api.submit_batch(submit, range(20), max_concurrency=4)
+        assert peak_in_flight == 4
+        assert len(results) == 20
+        assert isinstance(results[3], GrvtError) and "no response" in results[3].message
+        assert results[5] == GrvtError(code=1000, message="rejected", status=400)
+        assert all(
+            isinstance(r, grvt_raw_types.AckResponse)
+            for i, r in enumerate(results)
+            if i not in (3, 5)
+        )
+
+        calls = 0
+
+        async def get_currency_v1(
+            req, decode=None
+        ) -> grvt_raw_types.ApiGetCurrencyResponse:
+            nonlocal calls
+            calls += 1
+            return grvt_raw_types.ApiGetCurrencyResponse(list(CURRENCIES.values()))
+
+        api.get_currency_v1 = get_currency_v1  # type: ignore[method-assign]
+        assert await api.get_currency_details() == CURRENCIES
+        assert await api.get_currency_details() == CURRENCIES
+        assert calls == 1
+        await api._session.close()
+
+    asyncio.run(run())
@@ -0,0 +1,78 @@
+import asyncio
+import logging
+import socket
+
+from pysdk.grvt_raw_async import GrvtRawAsync
+from pysdk.grvt_raw_base import GrvtApiConfig
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_sync import GrvtRawSync
+from pysdk.grvt_transport import (
+    TransportConfig,
+    create_aiohttp_session,
+    create_requests_session,
+)
+
+# Setup logger
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+NODELAY = (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+TRANSPORT = TransportConfig(
+    limit=64,
+    limit_per_host=16,
+    keepalive_timeout=120,
+    dns_cache_ttl=600,
+    tcp_nodelay=False,
+    connect_timeout=1.5,
+    read_timeout=3,
+    pool_connections=3,
+    pool_maxsize=32,
+    pool_block=True,
+)
+
+
+def get_config(transport: TransportConfig) -> GrvtApiConfig:
+    return GrvtApiConfig(
+        env=GrvtEnv.TESTNET,
+        trading_account_id="8289849667772468",
+        private_key=None,
+        api_key="not-needed",
+        logger=logger,
+        cookie_refresh_ahead_secs=None,
+        transport=transport,
+    )
+
+
+def test_requests_session_pools() -> None:
+    session = create_requests_session()
+    adapter = session.get_adapter("https://trades.grvt.io")
+    assert NODELAY in adapter.poolmanager.connection_pool_kw["socket_options"]
+
+    api = GrvtRawSync(get_config(TRANSPORT))
+    assert api._timeout == (1.5, 3)
+    assert api._session.headers["Content-Type"] == "application/json"
+    for url in ["https://edge.grvt.io", "https://market-data.grvt.io"]:
+        adapter = api._session.get_adapter(url)
+        assert (adapter._pool_connections, adapter._pool_maxsize) == (3, 32)
+        assert adapter._pool_block
+        assert NODELAY not in adapter.poolmanager.connection_pool_kw["socket_options"]
+    api.close()
+
+
+def test_aiohttp_session_connector() -> None:
+    async def run() -> None:
+        session = create_aiohttp_session(TRANSPORT)
+        connector = session.connector
+        assert connector is not None
+        assert (connector.limit, connector.limit_per_host) == (64, 16)
+        assert (session.timeout.sock_connect, session.timeout.sock_read) == (1.5, 3)
+        assert session.timeout.total is None
+        await session.close()
+
+        api = GrvtRawAsync(get_config(TRANSPORT))
+        assert api._session.connector is not None
+        assert api._session.connector.limit_per_host == 16
+        await api.close()
+
+    asyncio.run(run())
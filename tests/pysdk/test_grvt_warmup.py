@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pysdk.grvt_raw_async import GrvtRawAsync
+from pysdk.grvt_raw_base import GrvtApiConfig
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_transport import TransportConfig, create_requests_session
+from pysdk.grvt_warmup import (
+    AFTER_WARM_UP,
+    BEFORE_WARM_UP,
+    AsyncKeepAlive,
+    LatencyHistogram,
+    LatencyRecorder,
+    warm_up_sync,
+)
+
+# Setup logger
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+def test_latency_histogram() -> None:
+    hist = LatencyHistogram()
+    assert hist.percentile_ms(50) == 0
+    for latency_ms in [0.1, 0.9, 1.5, 3, 3, 3, 3, 3, 3, 100_000]:
+        hist.record(latency_ms / 1000)
+    assert hist.count == 10
+    assert hist.percentile_ms(10) == 0.125
+    assert hist.percentile_ms(50) == 4
+    assert hist.percentile_ms(99) == hist.max_ms == 100_000
+    summary = hist.to_dict()
+    assert summary["buckets"] == {
+        "<=0.125ms": 1,
+        "<=1ms": 1,
+        "<=2ms": 1,
+        "<=4ms": 6,
+        "overflow": 1,
+    }
+
+    recorder = LatencyRecorder()
+    recorder.record(0.01)
+    recorder.mark_warm()
+    recorder.record(0.001)
+    recorder.record(0.001)
+    counts = {name: h["count"] for name, h in recorder.to_dict().items()}
+    assert counts == {BEFORE_WARM_UP: 1, AFTER_WARM_UP: 2}
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.connections += 1  # type: ignore[attr-defined]
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_warm_up_sync_keeps_connections_pooled() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CountingHandler)
+    server.connections = 0  # type: ignore[attr-defined]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/"
+    session = create_requests_session(TransportConfig(pool_maxsize=4))
+    try:
+        assert warm_up_sync(session, [url], 3, (1, 1), logger) == 3
+        assert server.connections == 3  # type: ignore[attr-defined]
+        # Requests from several threads reuse the pooled connections
+        assert warm_up_sync(session, [url], 3, (1, 1), logger) == 3
+        assert server.connections == 3  # type: ignore[attr-defined]
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.parametrize("keep_alive", [False, True])
+def test_raw_async_warm_up(keep_alive: bool) -> None:
+    async def run() -> None:
+        peers: set = set()
+        heads = 0
+
+        async def head(request: web.Request) -> web.Response:
+            nonlocal heads
+            heads += 1
+            peers.add(request.transport.get_extra_info("peername"))
+            # Without a length the client cannot reuse the connection
+            return web.Response(headers={"Content-Length": "0"})
+
+        async def post(request: web.Request) -> web.Response:
+            peers.add(request.transport.get_extra_info("peername"))
+            return web.json_response({"result": []})
+
+        app = web.Application()
+        app.router.add_route("HEAD", "/", head)
+        app.router.add_post("/full/v1/instruments", post)
+        server = TestServer(app)
+        await server.start_server()
+        url = str(server.make_url("/"))
+
+        transport = TransportConfig(
+            warm_up_connections_per_host=2,
+            keep_alive_probe_secs=0.05 if keep_alive else None,
+        )
+        api = GrvtRawAsync(
+            GrvtApiConfig(
+                env=GrvtEnv.TESTNET,
+                trading_account_id="8289849667772468",
+                private_key=None,
+                api_key=None,
+                logger=logger,
+                transport=transport,
+            )
+        )
+        api._get_warm_up_urls = lambda: [url]  # type: ignore[method-assign]
+        await api._post(False, str(server.make_url("/full/v1/instruments")), {})
+        assert await api.warm_up_connections() == 2
+        await api._post(False, str(server.make_url("/full/v1/instruments")), {})
+        # The request after warm-up reused a pooled connection
+        assert len(peers) == 2
+        histograms = api.get_latency_histograms()
+        assert histograms[BEFORE_WARM_UP]["count"] == 1
+        assert histograms[AFTER_WARM_UP]["count"] == 1
+
+        assert isinstance(api._keep_alive, AsyncKeepAlive) == keep_alive
+        await asyncio.sleep(0.2)
+        if keep_alive:
+            assert heads >= 4
+        else:
+            assert heads == 2
+        await api.close()
+        await server.close()
+
+    asyncio.run(run())